@@ -1,5 +1,8 @@
 import pytest
 
+from collections.abc import Callable, Iterator
+from contextlib import AbstractContextManager, contextmanager
+
 from rest_framework.test import APIClient
 from rest_framework_api_key.models import APIKey
 
@@ -9,6 +12,7 @@ from mimesis.locales import Locale
 from apps.dishes.models import Dish
 from apps.orders.models import Order, OrderItem
 from apps.tables.models import Table
+from core.queries import QueryInspector
 
 
 class FixtureFactory:
@@ -24,6 +28,32 @@ def enable_db_access_for_all_tests(db):
     pass
 
 
+@pytest.fixture
+def query_budget() -> Callable[[int], AbstractContextManager[QueryInspector]]:
+    """
+    Проверка бюджета SQL-запросов блока кода.
+
+    Тест падает, если блок выполнил больше `max_queries` запросов или повторяющиеся ленивые загрузки
+    связанных объектов (N+1). Пример использования:
+
+        with query_budget(4):
+            api_client.get(url)
+    """
+
+    @contextmanager
+    def check(max_queries: int) -> Iterator[QueryInspector]:
+        inspector = QueryInspector()
+        with inspector.capture():
+            yield inspector
+        queries = '\n'.join(inspector.queries)
+        assert (
+            inspector.queries_count <= max_queries
+        ), f'Выполнено {inspector.queries_count} SQL-запросов при бюджете {max_queries}:\n{queries}'
+        assert not inspector.n_plus_one, f'Обнаружены N+1 ленивые загрузки: {inspector.n_plus_one}'
+
+    return check
+
+
 @pytest.fixture
 def factory() -> FixtureFactory:
     return FixtureFactory()
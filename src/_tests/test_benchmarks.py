@@ -0,0 +1,64 @@
+import pytest
+
+from datetime import datetime, timezone
+
+from django.core.management import CommandError, call_command
+
+from apps.orders.benchmarks import SCENARIOS, compare_results, run_benchmark
+from apps.orders.models import DishDailySales, Order, OrderItem
+from apps.orders.seeding import DataSeeder, SeedConfig, to_copy_buffer
+
+END = datetime(2025, 3, 1, 12, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def seeder() -> DataSeeder:
+    return DataSeeder(SeedConfig(tables=5, dishes=10, orders=60, batch_size=25, days=10, end=END))
+
+
+class TestDataSeeder:
+    def test_seed_creates_consistent_orders(self, seeder: DataSeeder):
+        assert seeder.seed() == 60
+        assert Order.objects.count() == 60
+        order = Order.objects.order_by('id').last()
+        assert order is not None
+        assert order.created <= END
+        assert order.total_price == sum(item.total_price for item in order.order_items.all())
+        assert Order.objects.create(table=order.table).id == 61
+
+    def test_generation_is_deterministic(self, seeder: DataSeeder):
+        catalog = seeder.seed_catalog()
+        assert seeder.generate_batch(1, 1, catalog) == seeder.generate_batch(1, 1, catalog)
+        assert seeder.generate_batch(1, 1, catalog) != seeder.generate_batch(0, 1, catalog)
+
+    def test_seed_uses_existing_catalog(self, seeder: DataSeeder):
+        seeder.seed()
+        seeder.config.tables = seeder.config.dishes = 0
+        assert seeder.seed() == 60
+        assert Order.objects.count() == 120
+
+    def test_copy_buffer_writes_nulls_unquoted(self):
+        rows = [(1, END, None, 'paid'), (2, END, 'a,b', 'pending')]
+        assert to_copy_buffer(rows).read() == f'1,{END},,paid\n2,{END},"a,b",pending\n'
+
+
+class TestSeedDataCommand:
+    def test_command_seeds_orders_and_rollups(self):
+        call_command('seed_data', tables=3, dishes=5, orders=40, batch_size=15, days=5, end=END, workers=4)
+        assert Order.objects.count() == 40
+        assert DishDailySales.objects.exists()
+
+    def test_copy_requires_postgresql(self):
+        with pytest.raises(CommandError):
+            call_command('seed_data', tables=1, dishes=1, orders=1, method='copy')
+
+
+def test_benchmark_runs_all_scenarios(seeder: DataSeeder):
+    seeder.seed()
+    results = run_benchmark(list(SCENARIOS), requests=3, warmup=1, seed=0)
+    assert set(results['scenarios']) == set(SCENARIOS)
+    assert all(result['errors'] == 0 for result in results['scenarios'].values())
+    assert OrderItem.objects.exists()
+    assert compare_results(results, results, tolerance=0) == []
+    slower = {'meta': {}, 'scenarios': {'order_list': {**results['scenarios']['order_list'], 'queries': 0}}}
+    assert compare_results(results, slower, tolerance=0.2) == ['order_list: queries 5.0 > 0']  # type: ignore[arg-type]
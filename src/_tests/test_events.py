@@ -0,0 +1,115 @@
+import pytest
+
+import asyncio
+import json
+from pathlib import Path
+
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from apps.dishes.models import Dish
+from apps.orders.models import ORDERS_CHANNEL, Order
+from apps.tables.models import Table
+from core.events import EventBroker, broker
+
+
+async def receive(subscriber: EventBroker, publisher: EventBroker, messages: list[tuple[str, dict]]) -> list[dict]:
+    subscription = subscriber.subscribe('orders', heartbeat=0.01)
+    assert await anext(subscription) is None
+    for channel, message in messages:
+        publisher.publish(channel, message)
+    received = []
+    async for data in subscription:
+        if data is None:
+            break
+        received.append(json.loads(data))
+    await subscription.aclose()
+    subscriber.stop()
+    return received
+
+
+class TestEventBroker:
+    def test_in_process(self):
+        local = EventBroker()
+        messages = [('orders', {'id': 1}), ('dishes', {'id': 2}), ('orders', {'id': 3})]
+        assert asyncio.run(receive(local, local, messages)) == [{'id': 1}, {'id': 3}]
+
+    def test_between_processes(self, tmp_path: Path):
+        subscriber, publisher = EventBroker(str(tmp_path)), EventBroker(str(tmp_path))
+        (tmp_path / 'events_stale.sock').touch()
+        assert asyncio.run(receive(subscriber, publisher, [('orders', {'id': 1})])) == [{'id': 1}]
+        assert list(tmp_path.iterdir()) == []
+
+    def test_slow_subscriber_is_disconnected(self):
+        async def overflow() -> list:
+            local = EventBroker(queue_size=2)
+            subscription = local.subscribe('orders')
+            local.publish('orders', {'id': 0})
+            first = await anext(subscription)
+            for index in range(1, 4):
+                local.publish('orders', {'id': index})
+            await asyncio.sleep(0)
+            return [first] + [data async for data in subscription]
+
+        assert asyncio.run(overflow()) == [b'{"id":0}']
+
+
+class TestOrderEvents:
+    @pytest.fixture
+    def published(self, mocker) -> list[dict]:
+        mocker.patch.object(broker, 'has_subscribers', return_value=True)
+        publish = mocker.patch.object(broker, 'publish')
+        messages: list[dict] = []
+        publish.side_effect = lambda channel, message: messages.append(message) if channel == ORDERS_CHANNEL else None
+        return messages
+
+    def test_order_lifecycle(
+        self,
+        api_client: APIClient,
+        auth_param: dict,
+        table: Table,
+        dish: Dish,
+        published: list[dict],
+        django_capture_on_commit_callbacks,
+    ):
+        with django_capture_on_commit_callbacks(execute=True):
+            data = {'table': table.number, 'items': [{'dish': dish.id, 'quantity': 2}]}
+            api_client.post(reverse('api_v1:order-list'), data, headers=auth_param, format='json')
+        order = Order.objects.get()
+        url = reverse('api_v1:order-detail', args=(order.id,))
+        with django_capture_on_commit_callbacks(execute=True):
+            api_client.patch(url, {'status': 'ready'}, headers=auth_param, format='json')
+        with django_capture_on_commit_callbacks(execute=True):
+            api_client.patch(url, {'items': [{'dish': dish.id, 'quantity': 3}]}, headers=auth_param, format='json')
+        with django_capture_on_commit_callbacks(execute=True):
+            api_client.delete(url, headers=auth_param)
+
+        order_data = {'id': order.id, 'table': table.number, 'status': 'pending', 'items': [[dish.name, 2]]}
+        assert published == [
+            {'type': 'created', 'order': {**order_data, 'total_price': str(dish.price * 2)}},
+            {'type': 'status', 'id': order.id, 'status': 'ready'},
+            {
+                'type': 'updated',
+                'order': {
+                    **order_data,
+                    'status': 'ready',
+                    'items': [[dish.name, 3]],
+                    'total_price': str(dish.price * 3),
+                },
+            },
+            {'type': 'deleted', 'id': order.id},
+        ]
+
+    def test_rolled_back_deletion_is_not_published(
+        self, order: Order, published: list[dict], django_capture_on_commit_callbacks
+    ):
+        Order.schedule_event([order.id], 'deleted')  # type: ignore[arg-type]
+        with django_capture_on_commit_callbacks(execute=True):
+            Order.publish_events()
+        assert published == []
+
+
+def test_event_stream_requires_auth(api_client: APIClient):
+    response = api_client.get(reverse('api_v1:order-events'))
+    assert response.status_code == status.HTTP_403_FORBIDDEN
@@ -0,0 +1,43 @@
+import csv
+import json
+
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from apps.orders.models import Order
+
+
+class TestOrderExport:
+    url = reverse('api_v1:order-export')
+
+    def test_not_availability_without_auth(self, api_client: APIClient):
+        response = api_client.get(self.url)
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    def test_export_csv(self, api_client: APIClient, auth_param: dict, order: Order):
+        response = api_client.get(self.url, headers=auth_param)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.streaming
+        rows = list(csv.DictReader(b''.join(response.streaming_content).decode().splitlines()))
+        assert len(rows) == 1
+        assert rows[0]['order_id'] == str(order.id)
+        assert rows[0]['table_number'] == str(order.table.number)
+
+    def test_export_ndjson(self, api_client: APIClient, auth_param: dict, order: Order):
+        response = api_client.get(self.url, {'export_format': 'ndjson'}, headers=auth_param)
+        assert response.status_code == status.HTTP_200_OK
+        lines = b''.join(response.streaming_content).decode().splitlines()
+        data = json.loads(lines[0])
+        assert len(lines) == 1
+        assert data['id'] == order.id
+        assert len(data['items']) == order.order_items.count()
+
+    def test_export_filters_by_date_range(self, api_client: APIClient, auth_param: dict, order: Order):
+        response = api_client.get(self.url, {'created_before': '2000-01-01'}, headers=auth_param)
+        rows = list(csv.DictReader(b''.join(response.streaming_content).decode().splitlines()))
+        assert rows == []
+
+    def test_export_invalid_format(self, api_client: APIClient, auth_param: dict):
+        response = api_client.get(self.url, {'export_format': 'xml'}, headers=auth_param)
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
@@ -0,0 +1,59 @@
+import pytest
+
+from pathlib import Path
+
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from core.metrics import MetricsRegistry
+
+
+@pytest.fixture
+def metrics_dir(tmp_path: Path) -> Path:
+    return tmp_path / 'metrics'
+
+
+class TestMetricsRegistry:
+    def test_histogram_text_format(self):
+        registry = MetricsRegistry()
+        histogram = registry.histogram('latency_seconds', 'Задержка.', ('route',), buckets=(0.1, 1))
+        histogram.observe(0.05, 'order-list')
+        histogram.observe(0.5, 'order-list')
+        histogram.observe(2, 'order-list')
+        lines = registry.render().splitlines()
+        assert lines[:2] == ['# HELP latency_seconds Задержка.', '# TYPE latency_seconds histogram']
+        assert lines[2:] == [
+            'latency_seconds_bucket{route="order-list",le="0.1"} 1',
+            'latency_seconds_bucket{route="order-list",le="1"} 2',
+            'latency_seconds_bucket{route="order-list",le="+Inf"} 3',
+            'latency_seconds_sum{route="order-list"} 2.55',
+            'latency_seconds_count{route="order-list"} 3',
+        ]
+
+    def test_values_are_summed_across_processes(self, metrics_dir: Path):
+        registries = [MetricsRegistry(str(metrics_dir)) for _ in range(2)]
+        for amount, registry in enumerate(registries, start=1):
+            counter = registry.counter('requests_total', 'Запросы.', ('status',))
+            counter.inc('200', amount=amount)
+            registry.flush()
+        assert len(list(metrics_dir.glob('metrics_*.json'))) == 2
+        assert 'requests_total{status="200"} 3' in registries[0].render()
+
+
+class TestMetricsAPIView:
+    url = reverse('api_v1:metrics')
+
+    def test_not_availability_without_auth(self, api_client: APIClient):
+        response = api_client.get(self.url)
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    def test_request_metrics_by_route(self, api_client: APIClient, auth_param: dict):
+        api_client.get(reverse('api_v1:order-list'), headers=auth_param)
+        response = api_client.get(self.url, headers=auth_param)
+        assert response.status_code == status.HTTP_200_OK
+        assert response['Content-Type'].startswith('text/plain')
+        content = response.content.decode()
+        assert 'http_request_duration_seconds_count{route="order-list",method="GET"}' in content
+        assert 'http_request_db_duration_seconds_count{route="order-list",method="GET"}' in content
+        assert 'http_requests_total{route="order-list",method="GET",status="200"}' in content
@@ -0,0 +1,218 @@
+import pytest
+
+from datetime import timedelta
+from decimal import Decimal
+
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from apps.dishes.models import Dish
+from apps.orders.models import (
+    DishDailySales,
+    Order,
+    OrderItem,
+    OrderStatus,
+    RevenueBucket,
+    RevenuePeriod,
+    TableDailySales,
+)
+
+
+class TestOrderItemUnitPrice:
+    def test_unit_price_is_snapshot_of_dish_price(self, order: Order, dish: Dish):
+        dish.refresh_from_db()
+        item = order.order_items.get()
+        assert item.unit_price == dish.price
+        dish.price += Decimal(100)
+        dish.save()
+        item.refresh_from_db()
+        assert item.unit_price != dish.price
+
+    def test_update_total_price_sums_lines(self, order: Order, dish: Dish):
+        dish.refresh_from_db()
+        OrderItem.objects.create(order=order, dish=dish, quantity=3, unit_price=Decimal('10.50'))
+        order.update_total_price()
+        order.refresh_from_db()
+        assert order.total_price == dish.price + Decimal('31.50')
+
+
+class TestOrderTotalPriceRecalculation:
+    @staticmethod
+    def count_order_updates(queries: CaptureQueriesContext) -> int:
+        return sum(query['sql'].startswith('UPDATE "orders_order"') for query in queries.captured_queries)
+
+    def test_total_price_recomputed_once_per_transaction(
+        self, order: Order, dish: Dish, django_capture_on_commit_callbacks
+    ):
+        with CaptureQueriesContext(connection) as queries:
+            with django_capture_on_commit_callbacks(execute=True):
+                for quantity in range(1, 4):
+                    OrderItem.objects.create(order=order, dish=dish, quantity=quantity, unit_price=Decimal(1))
+                OrderItem.objects.bulk_create(
+                    [OrderItem(order=order, dish=dish, quantity=4, unit_price=Decimal(1))],
+                )
+        order.refresh_from_db()
+        assert self.count_order_updates(queries) == 1
+        assert order.total_price == sum(item.total_price for item in order.order_items.all())
+
+    def test_total_price_recomputed_after_queryset_delete_and_update(
+        self, order: Order, dish: Dish, django_capture_on_commit_callbacks
+    ):
+        with django_capture_on_commit_callbacks(execute=True):
+            OrderItem.objects.create(order=order, dish=dish, quantity=2, unit_price=Decimal(5))
+        with django_capture_on_commit_callbacks(execute=True):
+            OrderItem.objects.filter(order=order).update(unit_price=Decimal(2))
+        order.refresh_from_db()
+        assert order.total_price == Decimal(2) * 3
+        with django_capture_on_commit_callbacks(execute=True):
+            OrderItem.objects.filter(order=order).delete()
+        order.refresh_from_db()
+        assert order.total_price == Decimal(0)
+
+
+class TestRevenueLedger:
+    @staticmethod
+    def get_revenue(period: str) -> Decimal:
+        return sum((bucket.revenue for bucket in RevenueBucket.objects.filter(period=period)), Decimal(0))
+
+    @pytest.fixture
+    def priced_order(self, order: Order) -> Order:
+        order.update_total_price()
+        return order
+
+    def test_paid_order_is_recorded(self, priced_order: Order):
+        priced_order.status = OrderStatus.PAID
+        priced_order.save()
+        assert priced_order.paid_at is not None
+        for period in RevenuePeriod.values:
+            assert self.get_revenue(period) == priced_order.total_price
+        assert RevenueBucket.objects.get(period=RevenuePeriod.SHIFT).orders_count == 1
+
+    def test_unpaid_order_is_removed(self, priced_order: Order):
+        priced_order.status = OrderStatus.PAID
+        priced_order.save()
+        priced_order.status = OrderStatus.READY
+        priced_order.save(update_fields=['status'])
+        assert priced_order.paid_at is None
+        assert self.get_revenue(RevenuePeriod.SHIFT) == 0
+        assert RevenueBucket.objects.get(period=RevenuePeriod.SHIFT).orders_count == 0
+
+    def test_later_saves_do_not_move_revenue(self, priced_order: Order):
+        priced_order.status = OrderStatus.PAID
+        priced_order.save()
+        paid_at = priced_order.paid_at
+        priced_order.save()
+        priced_order.update_total_price()
+        priced_order.refresh_from_db()
+        assert priced_order.paid_at == paid_at
+        assert self.get_revenue(RevenuePeriod.HOUR) == priced_order.total_price
+
+    def test_total_price_change_of_paid_order(self, priced_order: Order, dish: Dish):
+        priced_order.status = OrderStatus.PAID
+        priced_order.save()
+        OrderItem.objects.create(order=priced_order, dish=dish, quantity=2, unit_price=Decimal(10))
+        priced_order.update_total_price()
+        assert self.get_revenue(RevenuePeriod.SHIFT) == priced_order.total_price
+
+    def test_deleted_paid_order(self, priced_order: Order):
+        priced_order.status = OrderStatus.PAID
+        priced_order.save()
+        priced_order.delete()
+        assert self.get_revenue(RevenuePeriod.SHIFT) == 0
+
+
+class TestShiftRevenueAPIView:
+    url = reverse('api_v1:shift-revenue')
+
+    def test_revenue_for_range(self, api_client: APIClient, auth_param: dict, order: Order):
+        order.update_total_price()
+        order.status = OrderStatus.PAID
+        order.save()
+        paid_at = timezone.now()
+        params = {
+            'start': (paid_at - timedelta(days=1)).isoformat(),
+            'end': (paid_at + timedelta(hours=1)).isoformat(),
+        }
+        response = api_client.get(self.url, params, headers=auth_param)
+        assert response.status_code == status.HTTP_200_OK
+        assert Decimal(response.data['total_revenue']) == order.total_price
+        assert response.data['orders_count'] == 1
+
+    def test_revenue_for_past_shift(self, api_client: APIClient, auth_param: dict):
+        response = api_client.get(self.url, {'day': '2025-01-01'}, headers=auth_param)
+        assert response.status_code == status.HTTP_200_OK
+        assert Decimal(response.data['total_revenue']) == 0
+
+    def test_invalid_range(self, api_client: APIClient, auth_param: dict):
+        response = api_client.get(self.url, {'start': '2025-01-02T00:00:00Z'}, headers=auth_param)
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.fixture
+def paid_order(order: Order) -> Order:
+    order.update_total_price()
+    order.status = OrderStatus.PAID
+    order.save()
+    return order
+
+
+class TestDailySales:
+    def test_paid_order_is_recorded(self, paid_order: Order):
+        item = paid_order.order_items.get()
+        dish_sales = DishDailySales.objects.get()
+        assert dish_sales.day == timezone.localdate(paid_order.paid_at)
+        assert (dish_sales.dish_id, dish_sales.quantity, dish_sales.orders_count) == (item.dish_id, item.quantity, 1)
+        assert dish_sales.revenue == paid_order.total_price
+        table_sales = TableDailySales.objects.get()
+        assert (table_sales.table_id, table_sales.revenue) == (paid_order.table_id, paid_order.total_price)
+
+    def test_unpaid_and_deleted_orders_are_removed(self, paid_order: Order):
+        paid_order.status = OrderStatus.READY
+        paid_order.save()
+        assert DishDailySales.objects.get().quantity == 0
+        paid_order.status = OrderStatus.PAID
+        paid_order.save()
+        paid_order.delete()
+        assert DishDailySales.objects.get().orders_count == 0
+        assert TableDailySales.objects.get().revenue == 0
+
+    def test_items_change_of_paid_order(self, paid_order: Order, dish: Dish):
+        OrderItem.objects.create(order=paid_order, dish=dish, quantity=2, unit_price=Decimal(10))
+        paid_order.update_total_price()
+        assert DishDailySales.objects.get(dish=dish).revenue == paid_order.total_price
+        assert TableDailySales.objects.get().revenue == paid_order.total_price
+
+    def test_rebuild_command_restores_rollups(self, paid_order: Order):
+        expected = list(DishDailySales.objects.values('day', 'dish', 'quantity', 'revenue', 'orders_count'))
+        DishDailySales.objects.all().delete()
+        TableDailySales.objects.all().delete()
+        RevenueBucket.objects.all().delete()
+        call_command('rebuild_sales_rollups', date_to=timezone.localdate(paid_order.paid_at))
+        assert list(DishDailySales.objects.values('day', 'dish', 'quantity', 'revenue', 'orders_count')) == expected
+        assert TableDailySales.objects.get().revenue == paid_order.total_price
+        assert RevenueBucket.objects.get(period=RevenuePeriod.HOUR).revenue == paid_order.total_price
+
+
+class TestSalesAnalyticsAPIView:
+    def test_dish_sales(self, api_client: APIClient, auth_param: dict, paid_order: Order):
+        response = api_client.get(reverse('api_v1:analytics-dishes'), {'by_day': True}, headers=auth_param)
+        assert response.status_code == status.HTTP_200_OK
+        row = response.data['results'][0]
+        assert row['day'] == timezone.localdate(paid_order.paid_at).isoformat()
+        assert Decimal(row['revenue']) == paid_order.total_price
+
+    def test_table_sales(self, api_client: APIClient, auth_param: dict, paid_order: Order):
+        response = api_client.get(reverse('api_v1:analytics-tables'), headers=auth_param)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['results'][0]['table'] == paid_order.table.number
+        assert 'day' not in response.data['results'][0]
+
+    def test_invalid_range(self, api_client: APIClient, auth_param: dict):
+        params = {'date_from': '2024-02-01', 'date_to': '2024-01-01'}
+        response = api_client.get(reverse('api_v1:analytics-tables'), params, headers=auth_param)
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
@@ -0,0 +1,45 @@
+import pytest
+
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from apps.orders.models import Order
+from apps.tables.models import Table
+
+
+@pytest.fixture
+def orders(table: Table) -> list[Order]:
+    return [Order.objects.create(table=table) for _ in range(5)]
+
+
+class TestOrderCursorPagination:
+    url = reverse('api_v1:order-list')
+
+    def test_pages_cover_all_orders_in_order(self, api_client: APIClient, auth_param: dict, orders: list[Order]):
+        ids: list[int] = []
+        url = f'{self.url}?page_size=2'
+        while url:
+            response = api_client.get(url, headers=auth_param)
+            assert response.status_code == status.HTTP_200_OK
+            assert len(response.data['results']) <= 2
+            ids.extend(order['id'] for order in response.data['results'])
+            url = response.data['next']
+        assert ids == list(Order.objects.order_by('-created', 'id').values_list('id', flat=True))
+
+    def test_previous_link_returns_previous_page(self, api_client: APIClient, auth_param: dict, orders: list[Order]):
+        first_page = api_client.get(f'{self.url}?page_size=2', headers=auth_param).data
+        assert first_page['previous'] is None
+        second_page = api_client.get(first_page['next'], headers=auth_param).data
+        previous_page = api_client.get(second_page['previous'], headers=auth_param).data
+        assert previous_page['results'] == first_page['results']
+
+    def test_count_is_opt_in(self, api_client: APIClient, auth_param: dict, orders: list[Order]):
+        response = api_client.get(self.url, headers=auth_param)
+        assert 'count' not in response.data
+        response = api_client.get(f'{self.url}?with_count=true', headers=auth_param)
+        assert response.data['count'] == len(orders)
+
+    def test_invalid_cursor(self, api_client: APIClient, auth_param: dict):
+        response = api_client.get(f'{self.url}?cursor=invalid', headers=auth_param)
+        assert response.status_code == status.HTTP_404_NOT_FOUND
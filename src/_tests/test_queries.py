@@ -0,0 +1,46 @@
+import pytest
+
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from apps.orders.models import Order
+from apps.tables.models import Table
+from core.queries import QueryInspector, get_query_shape
+
+
+def test_query_shape_ignores_in_list_length():
+    assert get_query_shape('SELECT 1 WHERE id IN (%s, %s, %s)') == get_query_shape('SELECT 1 WHERE id IN (%s)')
+
+
+class TestQueryInspector:
+    def test_lazy_loads_are_detected_with_call_site(self, table: Table):
+        for _ in range(3):
+            Order.objects.create(table=table)
+        with QueryInspector().capture() as inspector:
+            [str(order) for order in Order.objects.all()]
+        [lazy_load] = inspector.n_plus_one.values()
+        assert lazy_load.count == 3
+        assert lazy_load.call_site is not None
+        assert lazy_load.call_site.startswith('apps/orders/models.py')
+
+    def test_select_related_is_not_reported(self, table: Table):
+        for _ in range(3):
+            Order.objects.create(table=table)
+        with QueryInspector().capture() as inspector:
+            [str(order) for order in Order.objects.select_related('table')]
+        assert inspector.queries_count == 1
+        assert inspector.n_plus_one == {}
+
+
+class TestQueryInspectorMiddleware:
+    def test_server_timing_header(self, api_client: APIClient, auth_param: dict):
+        response = api_client.get(reverse('api_v1:order-list'), headers=auth_param)
+        db_timing, app_timing = response['Server-Timing'].split(', ')
+        assert db_timing.startswith('db;desc="3 queries";dur=')
+        assert app_timing.startswith('app;dur=')
+
+    @override_settings(QUERY_BUDGET_PER_REQUEST=1)
+    def test_budget_overrun_is_logged(self, api_client: APIClient, auth_param: dict, caplog: pytest.LogCaptureFixture):
+        api_client.get(reverse('api_v1:order-list'), headers=auth_param)
+        assert 'при бюджете 1' in caplog.text
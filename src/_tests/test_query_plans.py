@@ -0,0 +1,90 @@
+import pytest
+
+import re
+from datetime import timedelta
+
+from django.db import connection, transaction
+from django.db.models import QuerySet
+from django.utils import timezone
+
+from apps.orders.api.paginations import OrderCursorPagination
+from apps.orders.api.views import OrderViewSet
+from apps.orders.filters import OrderExportFilterSet, OrderFilterSet
+from apps.orders.models import Order
+from apps.orders.services.total_revenue_getter import ShiftRevenueGetter
+from apps.tables.models import Table
+
+SEQUENTIAL_SCAN_PATTERNS = {
+    'postgresql': re.compile(r'Seq Scan on (\w+)'),
+    'sqlite': re.compile(r'\bSCAN (\w+)(?! USING)(?:$| )', re.MULTILINE),
+}
+
+
+def get_sequential_scans(queryset: QuerySet) -> list[str]:
+    """
+    Возвращает таблицы, которые план запроса читает последовательным сканированием.
+
+    На PostgreSQL последовательное сканирование отключается (`enable_seqscan = off`), поэтому оно
+    остается в плане, только если для запроса нет подходящего индекса, а не потому, что в тестовой
+    базе мало строк.
+    """
+    pattern = SEQUENTIAL_SCAN_PATTERNS.get(connection.vendor)
+    if pattern is None:
+        pytest.skip(f'Разбор плана запроса для {connection.vendor} не поддерживается')
+    with transaction.atomic():
+        if connection.vendor == 'postgresql':
+            with connection.cursor() as cursor:
+                cursor.execute('SET LOCAL enable_seqscan = off')
+        plan = queryset.explain()
+    return pattern.findall(plan)
+
+
+def get_page_queryset(queryset: QuerySet[Order], table: Table) -> QuerySet:
+    """Запрос страницы keyset-пагинации списка заказов после первой страницы."""
+    pagination = OrderCursorPagination()
+    order = Order.objects.create(table=table)
+    position = pagination._get_position_from_instance(order)
+    position_filter = pagination.get_position_filter(queryset, position, reverse=False)
+    return queryset.order_by(*pagination.ordering).filter(position_filter)[: OrderCursorPagination.page_size + 1]
+
+
+class TestOrderQueryPlans:
+    def test_sequential_scan_is_detected(self):
+        assert get_sequential_scans(Order.objects.order_by().filter(total_price=1)) == ['orders_order']
+
+    def test_order_list_page(self, table: Table):
+        queryset = OrderViewSet.queryset.all()
+        assert get_sequential_scans(queryset.order_by(*OrderCursorPagination.ordering)[:51]) == []
+        assert get_sequential_scans(get_page_queryset(queryset, table)) == []
+
+    @pytest.mark.parametrize(
+        'params',
+        [
+            {'status': 'PAID'},
+            {'table': '1'},
+            {'status': 'ready', 'table': '1'},
+        ],
+    )
+    def test_order_filters(self, table: Table, params: dict):
+        queryset = OrderFilterSet(params, queryset=OrderViewSet.queryset.all()).qs
+        assert get_sequential_scans(get_page_queryset(queryset, table)) == []
+
+    def test_order_export_date_range(self):
+        params = {'created_after': '2025-01-01', 'created_before': '2025-01-31'}
+        assert get_sequential_scans(OrderExportFilterSet(params, queryset=Order.objects.all()).qs) == []
+
+    def test_paid_orders_by_payment_time(self):
+        now = timezone.now()
+        queryset = Order.objects.filter(status='paid', paid_at__gte=now - timedelta(days=1), paid_at__lt=now)
+        assert get_sequential_scans(queryset) == []
+
+
+class TestShiftRevenueQueryPlans:
+    def test_shift_revenue(self):
+        getter = ShiftRevenueGetter()
+        assert get_sequential_scans(getter.get_shift_queryset(timezone.now())) == []
+
+    def test_range_revenue(self):
+        now = timezone.now()
+        getter = ShiftRevenueGetter()
+        assert get_sequential_scans(getter.get_range_queryset(now - timedelta(days=1), now)) == []
@@ -0,0 +1,161 @@
+import pytest
+
+from decimal import Decimal
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from apps.dishes.caches import dish_cache
+from apps.dishes.models import Dish
+from apps.orders.api.serializers import OrderPatchSerializer, OrderPostSerializer
+from apps.orders.models import Order, OrderItem
+from apps.orders.services.order_updater import OrderUpdater
+from apps.tables.caches import table_cache
+
+
+@pytest.fixture
+def dishes(dish_data: list[dict]) -> list[Dish]:
+    return [Dish.objects.create(**data) for data in dish_data[1:5]]
+
+
+@pytest.fixture
+def big_order(order: Order, dishes: list[Dish]) -> Order:
+    OrderItem.objects.bulk_create(
+        [OrderItem(order=order, dish=dish, quantity=1, unit_price=Decimal(10)) for dish in dishes],
+    )
+    return order
+
+
+def update_items(order: Order, items: list[dict], **kwargs) -> Order:
+    serializer = OrderPatchSerializer(instance=order, data={'items': items}, partial=True)
+    serializer.is_valid(raise_exception=True)
+    return OrderUpdater(serializer, **kwargs)()
+
+
+class TestOrderUpdaterDiffItems:
+    def get_items(self, order: Order) -> list[dict]:
+        return [{'dish': item.dish_id, 'quantity': item.quantity} for item in order.order_items.all()]
+
+    def test_unchanged_lines_keep_ids(self, big_order: Order, django_capture_on_commit_callbacks):
+        items = self.get_items(big_order)
+        items[0]['quantity'] = 5
+        ids_before = set(big_order.order_items.values_list('id', flat=True))
+        with django_capture_on_commit_callbacks(execute=True):
+            update_items(big_order, items)
+        assert set(big_order.order_items.values_list('id', flat=True)) == ids_before
+        assert big_order.order_items.get(dish_id=items[0]['dish']).quantity == 5
+        big_order.refresh_from_db()
+        assert big_order.total_price == sum(item.total_price for item in big_order.order_items.all())
+
+    def test_added_and_removed_lines(self, big_order: Order, dish_data: list[dict]):
+        items = self.get_items(big_order)
+        removed = items.pop()
+        new_dish = Dish.objects.create(**dish_data[5])
+        items.append({'dish': new_dish.id, 'quantity': 2})
+        update_items(big_order, items)
+        dish_ids = set(big_order.order_items.values_list('dish_id', flat=True))
+        assert removed['dish'] not in dish_ids
+        assert new_dish.id in dish_ids
+        assert len(dish_ids) == len(items)
+
+    def test_query_count_does_not_depend_on_order_size(self, big_order: Order):
+        items = self.get_items(big_order)
+        items[0]['quantity'] = 7
+        serializer = OrderPatchSerializer(instance=big_order, data={'items': items}, partial=True)
+        serializer.is_valid(raise_exception=True)
+        with CaptureQueriesContext(connection) as queries:
+            OrderUpdater(serializer)()
+        writes = [query['sql'] for query in queries.captured_queries if query['sql'].startswith(('INSERT', 'DELETE'))]
+        assert writes == []
+        assert sum(query['sql'].startswith('UPDATE "orders_orderitem"') for query in queries.captured_queries) == 1
+
+    def test_replace_mode(self, big_order: Order):
+        items = self.get_items(big_order)
+        ids_before = set(big_order.order_items.values_list('id', flat=True))
+        update_items(big_order, items, diff_items=False)
+        assert set(big_order.order_items.values_list('id', flat=True)).isdisjoint(ids_before)
+
+
+class TestOrderWriteSerializerBatching:
+    def get_data(self, order: Order, dishes: list[Dish]) -> dict:
+        return {'table': order.table.number, 'items': [{'dish': dish.id, 'quantity': 2} for dish in dishes]}
+
+    def test_dishes_resolved_in_one_query(self, order: Order, dishes: list[Dish], django_assert_num_queries):
+        serializer = OrderPostSerializer(data=self.get_data(order, dishes))
+        with django_assert_num_queries(2):
+            assert serializer.is_valid(), serializer.errors
+        assert [item['dish'] for item in serializer.validated_data['items']] == dishes
+
+    def test_unknown_dish(self, order: Order, dishes: list[Dish]):
+        data = self.get_data(order, dishes)
+        data['items'][1]['dish'] = max(dish.id for dish in dishes) + 100
+        serializer = OrderPostSerializer(data=data)
+        assert not serializer.is_valid()
+        assert serializer.errors['items'][0] == {}
+        assert 'dish' in serializer.errors['items'][1]
+
+    def test_unknown_table(self, order: Order, dishes: list[Dish]):
+        data = self.get_data(order, dishes)
+        data['table'] = order.table.number + 1000
+        serializer = OrderPostSerializer(data=data)
+        assert not serializer.is_valid()
+        assert 'table' in serializer.errors
+
+    def test_catalog_cache(self, order: Order, dishes: list[Dish], settings, django_assert_num_queries):
+        settings.CATALOG_CACHE_TIMEOUT = 60
+        dish_cache.invalidate()
+        table_cache.invalidate()
+        assert OrderPostSerializer(data=self.get_data(order, dishes)).is_valid()
+        with django_assert_num_queries(0):
+            assert OrderPostSerializer(data=self.get_data(order, dishes)).is_valid()
+        dishes[0].save()
+        with django_assert_num_queries(1):
+            assert OrderPostSerializer(data=self.get_data(order, dishes)).is_valid()
+        dish_cache.invalidate()
+        table_cache.invalidate()
+
+
+class TestOrderBulkCreate:
+    url = reverse('api_v1:order-bulk')
+
+    def get_order_data(self, order: Order, dishes: list[Dish]) -> dict:
+        return {'table': order.table.number, 'items': [{'dish': dish.id, 'quantity': 2} for dish in dishes]}
+
+    def test_all_orders_created(self, api_client: APIClient, auth_param: dict, order: Order, dishes: list[Dish]):
+        data = {'orders': [self.get_order_data(order, dishes)] * 5, 'batch_size': 2}
+        response = api_client.post(self.url, data=data, headers=auth_param, format='json')
+        assert response.status_code == status.HTTP_201_CREATED
+        assert Order.objects.count() == 6
+        created = Order.objects.get(pk=response.data['results'][0]['id'])
+        assert created.order_items.count() == len(dishes)
+        assert created.total_price == sum(dish.price * 2 for dish in Dish.objects.filter(pk__in=[d.pk for d in dishes]))
+
+    def test_atomic_mode_creates_nothing_on_error(
+        self, api_client: APIClient, auth_param: dict, order: Order, dishes: list[Dish]
+    ):
+        invalid = {'table': order.table.number, 'items': [{'dish': 0}]}
+        data = {'orders': [self.get_order_data(order, dishes), invalid]}
+        response = api_client.post(self.url, data=data, headers=auth_param, format='json')
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data['results'][0]['index'] == 1
+        assert Order.objects.count() == 1
+
+    def test_best_effort_mode(self, api_client: APIClient, auth_param: dict, order: Order, dishes: list[Dish]):
+        invalid = {'table': order.table.number + 1000, 'items': [{'dish': dishes[0].id}]}
+        data = {'orders': [invalid, self.get_order_data(order, dishes)], 'mode': 'best_effort'}
+        response = api_client.post(self.url, data=data, headers=auth_param, format='json')
+        assert response.status_code == status.HTTP_207_MULTI_STATUS
+        assert [result['status'] for result in response.data['results']] == ['error', 'created']
+        assert Order.objects.count() == 2
+
+    def test_query_count_does_not_depend_on_orders_count(
+        self, api_client: APIClient, auth_param: dict, order: Order, dishes: list[Dish]
+    ):
+        data = {'orders': [self.get_order_data(order, dishes)] * 20}
+        with CaptureQueriesContext(connection) as queries:
+            response = api_client.post(self.url, data=data, headers=auth_param, format='json')
+        assert response.status_code == status.HTTP_201_CREATED
+        assert sum(query['sql'].startswith('INSERT') for query in queries.captured_queries) == 2
@@ -1,13 +1,18 @@
 import pytest
 
+from collections.abc import Callable
+
 from django.contrib.auth.models import AbstractBaseUser
 from django.test import Client
 from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APIClient
 
+from apps.dishes.caches import dish_response_cache
 from apps.dishes.models import Dish
-from apps.orders.models import Order
+from apps.orders.models import Order, OrderItem
+from apps.tables.caches import table_response_cache
+from apps.tables.models import Table
 
 
 @pytest.mark.parametrize(
@@ -161,3 +166,119 @@ class TestAvailabilityView:
     def test_availability_viewset_with_auth(self, admin_client: Client):
         response = admin_client.get(reverse('orders:list'))
         assert response.status_code == status.HTTP_200_OK
+
+
+class TestOrderViewSetQueryBudget:
+    """Бюджеты SQL-запросов основных операций со списком заказов; количество запросов не зависит от числа строк."""
+
+    @pytest.fixture(autouse=True)
+    def dishes(self, dish_data: list[dict]) -> list[Dish]:
+        return [
+            Dish.objects.create(name=f'{data["name"]} {index}', price=data['price'])
+            for index, data in enumerate(dish_data)
+        ]
+
+    def test_list(self, api_client: APIClient, auth_param: dict, table: Table, query_budget: Callable):
+        for dish in Dish.objects.all()[:5]:
+            order = Order.objects.create(table=table)
+            OrderItem.objects.create(order=order, dish=dish, quantity=2)
+        with query_budget(5):
+            response = api_client.get(reverse('api_v1:order-list'), headers=auth_param)
+        assert len(response.data['results']) == 5
+
+    def test_create(self, api_client: APIClient, auth_param: dict, table: Table, query_budget: Callable):
+        items = [{'dish': dish.id, 'quantity': 2} for dish in Dish.objects.all()[:5]]
+        with query_budget(9):
+            response = api_client.post(
+                reverse('api_v1:order-list'), {'table': table.number, 'items': items}, headers=auth_param, format='json'
+            )
+        assert response.status_code == status.HTTP_201_CREATED
+
+    def test_patch(self, api_client: APIClient, auth_param: dict, order: Order, query_budget: Callable):
+        items = [{'dish': dish.id, 'quantity': 3} for dish in Dish.objects.all()[:5]]
+        with query_budget(18):
+            response = api_client.patch(
+                reverse('api_v1:order-detail', args=(order.id,)),
+                {'status': 'ready', 'items': items},
+                headers=auth_param,
+                format='json',
+            )
+        assert response.status_code == status.HTTP_200_OK
+
+
+class TestCatalogResponseCache:
+    @pytest.fixture(autouse=True)
+    def enable_cache(self, settings):
+        settings.CATALOG_CACHE_TIMEOUT = 60
+        dish_response_cache.bump_version()
+        table_response_cache.bump_version()
+        yield
+        dish_response_cache.bump_version()
+        table_response_cache.bump_version()
+
+    def test_list_is_cached_until_dish_changes(
+        self,
+        api_client: APIClient,
+        auth_param: dict,
+        dish: Dish,
+        django_assert_num_queries,
+        django_capture_on_commit_callbacks,
+    ):
+        url = reverse('api_v1:dish-list')
+        response = api_client.get(url, headers=auth_param)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == [{'id': dish.id, 'name': dish.name, 'price': str(dish.price)}]
+        with django_assert_num_queries(1):
+            cached = api_client.get(url, headers=auth_param)
+        assert cached.content == response.content
+        assert cached['ETag'] == response['ETag']
+
+        with django_capture_on_commit_callbacks(execute=True):
+            dish.name = 'Новое название'
+            dish.save()
+        response = api_client.get(url, headers=auth_param)
+        assert response.json()[0]['name'] == 'Новое название'
+        assert response['ETag'] != cached['ETag']
+
+    def test_not_modified(self, api_client: APIClient, auth_param: dict, table: Table):
+        url = reverse('api_v1:table-detail', args=(table.id,))
+        etag = api_client.get(url, headers=auth_param)['ETag']
+        response = api_client.get(url, headers={**auth_param, 'If-None-Match': etag})
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response['ETag'] == etag
+        assert not response.content
+        missing = api_client.get(reverse('api_v1:table-detail', args=(table.id + 1,)), headers=auth_param)
+        assert missing.status_code == status.HTTP_404_NOT_FOUND
+
+
+class TestOrderConditionalGet:
+    def test_list_not_modified(self, api_client: APIClient, auth_param: dict, order: Order, query_budget: Callable):
+        url = reverse('api_v1:order-list')
+        response = api_client.get(url, {'status': order.status}, headers=auth_param)
+        etag = response['ETag']
+        with query_budget(2):
+            not_modified = api_client.get(url, {'status': order.status}, headers={**auth_param, 'If-None-Match': etag})
+        assert not_modified.status_code == status.HTTP_304_NOT_MODIFIED
+        assert not_modified['ETag'] == etag
+
+        other_filter = api_client.get(url, {'table': order.table.number}, headers={**auth_param, 'If-None-Match': etag})
+        assert other_filter.status_code == status.HTTP_200_OK
+
+        order.status = 'ready'
+        order.save()
+        changed = api_client.get(url, headers={**auth_param, 'If-None-Match': etag})
+        assert changed.status_code == status.HTTP_200_OK
+        assert changed['ETag'] != etag
+
+    def test_detail_not_modified(self, api_client: APIClient, auth_param: dict, order: Order):
+        url = reverse('api_v1:order-detail', args=(order.id,))
+        response = api_client.get(url, headers=auth_param)
+        headers = {**auth_param, 'If-Modified-Since': response['Last-Modified']}
+        assert api_client.get(url, headers=headers).status_code == status.HTTP_304_NOT_MODIFIED
+
+        Order.objects.create(table=order.table).delete()
+        assert api_client.get(url, headers={**auth_param, 'If-None-Match': response['ETag']}).status_code == 304
+        order.delete()
+        assert api_client.get(url, headers={**auth_param, 'If-None-Match': response['ETag']}).status_code == 404
+        missing = api_client.get(reverse('api_v1:order-detail', args=('abc',)), headers=auth_param)
+        assert missing.status_code == status.HTTP_404_NOT_FOUND
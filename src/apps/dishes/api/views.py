@@ -1,14 +1,16 @@
 from rest_framework.permissions import IsAuthenticated
-from rest_framework.viewsets import ReadOnlyModelViewSet
 from rest_framework_api_key.permissions import HasAPIKey
 
 from apps.dishes.api.serializers import DishSerializer
+from apps.dishes.caches import dish_response_cache
 from apps.dishes.models import Dish
+from core.views import RenderedCacheViewSet
 
 
-class DishViewSet(ReadOnlyModelViewSet):
+class DishViewSet(RenderedCacheViewSet):
     """ViewSet для чтения блюд."""
 
     queryset = Dish.objects.all()
     serializer_class = DishSerializer
     permission_classes = [IsAuthenticated | HasAPIKey]
+    rendered_cache = dish_response_cache
@@ -5,3 +5,9 @@ class DishesConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.dishes'
     verbose_name = 'Блюда'
+
+    def ready(self) -> None:
+        from apps.dishes import signals
+
+        signals
+        return super().ready()
@@ -0,0 +1,5 @@
+from apps.dishes.models import Dish
+from core.caches import ModelCache, RenderedCache
+
+dish_cache = ModelCache(Dish)
+dish_response_cache = RenderedCache('dishes')
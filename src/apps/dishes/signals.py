@@ -0,0 +1,13 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.dishes.caches import dish_cache, dish_response_cache
+from apps.dishes.models import Dish
+
+
+@receiver([post_save, post_delete], sender=Dish)
+def invalidate_dish_cache(sender: Dish, instance: Dish, **kwargs):
+    """Сбрасываем кеш блюд и после фиксации транзакции меняем версию кеша ответов."""
+    dish_cache.invalidate()
+    transaction.on_commit(dish_response_cache.bump_version)
@@ -1,8 +1,9 @@
 from decimal import Decimal
 
 from django.contrib import admin
+from django.http import HttpRequest
 
-from apps.orders.models import Order, OrderItem
+from apps.orders.models import DishDailySales, Order, OrderItem, RevenueBucket, TableDailySales
 
 
 class OrderItemInline(admin.TabularInline):
@@ -10,7 +11,8 @@ class OrderItemInline(admin.TabularInline):
 
     model = OrderItem
     extra = 1
-    fields = ('dish', 'quantity')
+    fields = ('dish', 'quantity', 'unit_price')
+    readonly_fields = ('unit_price',)
 
 
 @admin.register(Order)
@@ -24,6 +26,7 @@ class OrderAdmin(admin.ModelAdmin):
         'total_price',
         'created',
         'updated',
+        'paid_at',
     )
     list_filter = (
         'status',
@@ -37,6 +40,7 @@ class OrderAdmin(admin.ModelAdmin):
         'total_price',
         'created',
         'updated',
+        'paid_at',
     )
     inlines = [OrderItemInline]
 
@@ -49,8 +53,13 @@ class OrderItemAdmin(admin.ModelAdmin):
         'order',
         'dish',
         'quantity',
+        'unit_price',
         'get_total_price',
     )
+    list_select_related = (
+        'order__table',
+        'dish',
+    )
     search_fields = (
         'order__id',
         'dish__name',
@@ -60,10 +69,12 @@ class OrderItemAdmin(admin.ModelAdmin):
         'order',
         'dish',
         'quantity',
+        'unit_price',
         'get_total_price',
     )
     readonly_fields = (
         'id',
+        'unit_price',
         'get_total_price',
         'created',
         'updated',
@@ -74,3 +85,64 @@ class OrderItemAdmin(admin.ModelAdmin):
         return obj.total_price
 
     get_total_price.short_description = 'Общая стоимость'  # type: ignore[attr-defined]
+
+
+@admin.register(RevenueBucket)
+class RevenueBucketAdmin(admin.ModelAdmin):
+    """Админская модель для журнала выручки. Журнал ведется автоматически и доступен только для чтения."""
+
+    list_display = (
+        'period',
+        'start',
+        'revenue',
+        'orders_count',
+    )
+    list_filter = ('period',)
+    date_hierarchy = 'start'
+
+    def has_add_permission(self, request: HttpRequest) -> bool:
+        return False
+
+    def has_change_permission(self, request: HttpRequest, obj: RevenueBucket | None = None) -> bool:
+        return False
+
+
+@admin.register(DishDailySales)
+class DishDailySalesAdmin(admin.ModelAdmin):
+    """Админская модель для дневной статистики продаж блюд. Статистика ведется автоматически."""
+
+    list_display = (
+        'day',
+        'dish',
+        'quantity',
+        'revenue',
+        'orders_count',
+    )
+    list_select_related = ('dish',)
+    date_hierarchy = 'day'
+
+    def has_add_permission(self, request: HttpRequest) -> bool:
+        return False
+
+    def has_change_permission(self, request: HttpRequest, obj: DishDailySales | None = None) -> bool:
+        return False
+
+
+@admin.register(TableDailySales)
+class TableDailySalesAdmin(admin.ModelAdmin):
+    """Админская модель для дневной статистики выручки столов. Статистика ведется автоматически."""
+
+    list_display = (
+        'day',
+        'table',
+        'revenue',
+        'orders_count',
+    )
+    list_select_related = ('table',)
+    date_hierarchy = 'day'
+
+    def has_add_permission(self, request: HttpRequest) -> bool:
+        return False
+
+    def has_change_permission(self, request: HttpRequest, obj: TableDailySales | None = None) -> bool:
+        return False
@@ -0,0 +1,9 @@
+from core.paginations import KeysetPagination
+
+
+class OrderCursorPagination(KeysetPagination):
+    """Пагинация списка заказов по ключу (-created, id)."""
+
+    ordering = ('-created', 'id')
+    page_size = 50
+    max_page_size = 500
@@ -1,23 +1,28 @@
+from collections.abc import Iterable
 from typing import Any
 
+from django.conf import settings
+from django.db.models import Prefetch, prefetch_related_objects
+from django.utils import timezone
 from rest_framework import serializers
 
 from apps.dishes.api.serializers import DishSerializer
-from apps.dishes.models import Dish
+from apps.dishes.caches import dish_cache
+from apps.orders.data_types import BulkCreateMode, OrderItemData
 from apps.orders.models import Order, OrderItem
 from apps.tables.api.serializers import TableSerializer
+from apps.tables.caches import table_cache
 from apps.tables.models import Table
 
 
 class OrderItemWriteSerializer(serializers.ModelSerializer):
-    """Сериализатор для создания позиции заказа с выбором блюда по названию."""
+    """Сериализатор для создания позиции заказа с выбором блюда по ID.
 
-    def __init__(self, *args: Any, **kwargs: Any) -> None:
-        super().__init__(*args, **kwargs)
-        self.fields['dish'] = serializers.SlugRelatedField(
-            queryset=Dish.objects.all(),
-            slug_field='id',
-        )
+    Поле 'dish' принимает только ID блюда. Сами блюда загружаются одним запросом
+    для всех позиций заказа в `OrderWriteSerializer.validate_items`.
+    """
+
+    dish = serializers.IntegerField(min_value=1)
 
     class Meta:
         model = OrderItem
@@ -31,7 +36,7 @@ class OrderItemReadSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = OrderItem
-        fields = ['id', 'dish', 'quantity', 'total_price']
+        fields = ['id', 'dish', 'quantity', 'unit_price', 'total_price']
 
 
 class OrderReadSerializer(serializers.ModelSerializer):
@@ -73,25 +78,48 @@ class OrderReadSerializer(serializers.ModelSerializer):
 
 
 class OrderWriteSerializer(serializers.ModelSerializer):
-    """Сериализатор для создания заказа."""
+    """Сериализатор для создания заказа.
 
-    items = OrderItemWriteSerializer(many=True)
-
-    def __init__(self, *args: Any, **kwargs: Any) -> None:
-        """Инициализация сериализатора.
+    Блюда всех позиций и стол загружаются пакетно: одним запросом `id IN (...)` для блюд и одним
+    запросом для стола, либо из кеша справочников, если он включен (`CATALOG_CACHE_TIMEOUT`).
+    """
 
-        В конструкторе устанавливается поле 'table', которое является выбором столика по его номеру.
-        """
-        super().__init__(*args, **kwargs)
-        self.fields['table'] = serializers.SlugRelatedField(
-            queryset=Table.objects.all(),
-            slug_field='number',
-        )
+    items = OrderItemWriteSerializer(many=True)
+    table = serializers.IntegerField(min_value=0)
 
     class Meta:
         model = Order
         fields = ['table', 'items', 'status']
 
+    def get_tables(self, numbers: Iterable[int]) -> dict:
+        """Возвращает столы по номерам: из контекста, если они загружены заранее, иначе одним запросом."""
+        if 'tables' in self.context:
+            return self.context['tables']
+        return table_cache.get_many(numbers)
+
+    def get_dishes(self, dish_ids: Iterable[int]) -> dict:
+        """Возвращает блюда по ID: из контекста, если они загружены заранее, иначе одним запросом."""
+        if 'dishes' in self.context:
+            return self.context['dishes']
+        return dish_cache.get_many(dish_ids)
+
+    def validate_table(self, value: int) -> Table:
+        """Возвращает стол по его номеру."""
+        table = self.get_tables([value]).get(value)
+        if table is None:
+            raise serializers.ValidationError(f'Стол с номером {value} не существует.')
+        return table
+
+    def validate_items(self, value: list[dict]) -> list[OrderItemData]:
+        """Заменяет ID блюд в позициях на объекты блюд, загруженные одним запросом."""
+        dishes = self.get_dishes(item['dish'] for item in value)
+        errors = [
+            {} if item['dish'] in dishes else {'dish': [f'Блюдо с id={item["dish"]} не существует.']} for item in value
+        ]
+        if any(errors):
+            raise serializers.ValidationError(errors)
+        return [{**item, 'dish': dishes[item['dish']]} for item in value]  # type: ignore[typeddict-item]
+
 
 class OrderPostSerializer(OrderWriteSerializer):
     """Сериализатор для создания нового заказа через POST запрос.
@@ -106,10 +134,10 @@ class OrderPostSerializer(OrderWriteSerializer):
         """Преобразует экземпляр заказа в формат данных для ответа."""
         return OrderReadSerializer(instance=instance, source=False).data
 
-    def validate_items(self, value: list) -> list:
+    def validate_items(self, value: list[dict]) -> list[OrderItemData]:
         if not value:
             raise serializers.ValidationError('Поле `items` не может быть пустым.')
-        return value
+        return super().validate_items(value)
 
 
 class OrderPatchSerializer(OrderWriteSerializer):
@@ -122,9 +150,96 @@ class OrderPatchSerializer(OrderWriteSerializer):
     """
 
     def to_representation(self, instance: Order) -> dict:
-        """Преобразует экземпляр заказа в формат данных для ответа."""
+        """
+        Преобразует экземпляр заказа в формат данных для ответа.
+
+        После обновления `UpdateModelMixin` сбрасывает предзагруженные позиции заказа, поэтому они
+        загружаются заново вместе с блюдами одним запросом, а не по запросу на блюдо.
+        """
+        prefetch_related_objects([instance], Prefetch('order_items', OrderItem.objects.select_related('dish')))
         return OrderReadSerializer(instance=instance).data
 
 
+class OrderBulkCreateSerializer(serializers.Serializer):
+    """Сериализатор для пакетного создания заказов.
+
+    Каждый элемент 'orders' имеет тот же формат, что и тело POST-запроса на создание заказа,
+    и валидируется `OrderPostSerializer` в сервисе `OrderBulkCreator`.
+
+    Поля:
+        - orders: Список заказов.
+        - mode: 'atomic' — создать все заказы или ни одного; 'best_effort' — создать все корректные заказы.
+        - batch_size: Количество заказов в одном запросе вставки.
+    """
+
+    orders = serializers.ListField(
+        child=serializers.DictField(),
+        allow_empty=False,
+        max_length=settings.ORDERS_BULK_MAX_ORDERS,
+    )
+    mode = serializers.ChoiceField(choices=[mode.value for mode in BulkCreateMode], default=BulkCreateMode.ATOMIC)
+    batch_size = serializers.IntegerField(
+        min_value=1,
+        max_value=settings.ORDERS_BULK_MAX_ORDERS,
+        default=settings.ORDERS_BULK_BATCH_SIZE,
+    )
+
+
+class ShiftRevenueQuerySerializer(serializers.Serializer):
+    """Параметры запроса выручки: день прошедшей смены или произвольный период."""
+
+    day = serializers.DateField(required=False)
+    start = serializers.DateTimeField(required=False)
+    end = serializers.DateTimeField(required=False)
+
+    def validate(self, attrs: dict) -> dict:
+        if ('start' in attrs) != ('end' in attrs):
+            raise serializers.ValidationError('Параметры `start` и `end` указываются вместе.')
+        if 'start' in attrs and attrs['start'] >= attrs['end']:
+            raise serializers.ValidationError('Параметр `start` должен быть меньше `end`.')
+        if 'start' in attrs and 'day' in attrs:
+            raise serializers.ValidationError('Укажите либо `day`, либо `start` и `end`.')
+        return attrs
+
+
 class ShiftRevenueSerializer(serializers.Serializer):
-    total_revenue = serializers.DecimalField(max_digits=10, decimal_places=2)
+    total_revenue = serializers.DecimalField(max_digits=12, decimal_places=2)
+    orders_count = serializers.IntegerField()
+    start = serializers.DateTimeField(allow_null=True)
+    end = serializers.DateTimeField(allow_null=True)
+
+
+class SalesAnalyticsQuerySerializer(serializers.Serializer):
+    """Параметры запроса аналитики продаж: диапазон дней, разбивка по дням и количество строк."""
+
+    max_days = 366
+
+    date_from = serializers.DateField(required=False)
+    date_to = serializers.DateField(required=False)
+    by_day = serializers.BooleanField(default=False)
+    limit = serializers.IntegerField(min_value=1, max_value=1000, default=100)
+
+    def validate(self, attrs: dict) -> dict:
+        attrs.setdefault('date_to', timezone.localdate())
+        attrs.setdefault('date_from', attrs['date_to'])
+        if attrs['date_from'] > attrs['date_to']:
+            raise serializers.ValidationError('Параметр `date_from` не может быть больше `date_to`.')
+        if (attrs['date_to'] - attrs['date_from']).days >= self.max_days:
+            raise serializers.ValidationError(f'Период не может быть больше {self.max_days} дней.')
+        return attrs
+
+
+class DishSalesSerializer(serializers.Serializer):
+    day = serializers.DateField(required=False)
+    dish = serializers.IntegerField(source='dish_id')
+    dish_name = serializers.CharField()
+    quantity = serializers.IntegerField()
+    revenue = serializers.DecimalField(max_digits=12, decimal_places=2)
+    orders_count = serializers.IntegerField()
+
+
+class TableSalesSerializer(serializers.Serializer):
+    day = serializers.DateField(required=False)
+    table = serializers.IntegerField(source='table_number')
+    revenue = serializers.DecimalField(max_digits=12, decimal_places=2)
+    orders_count = serializers.IntegerField()
@@ -1,12 +1,23 @@
 from django.urls import include, path
 from rest_framework.routers import DefaultRouter
 
-from apps.orders.api.views import OrderViewSet, ShiftRevenueAPIView
+from apps.orders.api.views import (
+    DishSalesAPIView,
+    OrderEventsView,
+    OrderExportAPIView,
+    OrderViewSet,
+    ShiftRevenueAPIView,
+    TableSalesAPIView,
+)
 
 router = DefaultRouter()
 router.register(r'orders', OrderViewSet, basename='order')
 
 urlpatterns = [
+    path('orders/export/', OrderExportAPIView.as_view(), name='order-export'),
+    path('orders/events/', OrderEventsView.as_view(), name='order-events'),
     path('', include(router.urls)),
     path('shift-revenue/', ShiftRevenueAPIView.as_view(), name='shift-revenue'),
+    path('analytics/dishes/', DishSalesAPIView.as_view(), name='analytics-dishes'),
+    path('analytics/tables/', TableSalesAPIView.as_view(), name='analytics-tables'),
 ]
@@ -1,5 +1,15 @@
+import hashlib
 from typing import Any
 
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db.models import QuerySet
+from django.http import HttpResponse, StreamingHttpResponse
+from django.http.response import HttpResponseBase
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+from rest_framework import status
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
 from rest_framework.permissions import SAFE_METHODS, IsAuthenticated
 from rest_framework.request import Request
 from rest_framework.response import Response
@@ -7,17 +17,26 @@ from rest_framework.views import APIView
 from rest_framework.viewsets import ModelViewSet
 from rest_framework_api_key.permissions import HasAPIKey
 
+from apps.orders.api.paginations import OrderCursorPagination
 from apps.orders.api.serializers import (
+    OrderBulkCreateSerializer,
     OrderPatchSerializer,
     OrderPostSerializer,
     OrderReadSerializer,
     OrderWriteSerializer,
+    SalesAnalyticsQuerySerializer,
+    ShiftRevenueQuerySerializer,
 )
-from apps.orders.filters import OrderFilterSet
-from apps.orders.models import Order
+from apps.orders.data_types import SalesGrouping
+from apps.orders.filters import OrderExportFilterSet, OrderFilterSet
+from apps.orders.models import ORDERS_CHANNEL, Order
+from apps.orders.services.order_bulk_creator import OrderBulkCreator
 from apps.orders.services.order_creator import OrderCreator
+from apps.orders.services.order_exporter import OrderExporter
 from apps.orders.services.order_updater import OrderUpdater
+from apps.orders.services.sales_analytics_getter import SalesAnalyticsGetter
 from apps.orders.services.total_revenue_getter import ShiftRevenueGetter
+from core.views import EventStreamView
 
 OrderSerializers = OrderReadSerializer | OrderWriteSerializer | OrderPostSerializer | OrderPatchSerializer
 
@@ -32,6 +51,11 @@ class OrderViewSet(ModelViewSet):
     Особенности:
     - Использует сериализатор OrderReadSerializer для представления данных.
     - Фильтрует заказы с помощью OrderFilterSet.
+    - Разбивает список на страницы keyset-пагинацией по ключу (-created, id) (OrderCursorPagination).
+    - Поддерживает пакетное создание заказов (POST /orders/bulk/).
+    - Поддерживает условные запросы списка и заказа (`If-None-Match`, `If-Modified-Since`): валидаторы
+      вычисляются одним запросом по количеству и времени изменения заказов выборки, и неизменившиеся
+      данные возвращаются ответом 304 без выборки и сериализации заказов.
     - Требует аутентификацию пользователя (IsAuthenticated) или API-ключ (HasAPIKey).
     - Оптимизирует запросы с помощью select_related и prefetch_related:
       - select_related('table') загружает связанные данные о номере стола.
@@ -43,9 +67,12 @@ class OrderViewSet(ModelViewSet):
     permission_classes = [IsAuthenticated | HasAPIKey]
     queryset = Order.objects.select_related('table').prefetch_related('order_items__dish')
     filterset_class = OrderFilterSet
+    pagination_class = OrderCursorPagination
     http_method_names = ['get', 'post', 'patch', 'delete']
 
-    def get_serializer_class(self) -> type[OrderSerializers]:
+    def get_serializer_class(self) -> type[OrderSerializers | OrderBulkCreateSerializer]:
+        if self.action == 'bulk':
+            return OrderBulkCreateSerializer
         method = self.request.method
         if method in SAFE_METHODS:
             return OrderReadSerializer
@@ -55,17 +82,147 @@ class OrderViewSet(ModelViewSet):
             return OrderPostSerializer
         return OrderWriteSerializer
 
+    def get_validators(self, queryset: QuerySet[Order]) -> tuple[str, int | None] | None:
+        """
+        Возвращает сильный ETag и время последнего изменения (Last-Modified) выборки заказов.
+
+        ETag зависит от количества заказов, времени последнего изменения, параметров запроса (фильтры,
+        курсор, размер страницы) и формата ответа. Для пустой выборки возвращается None.
+        """
+        count, updated = queryset.get_change_marker()  # type: ignore[attr-defined]
+        if not count or updated is None:
+            return None
+        key = f'{count}:{updated.isoformat()}:{self.request.get_full_path()}:{self.request.accepted_media_type}'
+        return f'"{hashlib.sha256(key.encode()).hexdigest()[:32]}"', int(updated.timestamp())
+
+    def get_conditional_response(self, request: Request, queryset: QuerySet[Order], handler: Any) -> HttpResponseBase:
+        """Возвращает 304, если данные не изменились, иначе ответ `handler` с заголовками ETag и Last-Modified."""
+        validators = self.get_validators(queryset)
+        if validators is None:
+            return handler()
+        etag, last_modified = validators
+        headers = {'ETag': etag, 'Last-Modified': http_date(last_modified)}
+        not_modified = get_conditional_response(
+            request, etag=etag, last_modified=last_modified, response=HttpResponse(headers=headers)
+        )
+        if not_modified is not None and not_modified.status_code != status.HTTP_200_OK:
+            return not_modified
+        response = handler()
+        if response.status_code == status.HTTP_200_OK:
+            for header, value in headers.items():
+                response[header] = value
+        return response
+
+    def list(self, request: Request, *args: Any, **kwargs: Any) -> HttpResponseBase:
+        queryset = self.filter_queryset(Order.objects.all())
+        return self.get_conditional_response(request, queryset, lambda: super(OrderViewSet, self).list(request))
+
+    def retrieve(self, request: Request, *args: Any, **kwargs: Any) -> HttpResponseBase:
+        try:
+            queryset = Order.objects.filter(pk=kwargs[self.lookup_field])
+        except (TypeError, ValueError, DjangoValidationError):
+            return super().retrieve(request, *args, **kwargs)
+        return self.get_conditional_response(request, queryset, lambda: super(OrderViewSet, self).retrieve(request))
+
     def perform_create(self, serializer: OrderWriteSerializer) -> Order:
         return OrderCreator(serializer)()
 
     def perform_update(self, serializer: OrderWriteSerializer) -> Order:
         return OrderUpdater(serializer)()
 
+    @action(detail=False, methods=['post'])
+    def bulk(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        """
+        Пакетное создание заказов.
+
+        Возвращает результат по каждому заказу: 201, если созданы все заказы, 400, если не создан ни один,
+        и 207, если часть заказов создана (режим 'best_effort').
+        """
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        results = OrderBulkCreator(serializer)()
+        created = sum(result['status'] == 'created' for result in results)
+        if created == len(results):
+            response_status = status.HTTP_201_CREATED
+        elif created:
+            response_status = status.HTTP_207_MULTI_STATUS
+        else:
+            response_status = status.HTTP_400_BAD_REQUEST
+        return Response({'results': results}, status=response_status)
+
 
 class ShiftRevenueAPIView(APIView):
-    """Представление для получения общей выручки."""
+    """
+    Представление для получения общей выручки.
+
+    Без параметров возвращает выручку за текущую смену, с параметром 'day' — за смену, начавшуюся в этот день,
+    с параметрами 'start' и 'end' — за произвольный период.
+    """
 
     permission_classes = [IsAuthenticated | HasAPIKey]
 
     def get(self, request: Request, *args: Any, **kwargs: Any) -> Response:
-        return ShiftRevenueGetter()()
+        serializer = ShiftRevenueQuerySerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        return ShiftRevenueGetter(**serializer.validated_data)()
+
+
+class SalesAnalyticsAPIView(APIView):
+    """
+    Базовое представление аналитики продаж по дневной статистике.
+
+    Параметры: 'date_from' и 'date_to' (по умолчанию — сегодня), 'by_day' — разбивка по дням,
+    'limit' — количество строк в ответе.
+    """
+
+    permission_classes = [IsAuthenticated | HasAPIKey]
+    grouping: SalesGrouping
+
+    def get(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        serializer = SalesAnalyticsQuerySerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        return SalesAnalyticsGetter(grouping=self.grouping, **serializer.validated_data)()
+
+
+class DishSalesAPIView(SalesAnalyticsAPIView):
+    """Представление для получения продаж по блюдам: количество порций, выручка и количество заказов."""
+
+    grouping = SalesGrouping.DISH
+
+
+class TableSalesAPIView(SalesAnalyticsAPIView):
+    """Представление для получения выручки и количества оплаченных заказов по столам."""
+
+    grouping = SalesGrouping.TABLE
+
+
+class OrderExportAPIView(APIView):
+    """
+    Представление для потоковой выгрузки заказов с позициями.
+
+    Принимает те же фильтры, что и список заказов (OrderFilterSet), а также диапазон дат
+    создания 'created_after'/'created_before'. Формат задается параметром 'export_format' ('csv' или 'ndjson').
+    """
+
+    permission_classes = [IsAuthenticated | HasAPIKey]
+
+    def get(self, request: Request, *args: Any, **kwargs: Any) -> StreamingHttpResponse:
+        filterset = OrderExportFilterSet(request.query_params, queryset=Order.objects.all(), request=request)
+        if not filterset.is_valid():
+            raise ValidationError(filterset.errors)
+        export_format = request.query_params.get('export_format', 'csv')
+        return OrderExporter(queryset=filterset.qs, export_format=export_format)()
+
+
+class OrderEventsView(EventStreamView):
+    """
+    Поток событий заказов (Server-Sent Events) для обновления списка заказов без повторных запросов.
+
+    Каждое событие — JSON с полем 'type':
+    - 'created', 'updated' — заказ в поле 'order': id, номер стола, статус, общая стоимость
+      и позиции [блюдо, количество];
+    - 'status' — смена статуса: 'id' и 'status';
+    - 'deleted' — удаление: 'id'.
+    """
+
+    channel = ORDERS_CHANNEL
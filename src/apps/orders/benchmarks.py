@@ -0,0 +1,221 @@
+import platform
+import random
+import statistics
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import timedelta
+from time import perf_counter
+from typing import TypedDict
+
+import django
+from django.db import connection
+from django.http import HttpResponse
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+from rest_framework_api_key.models import APIKey
+
+from apps.dishes.models import Dish
+from apps.orders.models import Order, OrderStatus
+from apps.tables.models import Table
+from core.queries import QueryInspector
+
+
+class ScenarioResult(TypedDict):
+    requests: int
+    errors: int
+    throughput: float
+    mean_ms: float
+    p50_ms: float
+    p99_ms: float
+    queries: float
+
+
+class BenchmarkResults(TypedDict):
+    meta: dict
+    scenarios: dict[str, ScenarioResult]
+
+
+def percentile(values: list[float], percent: float) -> float:
+    """Процентиль по методу ближайшего ранга."""
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, round(percent / 100 * len(ordered) + 0.5) - 1))
+    return ordered[index]
+
+
+@dataclass
+class BenchmarkContext:
+    """
+    Данные, из которых сценарии выбирают параметры запросов.
+
+    Детальные запросы, изменение и удаление выбирают заказы из заполненного диапазона id; удаление сначала
+    удаляет заказы, созданные сценарием создания, чтобы не уменьшать заполненные данные.
+    """
+
+    client: APIClient
+    rng: random.Random
+    table_numbers: list[int]
+    dish_ids: list[int]
+    min_order_id: int
+    max_order_id: int
+    deletable_order_ids: list[int] = field(default_factory=list)
+
+    def collect_deletable_orders(self) -> None:
+        """Запоминает заказы, созданные сценариями после заполнения базы: их удаляет сценарий удаления."""
+        self.deletable_order_ids = list(Order.objects.filter(id__gt=self.max_order_id).values_list('id', flat=True))
+
+    def random_order_id(self) -> int:
+        return self.rng.randint(self.min_order_id, self.max_order_id)
+
+    def random_items(self) -> list[dict]:
+        dish_ids = self.rng.sample(self.dish_ids, min(len(self.dish_ids), self.rng.randint(1, 9)))
+        return [{'dish': dish_id, 'quantity': self.rng.randint(1, 3)} for dish_id in dish_ids]
+
+
+def order_list(context: BenchmarkContext) -> HttpResponse:
+    return context.client.get(reverse('api_v1:order-list'))
+
+
+def order_list_filtered(context: BenchmarkContext) -> HttpResponse:
+    params = {'status': context.rng.choice(OrderStatus.values), 'table': context.rng.choice(context.table_numbers)}
+    return context.client.get(reverse('api_v1:order-list'), params)
+
+
+def order_detail(context: BenchmarkContext) -> HttpResponse:
+    return context.client.get(reverse('api_v1:order-detail', args=(context.random_order_id(),)))
+
+
+def order_create(context: BenchmarkContext) -> HttpResponse:
+    data = {'table': context.rng.choice(context.table_numbers), 'items': context.random_items()}
+    return context.client.post(reverse('api_v1:order-list'), data, format='json')
+
+
+def order_patch_items(context: BenchmarkContext) -> HttpResponse:
+    url = reverse('api_v1:order-detail', args=(context.random_order_id(),))
+    return context.client.patch(url, {'items': context.random_items()}, format='json')
+
+
+def order_status_change(context: BenchmarkContext) -> HttpResponse:
+    url = reverse('api_v1:order-detail', args=(context.random_order_id(),))
+    return context.client.patch(url, {'status': context.rng.choice(OrderStatus.values)}, format='json')
+
+
+def order_delete(context: BenchmarkContext) -> HttpResponse:
+    order_id = context.deletable_order_ids.pop() if context.deletable_order_ids else context.random_order_id()
+    return context.client.delete(reverse('api_v1:order-detail', args=(order_id,)))
+
+
+def shift_revenue(context: BenchmarkContext) -> HttpResponse:
+    day = timezone.localdate() - timedelta(days=context.rng.randrange(30))
+    return context.client.get(reverse('api_v1:shift-revenue'), {'day': day.isoformat()})
+
+
+SCENARIOS: dict[str, Callable[[BenchmarkContext], HttpResponse]] = {
+    'order_list': order_list,
+    'order_list_filtered': order_list_filtered,
+    'order_detail': order_detail,
+    'order_create': order_create,
+    'order_patch_items': order_patch_items,
+    'order_status_change': order_status_change,
+    'order_delete': order_delete,
+    'shift_revenue': shift_revenue,
+}
+
+
+def get_context(seed: int) -> BenchmarkContext:
+    """Создает API-ключ и собирает идентификаторы данных, по которым выполняются запросы."""
+    _, key = APIKey.objects.create_key(name='benchmark')
+    client = APIClient()
+    client.credentials(HTTP_AUTHORIZATION=f'Api-Key {key}')
+    order_ids = Order.objects.order_by('id').values_list('id', flat=True)
+    return BenchmarkContext(
+        client=client,
+        rng=random.Random(seed),
+        table_numbers=list(Table.objects.values_list('number', flat=True)),
+        dish_ids=list(Dish.objects.values_list('id', flat=True)),
+        min_order_id=order_ids.first() or 0,
+        max_order_id=order_ids.last() or 0,
+    )
+
+
+def run_scenario(
+    scenario: Callable[[BenchmarkContext], HttpResponse],
+    context: BenchmarkContext,
+    requests: int,
+    warmup: int,
+) -> ScenarioResult:
+    """Выполняет сценарий `warmup` раз без замеров, затем `requests` раз с замером времени и запросов к базе."""
+    for _ in range(warmup):
+        scenario(context)
+    latencies, queries, errors = [], [], 0
+    started = perf_counter()
+    for _ in range(requests):
+        inspector = QueryInspector(detect_n_plus_one=False)
+        request_started = perf_counter()
+        with inspector.capture():
+            response = scenario(context)
+        latencies.append((perf_counter() - request_started) * 1000)
+        queries.append(inspector.queries_count)
+        errors += response.status_code >= 400 and response.status_code != 404
+    elapsed = perf_counter() - started
+    return ScenarioResult(
+        requests=requests,
+        errors=errors,
+        throughput=round(requests / elapsed, 2),
+        mean_ms=round(statistics.fmean(latencies), 3),
+        p50_ms=round(percentile(latencies, 50), 3),
+        p99_ms=round(percentile(latencies, 99), 3),
+        queries=round(statistics.fmean(queries), 2),
+    )
+
+
+def run_benchmark(
+    scenarios: list[str],
+    requests: int,
+    warmup: int,
+    seed: int,
+    on_result: Callable[[str, ScenarioResult], None] | None = None,
+) -> BenchmarkResults:
+    """Выполняет сценарии по очереди на текущих данных базы и возвращает результаты с описанием окружения."""
+    context = get_context(seed)
+    results: dict[str, ScenarioResult] = {}
+    for name in scenarios:
+        context.collect_deletable_orders()
+        results[name] = run_scenario(SCENARIOS[name], context, requests, warmup)
+        if on_result is not None:
+            on_result(name, results[name])
+    meta = {
+        'created': timezone.now().isoformat(),
+        'database': connection.vendor,
+        'python': platform.python_version(),
+        'django': django.get_version(),
+        'machine': platform.machine(),
+        'tables': Table.objects.count(),
+        'dishes': Dish.objects.count(),
+        'orders': context.max_order_id - context.min_order_id + 1,
+        'requests': requests,
+        'seed': seed,
+    }
+    return BenchmarkResults(meta=meta, scenarios=results)
+
+
+def compare_results(results: BenchmarkResults, baseline: BenchmarkResults, tolerance: float) -> list[str]:
+    """
+    Сравнивает результаты с базовыми и возвращает описания регрессий.
+
+    Регрессией считается рост p50 или p99 больше чем на `tolerance` (доля), падение пропускной способности
+    больше чем на `tolerance` и любое увеличение среднего количества SQL-запросов.
+    """
+    regressions = []
+    for name, result in results['scenarios'].items():
+        base = baseline['scenarios'].get(name)
+        if base is None:
+            continue
+        for metric in ('p50_ms', 'p99_ms'):
+            if result[metric] > base[metric] * (1 + tolerance):
+                regressions.append(f'{name}: {metric} {result[metric]} > {base[metric]}')
+        if result['throughput'] < base['throughput'] * (1 - tolerance):
+            regressions.append(f'{name}: throughput {result["throughput"]} < {base["throughput"]}')
+        if result['queries'] > base['queries']:
+            regressions.append(f'{name}: queries {result["queries"]} > {base["queries"]}')
+    return regressions
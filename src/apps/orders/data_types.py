@@ -1,4 +1,6 @@
 from datetime import datetime
+from decimal import Decimal
+from enum import StrEnum
 from typing import NamedTuple, TypedDict
 
 from apps.dishes.models import Dish
@@ -18,3 +20,33 @@ class OrderValidatedData(TypedDict, total=False):
 class WorkingTime(NamedTuple):
     start: datetime
     end: datetime
+
+
+class ExportFormat(StrEnum):
+    CSV = 'csv'
+    NDJSON = 'ndjson'
+
+
+class OrderEventType(StrEnum):
+    CREATED = 'created'
+    UPDATED = 'updated'
+    STATUS = 'status'
+    DELETED = 'deleted'
+
+
+class BulkCreateMode(StrEnum):
+    ATOMIC = 'atomic'
+    BEST_EFFORT = 'best_effort'
+
+
+class BulkCreateResult(TypedDict, total=False):
+    index: int
+    status: str
+    id: int
+    total_price: Decimal
+    errors: dict | list
+
+
+class SalesGrouping(StrEnum):
+    DISH = 'dish'
+    TABLE = 'table'
@@ -1,4 +1,6 @@
-from django_filters import CharFilter, FilterSet, NumberFilter
+from django.db.models import QuerySet
+
+from django_filters import CharFilter, DateFromToRangeFilter, FilterSet, NumberFilter
 
 from apps.orders.models import Order
 
@@ -19,7 +21,7 @@ class OrderFilterSet(FilterSet):
 
     status = CharFilter(
         field_name='status',
-        lookup_expr='iexact',
+        method='filter_status',
     )
     table = NumberFilter(
         field_name='table__number',
@@ -28,3 +30,30 @@ class OrderFilterSet(FilterSet):
     class Meta:
         model = Order
         fields = ['id', 'status', 'table']
+
+    def filter_status(self, queryset: QuerySet[Order], name: str, value: str) -> QuerySet[Order]:
+        """
+        Фильтрует по статусу без учета регистра.
+
+        Значения статусов хранятся в нижнем регистре, поэтому значение приводится к нему и сравнивается
+        точно: в отличие от `iexact`, такое условие использует индексы по статусу.
+        """
+        return queryset.filter(**{name: value.lower()})
+
+
+class OrderExportFilterSet(OrderFilterSet):
+    """
+    Фильтр для выгрузки заказов.
+
+    Поддерживает все фильтры 'OrderFilterSet' и дополнительно диапазон дат создания заказа:
+    - 'created_after' — заказы, созданные не раньше указанной даты.
+    - 'created_before' — заказы, созданные не позже указанной даты.
+
+    Пример использования:
+    - /api/v1/orders/export/?status=paid&created_after=2025-01-01&created_before=2025-01-31
+    """
+
+    created = DateFromToRangeFilter(field_name='created')
+
+    class Meta(OrderFilterSet.Meta):
+        fields = OrderFilterSet.Meta.fields + ['created']
@@ -0,0 +1,115 @@
+import json
+from pathlib import Path
+from typing import Any
+
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db import connection
+from django.test.utils import override_settings, setup_test_environment, teardown_test_environment
+
+from apps.orders.benchmarks import SCENARIOS, BenchmarkResults, ScenarioResult, compare_results, run_benchmark
+from apps.orders.models import Order
+
+
+class Command(BaseCommand):
+    help = (
+        'Нагрузочный тест API заказов: создает отдельную тестовую базу, заполняет ее данными, '
+        'замеряет пропускную способность, p50/p99 и количество SQL-запросов по сценариям, '
+        'сохраняет результаты в JSON и сравнивает их с базовыми.'
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument('--tables', type=int, default=1000, help='Количество столов.')
+        parser.add_argument('--dishes', type=int, default=500, help='Количество блюд.')
+        parser.add_argument('--orders', type=int, default=1_000_000, help='Количество заказов.')
+        parser.add_argument('--avg-items', type=int, default=5, help='Среднее количество позиций в заказе.')
+        parser.add_argument('--seed', type=int, default=0, help='Зерно генерации данных и запросов.')
+        parser.add_argument('--workers', type=int, default=1, help='Количество процессов генерации данных.')
+        parser.add_argument('--requests', type=int, default=200, help='Количество замеряемых запросов сценария.')
+        parser.add_argument('--warmup', type=int, default=20, help='Количество запросов прогрева сценария.')
+        parser.add_argument(
+            '--scenario',
+            action='append',
+            choices=list(SCENARIOS),
+            dest='scenarios',
+            help='Сценарий (можно указать несколько раз), по умолчанию все.',
+        )
+        parser.add_argument(
+            '--keepdb',
+            action='store_true',
+            help='Не удалять тестовую базу и повторно использовать уже заполненные данные.',
+        )
+        parser.add_argument('--output', type=Path, default=Path('benchmark_results.json'), help='Файл результатов.')
+        parser.add_argument('--baseline', type=Path, help='Файл базовых результатов для сравнения.')
+        parser.add_argument(
+            '--save-baseline',
+            action='store_true',
+            help='Сохранить результаты в файл --baseline вместо сравнения.',
+        )
+        parser.add_argument(
+            '--tolerance',
+            type=float,
+            default=0.2,
+            help='Допустимое ухудшение задержки и пропускной способности (доля).',
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        if options['save_baseline'] and not options['baseline']:
+            raise CommandError('Для --save-baseline нужно указать --baseline.')
+        setup_test_environment()
+        old_name = connection.creation.create_test_db(verbosity=0, autoclobber=True, keepdb=options['keepdb'])
+        try:
+            with override_settings(DEBUG=False, N_PLUS_ONE_DETECTION=False):
+                self.seed(options)
+                results = run_benchmark(
+                    options['scenarios'] or list(SCENARIOS),
+                    options['requests'],
+                    options['warmup'],
+                    options['seed'],
+                    on_result=self.write_result,
+                )
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0, keepdb=options['keepdb'])
+            teardown_test_environment()
+
+        output = json.dumps(results, ensure_ascii=False, indent=2)
+        options['output'].write_text(output)
+        self.stdout.write(f'Результаты сохранены в {options["output"]}')
+        if options['baseline'] is None:
+            return
+        if options['save_baseline']:
+            options['baseline'].write_text(output)
+            self.stdout.write(f'Базовые результаты сохранены в {options["baseline"]}')
+            return
+        self.compare(results, options['baseline'], options['tolerance'])
+
+    def seed(self, options: dict) -> None:
+        """Заполняет тестовую базу, если в ней меньше заказов, чем запрошено (например, при --keepdb)."""
+        if Order.objects.count() >= options['orders']:
+            return
+        self.stdout.write(f'Генерация данных: {options["orders"]} заказов...')
+        call_command(
+            'seed_data',
+            tables=options['tables'],
+            dishes=options['dishes'],
+            orders=options['orders'],
+            avg_items=options['avg_items'],
+            seed=options['seed'],
+            workers=options['workers'],
+            stdout=self.stdout,
+        )
+
+    def write_result(self, name: str, result: ScenarioResult) -> None:
+        self.stdout.write(
+            f'{name:<22} {result["throughput"]:>9.1f} req/s  p50 {result["p50_ms"]:>8.2f} ms  '
+            f'p99 {result["p99_ms"]:>8.2f} ms  SQL {result["queries"]:>5.1f}  ошибок {result["errors"]}'
+        )
+
+    def compare(self, results: BenchmarkResults, baseline_path: Path, tolerance: float) -> None:
+        if not baseline_path.exists():
+            raise CommandError(f'Файл базовых результатов {baseline_path} не найден.')
+        baseline = json.loads(baseline_path.read_text())
+        regressions = compare_results(results, baseline, tolerance)
+        if regressions:
+            raise CommandError('Регрессии относительно базовых результатов:\n' + '\n'.join(regressions))
+        self.stdout.write(self.style.SUCCESS('Регрессий относительно базовых результатов нет.'))
@@ -0,0 +1,53 @@
+from datetime import date, timedelta
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db import transaction
+from django.utils import timezone
+
+from apps.orders.models import DishDailySales, RevenueBucket, TableDailySales
+from apps.orders.shifts import get_shift
+
+
+class Command(BaseCommand):
+    help = (
+        'Перестраивает журнал выручки и дневную статистику продаж по блюдам и столам '
+        'по оплаченным заказам за указанный диапазон дней.'
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            '--date-from', type=date.fromisoformat, help='Первый день (YYYY-MM-DD), по умолчанию равен --date-to.'
+        )
+        parser.add_argument(
+            '--date-to', type=date.fromisoformat, help='Последний день (YYYY-MM-DD), по умолчанию сегодня.'
+        )
+        parser.add_argument(
+            '--chunk-days',
+            type=int,
+            default=7,
+            help='Количество дней, перестраиваемых в одной транзакции.',
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        date_to = options['date_to'] or timezone.localdate()
+        date_from = options['date_from'] or date_to
+        chunk_days = options['chunk_days']
+        if date_from > date_to:
+            raise CommandError('--date-from не может быть больше --date-to.')
+        if chunk_days < 1:
+            raise CommandError('--chunk-days должен быть положительным.')
+
+        day = date_from
+        while day <= date_to:
+            chunk_end = min(day + timedelta(days=chunk_days - 1), date_to)
+            with transaction.atomic():
+                buckets = RevenueBucket.rebuild(get_shift(day).start, get_shift(chunk_end + timedelta(days=1)).start)
+                dishes = DishDailySales.rebuild(day, chunk_end)
+                tables = TableDailySales.rebuild(day, chunk_end)
+            self.stdout.write(
+                f'{day:%d.%m.%Y}–{chunk_end:%d.%m.%Y}: журнал выручки — {buckets}, '
+                f'блюда — {dishes}, столы — {tables} строк.'
+            )
+            day = chunk_end + timedelta(days=1)
+        self.stdout.write(self.style.SUCCESS('Статистика продаж перестроена.'))
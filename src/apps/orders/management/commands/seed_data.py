@@ -0,0 +1,83 @@
+from datetime import datetime, timedelta
+from time import perf_counter
+from typing import Any
+
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from apps.orders.seeding import DataSeeder, SeedConfig
+
+
+class Command(BaseCommand):
+    help = (
+        'Генерирует большие объемы правдоподобных данных: столы, блюда, заказы с позициями, '
+        'реалистичными статусами, распределением по времени и снимками цен. Данные определяются зерном '
+        'и не зависят от количества процессов.'
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument('--tables', type=int, default=1000, help='Количество новых столов.')
+        parser.add_argument('--dishes', type=int, default=500, help='Количество новых блюд.')
+        parser.add_argument('--orders', type=int, default=1_000_000, help='Количество заказов.')
+        parser.add_argument('--avg-items', type=int, default=5, help='Среднее количество позиций в заказе.')
+        parser.add_argument('--days', type=int, default=90, help='За сколько последних дней создаются заказы.')
+        parser.add_argument('--seed', type=int, default=0, help='Зерно генерации.')
+        parser.add_argument('--batch-size', type=int, default=10_000, help='Количество заказов в пакете вставки.')
+        parser.add_argument(
+            '--end',
+            type=datetime.fromisoformat,
+            help='Момент (ISO 8601), до которого создаются заказы, по умолчанию текущее время.',
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=1,
+            help='Количество процессов, вставляющих пакеты заказов (только PostgreSQL).',
+        )
+        parser.add_argument(
+            '--method',
+            choices=DataSeeder.methods,
+            default='auto',
+            help='Способ записи: COPY (PostgreSQL), многострочные INSERT или auto — COPY, если доступен.',
+        )
+        parser.add_argument(
+            '--skip-rollups',
+            action='store_true',
+            help='Не перестраивать журнал выручки и дневную статистику продаж.',
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        for name in ('orders', 'avg_items', 'days', 'batch_size', 'workers'):
+            if options[name] < 1:
+                raise CommandError(f'--{name.replace("_", "-")} должен быть положительным.')
+        if options['tables'] < 0 or options['dishes'] < 0:
+            raise CommandError('Количество столов и блюд не может быть отрицательным.')
+        config = SeedConfig(
+            tables=options['tables'],
+            dishes=options['dishes'],
+            orders=options['orders'],
+            avg_items=options['avg_items'],
+            days=options['days'],
+            seed=options['seed'],
+            batch_size=options['batch_size'],
+            end=options['end'],
+        )
+        try:
+            seeder = DataSeeder(config, method=options['method'])
+            started = perf_counter()
+            created = seeder.seed(workers=options['workers'])
+        except ValueError as error:
+            raise CommandError(str(error)) from error
+        elapsed = perf_counter() - started
+        self.stdout.write(f'Создано заказов: {created} за {elapsed:.1f} с ({created / elapsed:.0f} заказов/с).')
+
+        if not options['skip_rollups']:
+            date_from, date_to = seeder.get_days()
+            call_command(
+                'rebuild_sales_rollups',
+                date_from=date_from - timedelta(days=1),
+                date_to=date_to,
+                chunk_days=31,
+                stdout=self.stdout,
+            )
+        self.stdout.write(self.style.SUCCESS('Данные сгенерированы.'))
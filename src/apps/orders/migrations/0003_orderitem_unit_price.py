@@ -0,0 +1,47 @@
+# Generated by Django 5.1.5 on 2026-10-18 12:00
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def backfill_unit_price(apps, schema_editor):
+    Dish = apps.get_model('dishes', 'Dish')
+    OrderItem = apps.get_model('orders', 'OrderItem')
+    OrderItem.objects.filter(unit_price__isnull=True).update(
+        unit_price=Subquery(Dish.objects.filter(pk=OuterRef('dish_id')).values('price')[:1])
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dishes', '0001_initial'),
+        ('orders', '0002_rename_table_number_order_table'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='orderitem',
+            name='unit_price',
+            field=models.DecimalField(
+                blank=True,
+                decimal_places=2,
+                help_text='Цена блюда на момент добавления позиции в заказ.',
+                max_digits=10,
+                null=True,
+                verbose_name='Цена за единицу',
+            ),
+        ),
+        migrations.RunPython(backfill_unit_price, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='orderitem',
+            name='unit_price',
+            field=models.DecimalField(
+                blank=True,
+                decimal_places=2,
+                help_text='Цена блюда на момент добавления позиции в заказ.',
+                max_digits=10,
+                verbose_name='Цена за единицу',
+            ),
+        ),
+    ]
@@ -0,0 +1,68 @@
+# Generated by Django 5.1.5 on 2026-10-18 12:09
+
+from collections import defaultdict
+from decimal import Decimal
+
+from django.db import migrations, models
+from django.db.models import F
+
+from apps.orders.shifts import get_hour_start, get_shift_start
+
+
+def backfill_revenue(apps, schema_editor):
+    """Заполняет время оплаты оплаченных заказов временем их изменения и строит по ним журнал выручки."""
+    Order = apps.get_model('orders', 'Order')
+    RevenueBucket = apps.get_model('orders', 'RevenueBucket')
+    paid_orders = Order.objects.filter(status='paid')
+    paid_orders.filter(paid_at__isnull=True).update(paid_at=F('updated'))
+    buckets: defaultdict[tuple, list] = defaultdict(lambda: [Decimal(0), 0])
+    for paid_at, total_price in paid_orders.values_list('paid_at', 'total_price').iterator():
+        for key in (('hour', get_hour_start(paid_at)), ('shift', get_shift_start(paid_at))):
+            buckets[key][0] += total_price
+            buckets[key][1] += 1
+    RevenueBucket.objects.bulk_create(
+        [
+            RevenueBucket(period=period, start=start, revenue=revenue, orders_count=orders_count)
+            for (period, start), (revenue, orders_count) in buckets.items()
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('orders', '0003_orderitem_unit_price'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='order',
+            name='paid_at',
+            field=models.DateTimeField(blank=True, null=True, verbose_name='Дата оплаты'),
+        ),
+        migrations.CreateModel(
+            name='RevenueBucket',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                (
+                    'period',
+                    models.CharField(
+                        choices=[('hour', 'Час'), ('shift', 'Смена')], max_length=5, verbose_name='Период'
+                    ),
+                ),
+                ('start', models.DateTimeField(verbose_name='Начало периода')),
+                ('revenue', models.DecimalField(decimal_places=2, default=0, max_digits=12, verbose_name='Выручка')),
+                ('orders_count', models.IntegerField(default=0, verbose_name='Количество оплаченных заказов')),
+            ],
+            options={
+                'verbose_name': 'Выручка за период',
+                'verbose_name_plural': 'Журнал выручки',
+                'ordering': ['period', 'start'],
+                'constraints': [
+                    models.UniqueConstraint(fields=('period', 'start'), name='unique_revenue_bucket_period_start')
+                ],
+            },
+        ),
+        migrations.RunPython(backfill_revenue, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,69 @@
+# Generated by Django 5.1.5 on 2026-10-18 12:13
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dishes', '0001_initial'),
+        ('orders', '0004_order_paid_at_revenue_bucket'),
+        ('tables', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DishDailySales',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField(verbose_name='День')),
+                ('quantity', models.IntegerField(default=0, verbose_name='Количество порций')),
+                ('revenue', models.DecimalField(decimal_places=2, default=0, max_digits=12, verbose_name='Выручка')),
+                ('orders_count', models.IntegerField(default=0, verbose_name='Количество заказов')),
+                (
+                    'dish',
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name='daily_sales',
+                        to='dishes.dish',
+                        verbose_name='Блюдо',
+                    ),
+                ),
+            ],
+            options={
+                'verbose_name': 'Продажи блюда за день',
+                'verbose_name_plural': 'Продажи блюд по дням',
+                'ordering': ['day', 'dish'],
+                'constraints': [
+                    models.UniqueConstraint(fields=('day', 'dish'), name='unique_dish_daily_sales_day_dish')
+                ],
+            },
+        ),
+        migrations.CreateModel(
+            name='TableDailySales',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField(verbose_name='День')),
+                ('revenue', models.DecimalField(decimal_places=2, default=0, max_digits=12, verbose_name='Выручка')),
+                ('orders_count', models.IntegerField(default=0, verbose_name='Количество заказов')),
+                (
+                    'table',
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name='daily_sales',
+                        to='tables.table',
+                        verbose_name='Стол',
+                    ),
+                ),
+            ],
+            options={
+                'verbose_name': 'Выручка стола за день',
+                'verbose_name_plural': 'Выручка столов по дням',
+                'ordering': ['day', 'table'],
+                'constraints': [
+                    models.UniqueConstraint(fields=('day', 'table'), name='unique_table_daily_sales_day_table')
+                ],
+            },
+        ),
+    ]
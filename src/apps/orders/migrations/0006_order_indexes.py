@@ -0,0 +1,42 @@
+# Generated by Django 5.1.5 on 2026-10-18 12:17
+
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+
+import core.operations
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('dishes', '0001_initial'),
+        ('orders', '0005_dish_table_daily_sales'),
+        ('tables', '0001_initial'),
+    ]
+
+    operations = [
+        core.operations.AddIndexConcurrently(
+            model_name='order',
+            index=models.Index(fields=['-created', 'id'], name='order_created_id_idx'),
+        ),
+        core.operations.AddIndexConcurrently(
+            model_name='order',
+            index=models.Index(fields=['status', '-created'], name='order_status_created_idx'),
+        ),
+        core.operations.AddIndexConcurrently(
+            model_name='order',
+            index=models.Index(fields=['table', 'status', '-created'], name='order_table_status_created_idx'),
+        ),
+        core.operations.AddIndexConcurrently(
+            model_name='order',
+            index=models.Index(fields=['status', 'paid_at'], name='order_status_paid_at_idx'),
+        ),
+        core.operations.AddIndexConcurrently(
+            model_name='order',
+            index=django.contrib.postgres.indexes.BrinIndex(
+                autosummarize=True, fields=['created'], name='order_created_brin'
+            ),
+        ),
+    ]
@@ -1,8 +1,25 @@
-from django.db import models
+import threading
+from collections.abc import Iterable
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from typing import Any
+
+from django.contrib.postgres.indexes import BrinIndex
+from django.db import models, router, transaction
+from django.db.models import Count, F, Max, OuterRef, Subquery, Sum, Value
+from django.db.models.functions import Coalesce, TruncDate
+from django.utils import timezone
 
 from apps.dishes.models import Dish
+from apps.orders.data_types import OrderEventType
+from apps.orders.shifts import get_day_start, get_hour_start, get_shift_start
 from apps.tables.models import Table
-from core.models import TimestampedModel
+from core.events import broker
+from core.models import RollupModel, TimestampedModel
+
+# Канал событий заказов и приоритет событий: из нескольких событий заказа за транзакцию публикуется одно.
+ORDERS_CHANNEL = 'orders'
+EVENT_PRIORITY = [OrderEventType.STATUS, OrderEventType.UPDATED, OrderEventType.CREATED, OrderEventType.DELETED]
 
 
 class OrderStatus(models.TextChoices):
@@ -11,6 +28,138 @@ class OrderStatus(models.TextChoices):
     PAID = 'paid', 'Оплачено'
 
 
+class PendingTotalPrices(threading.local):
+    """Заказы текущего потока, общая стоимость которых должна быть пересчитана после коммита транзакции."""
+
+    def __init__(self) -> None:
+        self.order_ids: set[int] = set()
+
+
+pending_total_prices = PendingTotalPrices()
+
+
+class PendingOrderEvents(threading.local):
+    """События заказов текущего потока, которые должны быть опубликованы после коммита транзакции."""
+
+    def __init__(self) -> None:
+        self.events: dict[int, OrderEventType] = {}
+
+
+pending_order_events = PendingOrderEvents()
+
+
+class OrderQuerySet(models.QuerySet):
+    def get_change_marker(self) -> tuple[int, datetime | None]:
+        """
+        Возвращает количество заказов выборки и время последнего изменения ее данных одним запросом.
+
+        Время последнего изменения — наибольшее из `updated` заказов выборки, блюд и столов, так как
+        представление заказа включает блюда и столы. Удаление заказа уменьшает количество, а любое
+        изменение, которое могло бы его компенсировать (создание заказа или его попадание в выборку),
+        увеличивает время последнего изменения; удаление блюда или стола каскадно меняет заказы.
+        """
+        marker = self.order_by().aggregate(
+            count=Count('pk'),
+            updated=Max('updated'),
+            dishes_updated=Max(Subquery(Dish.objects.order_by('-updated').values('updated')[:1])),
+            tables_updated=Max(Subquery(Table.objects.order_by('-updated').values('updated')[:1])),
+        )
+        updated = [marker[name] for name in ('updated', 'dishes_updated', 'tables_updated') if marker[name]]
+        return marker['count'], max(updated, default=None)
+
+    def update_total_price(self) -> int:
+        """
+        Пересчитывает общую стоимость заказов выборки одним запросом
+        `UPDATE ... SET total_price = (SELECT SUM(unit_price * quantity) ...)`.
+
+        Если среди заказов есть оплаченные, изменение их стоимости отражается в журнале выручки
+        и в дневной статистике по столам, а дневная статистика по блюдам за дни их оплаты пересчитывается
+        в той же транзакции.
+
+        :return: Количество обновленных заказов.
+        """
+        line_totals = (
+            OrderItem.objects.filter(order=OuterRef('pk'))
+            .order_by()
+            .values('order')
+            .annotate(total=OrderItem.total_price_expression())
+            .values('total')
+        )
+        with transaction.atomic(using=self.db):
+            paid_orders = {
+                pk: (paid_at, table_id, total_price)
+                for pk, paid_at, table_id, total_price in self.filter(status=OrderStatus.PAID, paid_at__isnull=False)
+                .select_for_update()
+                .values_list('pk', 'paid_at', 'table_id', 'total_price')
+            }
+            rows = self.update(
+                total_price=Coalesce(
+                    Subquery(line_totals),
+                    Value(Decimal(0)),
+                    output_field=models.DecimalField(max_digits=10, decimal_places=2),
+                ),
+                updated=timezone.now(),
+            )
+            if paid_orders:
+                new_totals = Order.objects.using(self.db).filter(pk__in=paid_orders).values_list('pk', 'total_price')
+                for pk, total_price in new_totals:
+                    paid_at, table_id, previous_total_price = paid_orders[pk]
+                    if total_price != previous_total_price:
+                        revenue = total_price - previous_total_price
+                        RevenueBucket.record(paid_at, revenue, 0, using=self.db)
+                        TableDailySales.record(paid_at, table_id, revenue, 0, using=self.db)
+                days = {timezone.localdate(paid_at) for paid_at, _, _ in paid_orders.values()}
+                for day in days:
+                    DishDailySales.rebuild(day, day, using=self.db)
+        return rows
+
+
+class OrderItemQuerySet(models.QuerySet):
+    """
+    QuerySet позиций заказа, который отмечает затронутые заказы для пересчета общей стоимости
+    в массовых операциях, не отправляющих сигналы `post_save`.
+    """
+
+    price_fields = {'order', 'order_id', 'quantity', 'unit_price'}
+
+    def bulk_create(self, objs: Iterable['OrderItem'], *args: Any, **kwargs: Any) -> list['OrderItem']:
+        objs = super().bulk_create(objs, *args, **kwargs)
+        Order.schedule_total_price_update((obj.order_id for obj in objs), using=self.db)
+        return objs
+
+    def bulk_update(self, objs: Iterable['OrderItem'], fields: Iterable[str], *args: Any, **kwargs: Any) -> int:
+        objs, fields = list(objs), list(fields)
+        rows = super().bulk_update(objs, fields, *args, **kwargs)
+        if self.price_fields.intersection(fields):
+            Order.schedule_total_price_update((obj.order_id for obj in objs), using=self.db)
+        return rows
+
+    def bulk_delete(self, objs: Iterable['OrderItem']) -> int:
+        """
+        Удаляет переданные позиции одним запросом `DELETE ... WHERE id IN (...)`.
+
+        Объекты не загружаются повторно и сигналы `post_delete` не отправляются,
+        поэтому заказы этих позиций отмечаются для пересчета здесь же.
+        """
+        objs = list(objs)
+        if not objs:
+            return 0
+        rows = self.filter(pk__in=[obj.pk for obj in objs])._raw_delete(self.db)  # type: ignore[attr-defined]
+        Order.schedule_total_price_update((obj.order_id for obj in objs), using=self.db)
+        return rows
+
+    def update(self, **kwargs: Any) -> int:
+        if not self.price_fields.intersection(kwargs):
+            return super().update(**kwargs)
+        order_ids = set(self.values_list('order_id', flat=True))
+        new_order = kwargs.get('order', kwargs.get('order_id'))
+        if new_order is not None:
+            order_ids.add(getattr(new_order, 'pk', new_order))
+        rows = super().update(**kwargs)
+        Order.schedule_total_price_update(order_ids, using=self.db)
+        return rows
+
+
 class Order(TimestampedModel):
     """Модель, представляющая заказ в ресторане."""
 
@@ -36,19 +185,184 @@ class Order(TimestampedModel):
         choices=OrderStatus.choices,
         default=OrderStatus.PENDING,
     )
+    paid_at = models.DateTimeField(
+        verbose_name='Дата оплаты',
+        null=True,
+        blank=True,
+    )
+
+    objects = OrderQuerySet.as_manager()
 
     class Meta:
         verbose_name = 'Заказ'
         verbose_name_plural = 'Заказы'
         ordering = ['-created']
+        indexes = [
+            models.Index(fields=['-created', 'id'], name='order_created_id_idx'),
+            models.Index(fields=['status', '-created'], name='order_status_created_idx'),
+            models.Index(fields=['table', 'status', '-created'], name='order_table_status_created_idx'),
+            models.Index(fields=['status', 'paid_at'], name='order_status_paid_at_idx'),
+            BrinIndex(fields=['created'], name='order_created_brin', autosummarize=True),
+        ]
 
     def __str__(self) -> str:
         return f'Заказ №{self.id} для стола {self.table.number}'
 
+    def save(self, *args: Any, **kwargs: Any) -> None:
+        """
+        Сохраняет заказ и отражает переход в статус "оплачено" и обратно в журнале выручки и дневной статистике.
+
+        При переходе в статус "оплачено" фиксируется время оплаты, при выходе из него оно сбрасывается.
+        Текущее состояние заказа блокируется (`SELECT ... FOR UPDATE`), поэтому одновременные изменения
+        статуса не приводят к двойному учету выручки.
+        """
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'status' not in update_fields:
+            return super().save(*args, **kwargs)
+        using = kwargs.get('using') or router.db_for_write(Order, instance=self)
+        with transaction.atomic(using=using):
+            previous = None
+            if self.pk is not None and not self._state.adding:
+                previous = (
+                    Order.objects.using(using)
+                    .select_for_update()
+                    .filter(pk=self.pk)
+                    .values('status', 'paid_at', 'table_id', 'total_price')
+                    .first()
+                )
+            was_paid = previous is not None and previous['status'] == OrderStatus.PAID
+            is_paid = self.status == OrderStatus.PAID
+            if is_paid and not was_paid:
+                self.paid_at = timezone.now()
+            elif not is_paid:
+                self.paid_at = None
+            elif previous is not None:
+                self.paid_at = previous['paid_at']
+            if update_fields is not None:
+                kwargs['update_fields'] = {*update_fields, 'paid_at'}
+            super().save(*args, **kwargs)
+
+            saves_total_price = update_fields is None or 'total_price' in update_fields
+            total_price = self.total_price if saves_total_price or previous is None else previous['total_price']
+            if (
+                was_paid
+                and is_paid
+                and previous is not None
+                and previous['total_price'] == total_price
+                and previous['table_id'] == self.table_id
+            ):
+                return
+            if was_paid and previous is not None and previous['paid_at']:
+                Order.record_payment(
+                    self.pk, previous['table_id'], previous['paid_at'], previous['total_price'], -1, using=using
+                )
+            if is_paid and self.paid_at:
+                Order.record_payment(self.pk, self.table_id, self.paid_at, total_price, 1, using=using)
+
+    @staticmethod
+    def record_payment(
+        order_id: int,
+        table_id: int,
+        paid_at: datetime,
+        total_price: Decimal,
+        sign: int,
+        using: str | None = None,
+    ) -> None:
+        """
+        Добавляет (sign=1) или убирает (sign=-1) оплаченный заказ из журнала выручки и дневной статистики.
+
+        Статистика по блюдам строится по текущим позициям заказа в базе.
+        """
+        RevenueBucket.record(paid_at, sign * total_price, sign, using=using)
+        TableDailySales.record(paid_at, table_id, sign * total_price, sign, using=using)
+        DishDailySales.record_order(order_id, paid_at, sign, using=using)
+
     def update_total_price(self) -> None:
-        """Метод для вычисления общей стоимости заказа."""
-        self.total_price = sum([item.total_price for item in self.order_items.all()])
-        self.save()
+        """Метод для немедленного пересчета общей стоимости заказа одним агрегирующим запросом по позициям."""
+        Order.objects.filter(pk=self.pk).update_total_price()
+        self.refresh_from_db(fields=['total_price', 'updated'])
+
+    @staticmethod
+    def schedule_total_price_update(order_ids: Iterable[int | None], using: str | None = None) -> None:
+        """
+        Отмечает заказы для пересчета общей стоимости после коммита текущей транзакции.
+
+        Все отмеченные за транзакцию заказы пересчитываются один раз одним запросом `UPDATE`,
+        сколько бы позиций ни было изменено. Вне транзакции пересчет выполняется сразу.
+        Обработчик регистрируется при каждой отметке, чтобы откат точки сохранения не отменил пересчет.
+        """
+        scheduled_ids = {order_id for order_id in order_ids if order_id is not None}
+        if not scheduled_ids:
+            return
+        pending_total_prices.order_ids.update(scheduled_ids)
+        transaction.on_commit(lambda: Order.flush_total_price_updates(using), using=using)
+        Order.schedule_event(scheduled_ids, OrderEventType.UPDATED, using=using)
+
+    @staticmethod
+    def flush_total_price_updates(using: str | None = None) -> None:
+        """Пересчитывает общую стоимость всех отмеченных заказов."""
+        order_ids, pending_total_prices.order_ids = pending_total_prices.order_ids, set()
+        if order_ids:
+            Order.objects.using(using).filter(pk__in=order_ids).update_total_price()
+
+    def to_event_data(self) -> dict:
+        """Компактное представление заказа для событий: номер стола и позиции в виде пар [блюдо, количество]."""
+        return {
+            'id': self.pk,
+            'table': self.table.number,
+            'status': self.status,
+            'total_price': str(self.total_price),
+            'items': [[item.dish.name, item.quantity] for item in self.order_items.all()],
+        }
+
+    @staticmethod
+    def schedule_event(order_ids: Iterable[int], event_type: OrderEventType, using: str | None = None) -> None:
+        """
+        Отмечает событие заказов для публикации в канал 'orders' после коммита текущей транзакции.
+
+        Из нескольких событий заказа за транзакцию публикуется одно, с наибольшим приоритетом: удаление,
+        создание, изменение, смена статуса. Вне транзакции событие публикуется сразу.
+        """
+        events = pending_order_events.events
+        for order_id in order_ids:
+            current = events.get(order_id)
+            if current is None or EVENT_PRIORITY.index(event_type) > EVENT_PRIORITY.index(current):
+                events[order_id] = event_type
+        transaction.on_commit(lambda: Order.publish_events(using), using=using)
+
+    @staticmethod
+    def publish_events(using: str | None = None) -> None:
+        """
+        Публикует отмеченные события заказов.
+
+        Отложенный пересчет общей стоимости выполняется до публикации, чтобы события содержали актуальные
+        суммы. Содержимое событий берется из базы после коммита, поэтому события откатившихся изменений
+        не публикуются: например, удаление заказа, который все еще существует. Если подписчиков нет,
+        события отбрасываются без запросов к базе.
+        """
+        Order.flush_total_price_updates(using)
+        events, pending_order_events.events = pending_order_events.events, {}
+        if not events or not broker.has_subscribers():
+            return
+        orders = Order.objects.using(using).filter(pk__in=events)
+        statuses = dict(orders.values_list('pk', 'status'))
+        full_ids = [pk for pk, event_type in events.items() if pk in statuses and event_type != OrderEventType.STATUS]
+        full_orders = {
+            order.pk: order
+            for order in orders.filter(pk__in=full_ids).select_related('table').prefetch_related('order_items__dish')
+        }
+        for order_id, event_type in sorted(events.items()):
+            if event_type == OrderEventType.DELETED:
+                if order_id in statuses:
+                    continue
+                message: dict = {'type': event_type, 'id': order_id}
+            elif order_id not in statuses:
+                continue
+            elif event_type == OrderEventType.STATUS:
+                message = {'type': event_type, 'id': order_id, 'status': statuses[order_id]}
+            else:
+                message = {'type': event_type, 'order': full_orders[order_id].to_event_data()}
+            broker.publish(ORDERS_CHANNEL, message)
 
 
 class OrderItem(TimestampedModel):
@@ -70,11 +384,32 @@ class OrderItem(TimestampedModel):
         verbose_name='Количество',
         default=1,
     )
+    unit_price = models.DecimalField(
+        verbose_name='Цена за единицу',
+        max_digits=10,
+        decimal_places=2,
+        blank=True,
+        help_text='Цена блюда на момент добавления позиции в заказ.',
+    )
+
+    objects = OrderItemQuerySet.as_manager()
 
     @property
-    def total_price(self):
+    def total_price(self) -> Decimal:
         """Метод для вычисления общей стоимости блюда в заказе."""
-        return self.dish.price * self.quantity
+        return self.unit_price * self.quantity
+
+    @staticmethod
+    def total_price_expression(prefix: str = '') -> Sum:
+        """
+        Возвращает SQL-выражение суммы стоимости позиций `SUM(unit_price * quantity)`.
+
+        :param prefix: Путь до позиций заказа, например 'order_items__' при агрегации по заказам.
+        """
+        return Sum(
+            F(f'{prefix}unit_price') * F(f'{prefix}quantity'),
+            output_field=models.DecimalField(max_digits=10, decimal_places=2),
+        )
 
     class Meta:
         verbose_name = 'Позиция заказа'
@@ -83,3 +418,280 @@ class OrderItem(TimestampedModel):
 
     def __str__(self) -> str:
         return f'{self.dish.name} (x{self.quantity})'
+
+    def save(self, *args: Any, **kwargs: Any) -> None:
+        """Фиксирует текущую цену блюда, если цена позиции еще не задана."""
+        if self.unit_price is None:
+            self.unit_price = self.dish.price
+        super().save(*args, **kwargs)
+
+
+class RevenuePeriod(models.TextChoices):
+    HOUR = 'hour', 'Час'
+    SHIFT = 'shift', 'Смена'
+
+
+class RevenueBucket(RollupModel):
+    """
+    Журнал выручки: накопленная выручка и количество оплаченных заказов за час или за смену.
+
+    Обновляется в той же транзакции, в которой заказ переходит в статус "оплачено" или выходит из него,
+    а также при изменении стоимости или удалении оплаченного заказа. Выручка за период читается
+    одним запросом по уникальному индексу (period, start).
+    """
+
+    period = models.CharField(
+        verbose_name='Период',
+        max_length=5,
+        choices=RevenuePeriod.choices,
+    )
+    start = models.DateTimeField(
+        verbose_name='Начало периода',
+    )
+    revenue = models.DecimalField(
+        verbose_name='Выручка',
+        max_digits=12,
+        decimal_places=2,
+        default=0,
+    )
+    orders_count = models.IntegerField(
+        verbose_name='Количество оплаченных заказов',
+        default=0,
+    )
+
+    class Meta:
+        verbose_name = 'Выручка за период'
+        verbose_name_plural = 'Журнал выручки'
+        ordering = ['period', 'start']
+        constraints = [
+            models.UniqueConstraint(fields=['period', 'start'], name='unique_revenue_bucket_period_start'),
+        ]
+
+    def __str__(self) -> str:
+        return f'{self.get_period_display()} с {self.start:%d.%m.%Y %H:%M}: {self.revenue}'
+
+    @classmethod
+    def record(cls, paid_at: datetime, revenue: Decimal, orders_count: int, using: str | None = None) -> None:
+        """
+        Добавляет выручку и количество заказов к часу и смене, в которые был оплачен заказ.
+
+        :param paid_at: Время оплаты заказа.
+        :param revenue: Изменение выручки (отрицательное при отмене оплаты).
+        :param orders_count: Изменение количества оплаченных заказов.
+        """
+        deltas = {'revenue': revenue, 'orders_count': orders_count}
+        cls.increment({'period': RevenuePeriod.HOUR, 'start': get_hour_start(paid_at)}, deltas, using)
+        cls.increment({'period': RevenuePeriod.SHIFT, 'start': get_shift_start(paid_at)}, deltas, using)
+
+    @classmethod
+    def rebuild(cls, start: datetime, end: datetime, using: str | None = None) -> int:
+        """
+        Перестраивает журнал выручки по заказам, оплаченным в интервале [start, end).
+
+        Границы интервала должны совпадать с началами смен, чтобы смены не перестраивались частично.
+
+        :return: Количество созданных строк журнала.
+        """
+        cls.objects.using(using).filter(start__gte=start, start__lt=end).delete()
+        buckets: dict[tuple[str, datetime], list] = {}
+        paid_orders = Order.objects.using(using).filter(
+            status=OrderStatus.PAID,
+            paid_at__gte=start,
+            paid_at__lt=end,
+        )
+        for paid_at, total_price in paid_orders.values_list('paid_at', 'total_price').iterator():
+            for key in ((RevenuePeriod.HOUR, get_hour_start(paid_at)), (RevenuePeriod.SHIFT, get_shift_start(paid_at))):
+                bucket = buckets.setdefault(key, [Decimal(0), 0])
+                bucket[0] += total_price
+                bucket[1] += 1
+        created = RevenueBucket.objects.using(using).bulk_create(
+            [
+                RevenueBucket(period=period, start=bucket_start, revenue=revenue, orders_count=orders_count)
+                for (period, bucket_start), (revenue, orders_count) in buckets.items()
+            ],
+            batch_size=1000,
+        )
+        return len(created)
+
+
+class DishDailySales(RollupModel):
+    """
+    Дневная статистика продаж блюда по оплаченным заказам: количество порций, выручка и количество заказов.
+
+    Обновляется в той же транзакции, в которой заказ переходит в статус "оплачено" или выходит из него.
+    День определяется по локальной дате оплаты заказа.
+    """
+
+    day = models.DateField(
+        verbose_name='День',
+    )
+    dish = models.ForeignKey(
+        Dish,
+        on_delete=models.CASCADE,
+        verbose_name='Блюдо',
+        related_name='daily_sales',
+    )
+    quantity = models.IntegerField(
+        verbose_name='Количество порций',
+        default=0,
+    )
+    revenue = models.DecimalField(
+        verbose_name='Выручка',
+        max_digits=12,
+        decimal_places=2,
+        default=0,
+    )
+    orders_count = models.IntegerField(
+        verbose_name='Количество заказов',
+        default=0,
+    )
+
+    class Meta:
+        verbose_name = 'Продажи блюда за день'
+        verbose_name_plural = 'Продажи блюд по дням'
+        ordering = ['day', 'dish']
+        constraints = [
+            models.UniqueConstraint(fields=['day', 'dish'], name='unique_dish_daily_sales_day_dish'),
+        ]
+
+    def __str__(self) -> str:
+        return f'{self.day:%d.%m.%Y}, блюдо №{self.dish_id}: {self.quantity} шт.'
+
+    @classmethod
+    def record_order(cls, order_id: int, paid_at: datetime, sign: int, using: str | None = None) -> None:
+        """Добавляет (sign=1) или убирает (sign=-1) позиции заказа из статистики за день оплаты."""
+        day = timezone.localdate(paid_at)
+        lines = (
+            OrderItem.objects.using(using)
+            .filter(order_id=order_id)
+            .order_by()
+            .values('dish_id')
+            .annotate(total_quantity=Sum('quantity'), total_revenue=OrderItem.total_price_expression())
+        )
+        for line in lines:
+            cls.increment(
+                {'day': day, 'dish_id': line['dish_id']},
+                {
+                    'quantity': sign * line['total_quantity'],
+                    'revenue': sign * line['total_revenue'],
+                    'orders_count': sign,
+                },
+                using,
+            )
+
+    @classmethod
+    def rebuild(cls, day_from: date, day_to: date, using: str | None = None) -> int:
+        """
+        Перестраивает статистику за дни с `day_from` по `day_to` включительно по оплаченным заказам.
+
+        :return: Количество созданных строк статистики.
+        """
+        cls.objects.using(using).filter(day__gte=day_from, day__lte=day_to).delete()
+        rows = (
+            OrderItem.objects.using(using)
+            .filter(
+                order__status=OrderStatus.PAID,
+                order__paid_at__gte=get_day_start(day_from),
+                order__paid_at__lt=get_day_start(day_to + timedelta(days=1)),
+            )
+            .annotate(day=TruncDate('order__paid_at'))
+            .order_by()
+            .values('day', 'dish_id')
+            .annotate(
+                total_quantity=Sum('quantity'),
+                total_revenue=OrderItem.total_price_expression(),
+                total_orders=Count('order_id', distinct=True),
+            )
+        )
+        sales = [
+            DishDailySales(
+                day=row['day'],
+                dish_id=row['dish_id'],
+                quantity=row['total_quantity'],
+                revenue=row['total_revenue'],
+                orders_count=row['total_orders'],
+            )
+            for row in rows
+        ]
+        created = DishDailySales.objects.using(using).bulk_create(sales, batch_size=1000)
+        return len(created)
+
+
+class TableDailySales(RollupModel):
+    """
+    Дневная статистика выручки стола по оплаченным заказам.
+
+    Обновляется в той же транзакции, в которой заказ переходит в статус "оплачено" или выходит из него,
+    а также при изменении стоимости оплаченного заказа. День определяется по локальной дате оплаты заказа.
+    """
+
+    day = models.DateField(
+        verbose_name='День',
+    )
+    table = models.ForeignKey(
+        Table,
+        on_delete=models.CASCADE,
+        verbose_name='Стол',
+        related_name='daily_sales',
+    )
+    revenue = models.DecimalField(
+        verbose_name='Выручка',
+        max_digits=12,
+        decimal_places=2,
+        default=0,
+    )
+    orders_count = models.IntegerField(
+        verbose_name='Количество заказов',
+        default=0,
+    )
+
+    class Meta:
+        verbose_name = 'Выручка стола за день'
+        verbose_name_plural = 'Выручка столов по дням'
+        ordering = ['day', 'table']
+        constraints = [
+            models.UniqueConstraint(fields=['day', 'table'], name='unique_table_daily_sales_day_table'),
+        ]
+
+    def __str__(self) -> str:
+        return f'{self.day:%d.%m.%Y}, стол №{self.table_id}: {self.revenue}'
+
+    @classmethod
+    def record(
+        cls, paid_at: datetime, table_id: int, revenue: Decimal, orders_count: int, using: str | None = None
+    ) -> None:
+        """Добавляет выручку и количество заказов стола за день оплаты."""
+        keys = {'day': timezone.localdate(paid_at), 'table_id': table_id}
+        cls.increment(keys, {'revenue': revenue, 'orders_count': orders_count}, using)
+
+    @classmethod
+    def rebuild(cls, day_from: date, day_to: date, using: str | None = None) -> int:
+        """
+        Перестраивает статистику за дни с `day_from` по `day_to` включительно по оплаченным заказам.
+
+        :return: Количество созданных строк статистики.
+        """
+        cls.objects.using(using).filter(day__gte=day_from, day__lte=day_to).delete()
+        rows = (
+            Order.objects.using(using)
+            .filter(
+                status=OrderStatus.PAID,
+                paid_at__gte=get_day_start(day_from),
+                paid_at__lt=get_day_start(day_to + timedelta(days=1)),
+            )
+            .annotate(day=TruncDate('paid_at'))
+            .order_by()
+            .values('day', 'table_id')
+            .annotate(total_revenue=Sum('total_price'), total_orders=Count('id'))
+        )
+        sales = [
+            TableDailySales(
+                day=row['day'],
+                table_id=row['table_id'],
+                revenue=row['total_revenue'],
+                orders_count=row['total_orders'],
+            )
+            for row in rows
+        ]
+        created = TableDailySales.objects.using(using).bulk_create(sales, batch_size=1000)
+        return len(created)
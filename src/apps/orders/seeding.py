@@ -0,0 +1,320 @@
+import csv
+import io
+import multiprocessing
+import random
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, replace
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from itertools import islice
+from typing import Any
+
+from django.core.management.color import no_style
+from django.db import connections, models, transaction
+from django.db.models import Max
+from django.utils import timezone
+
+from apps.dishes.models import Dish
+from apps.orders.models import Order, OrderItem, OrderStatus
+from apps.orders.shifts import get_day_start
+from apps.tables.models import Table
+
+# Доли заказов по часам рабочего дня (10:00–21:59) с пиками в обед и вечером.
+HOUR_WEIGHTS = {10: 2, 11: 4, 12: 8, 13: 9, 14: 6, 15: 3, 16: 3, 17: 5, 18: 9, 19: 10, 20: 7, 21: 4}
+# Распределение статусов: давние заказы почти все оплачены, свежие еще в работе.
+OLD_STATUS_WEIGHTS = {OrderStatus.PAID: 93, OrderStatus.READY: 4, OrderStatus.PENDING: 3}
+RECENT_STATUS_WEIGHTS = {OrderStatus.PAID: 40, OrderStatus.READY: 25, OrderStatus.PENDING: 35}
+RECENT_ORDER_AGE = timedelta(hours=6)
+QUANTITY_WEIGHTS = {1: 80, 2: 15, 3: 5}
+
+ORDER_FIELDS = ['id', 'created', 'updated', 'table_id', 'total_price', 'status', 'paid_at']
+ORDER_ITEM_FIELDS = ['created', 'updated', 'order_id', 'dish_id', 'quantity', 'unit_price']
+
+
+def chunked(rows: Iterable[Any], size: int) -> Iterator[list[Any]]:
+    iterator = iter(rows)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def insert_rows(model: type[models.Model], field_names: list[str], rows: list[tuple], using: str) -> None:
+    """
+    Вставляет строки многострочными `INSERT` в обход `save()` и `bulk_create`.
+
+    В отличие от `bulk_create`, значения полей с `auto_now_add`/`auto_now` не заменяются текущим временем.
+    Значения дат и денежных сумм приводятся к формату базы так же, как это делает ORM.
+    """
+    connection = connections[using]
+    fields: list[models.Field] = [model._meta.get_field(name) for name in field_names]  # type: ignore[misc]
+    columns = ', '.join(connection.ops.quote_name(model_field.column) for model_field in fields)
+    adapters: list[Callable | None] = []
+    for model_field in fields:
+        if isinstance(model_field, models.DateTimeField):
+            adapters.append(connection.ops.adapt_datetimefield_value)
+        elif isinstance(model_field, models.DecimalField):
+            adapters.append(connection.ops.adapt_decimalfield_value)
+        else:
+            adapters.append(None)
+    placeholders = f'({", ".join(["%s"] * len(fields))})'
+    rows_per_statement = min(1000, connection.ops.bulk_batch_size(fields, rows) or len(rows))
+    with connection.cursor() as cursor:
+        for chunk in chunked(rows, rows_per_statement):
+            params = [
+                adapter(value) if adapter is not None and value is not None else value
+                for row in chunk
+                for adapter, value in zip(adapters, row)
+            ]
+            values = ', '.join([placeholders] * len(chunk))
+            cursor.execute(f'INSERT INTO {model._meta.db_table} ({columns}) VALUES {values}', params)
+
+
+def to_copy_buffer(rows: list[tuple]) -> io.StringIO:
+    """Записывает строки в CSV для `COPY ... FROM STDIN`: NULL — пустое значение без кавычек."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator='\n')
+    writer.writerows(rows)
+    buffer.seek(0)
+    return buffer
+
+
+def copy_rows(model: type[models.Model], field_names: list[str], rows: list[tuple], using: str) -> None:
+    """Загружает строки в таблицу командой PostgreSQL `COPY`, которая быстрее многострочных `INSERT`."""
+    connection = connections[using]
+    fields: list[models.Field] = [model._meta.get_field(name) for name in field_names]  # type: ignore[misc]
+    columns = ', '.join(connection.ops.quote_name(model_field.column) for model_field in fields)
+    sql = f'COPY {connection.ops.quote_name(model._meta.db_table)} ({columns}) FROM STDIN WITH (FORMAT csv)'
+    with connection.cursor() as cursor:
+        if hasattr(cursor.cursor, 'copy_expert'):
+            cursor.cursor.copy_expert(sql, to_copy_buffer(rows))
+        else:
+            with cursor.cursor.copy(sql) as copy:
+                copy.write(to_copy_buffer(rows).getvalue())
+
+
+def insert_batches(config: 'SeedConfig', using: str, method: str, first_order_id: int, batch_numbers: range) -> int:
+    """Точка входа процесса параллельной генерации: вставляет пакеты `batch_numbers`."""
+    try:
+        seeder = DataSeeder(config, using, method)
+        catalog = seeder.load_catalog()
+        return sum(seeder.insert_batch(batch_number, first_order_id, catalog) for batch_number in batch_numbers)
+    finally:
+        connections.close_all()
+
+
+@dataclass
+class SeedConfig:
+    """
+    Параметры генерации данных.
+
+    Атрибуты:
+        tables (int): Количество столов.
+        dishes (int): Количество блюд.
+        orders (int): Количество заказов.
+        avg_items (int): Среднее количество позиций в заказе.
+        days (int): За сколько дней до `end` распределяются заказы.
+        seed (int): Зерно генератора: одинаковые параметры дают одинаковые данные.
+        batch_size (int): Количество заказов, генерируемых и вставляемых за один раз.
+        end (datetime | None): Момент, до которого создаются заказы (по умолчанию — текущее время).
+    """
+
+    tables: int = 1000
+    dishes: int = 500
+    orders: int = 1_000_000
+    avg_items: int = 5
+    days: int = 90
+    seed: int = 0
+    batch_size: int = 10_000
+    end: datetime | None = field(default=None)
+
+
+@dataclass
+class Catalog:
+    table_ids: list[int]
+    dish_ids: list[int]
+    dish_prices: list[Decimal]
+    dish_weights: list[float]
+
+
+class DataSeeder:
+    """
+    Генератор больших объемов правдоподобных данных: столы, блюда, заказы и их позиции.
+
+    Заказы генерируются пакетами по `batch_size`; каждый пакет использует собственный генератор
+    случайных чисел, инициализированный зерном и номером пакета, поэтому результат не зависит
+    от порядка генерации пакетов. Идентификаторы заказов задаются явно, начиная с `first_order_id`.
+
+    Распределения:
+        - время создания — случайный день из последних `days` дней, час — с пиками в обед и вечером;
+        - статусы — давние заказы в основном оплачены, заказы последних часов еще в работе;
+        - блюда — популярность убывает с номером блюда, количество позиций в среднем `avg_items`;
+        - цена позиции — снимок цены блюда; в первой половине периода блюда стоили на 10% дешевле.
+    """
+
+    methods = ('auto', 'insert', 'copy')
+
+    def __init__(self, config: SeedConfig, using: str = 'default', method: str = 'auto') -> None:
+        self.config = config if config.end else replace(config, end=timezone.now())
+        self.end: datetime = self.config.end  # type: ignore[assignment]
+        self.using = using
+        is_postgresql = connections[using].vendor == 'postgresql'
+        if method == 'copy' and not is_postgresql:
+            raise ValueError('Загрузка через COPY доступна только для PostgreSQL.')
+        self.use_copy = method == 'copy' or (method == 'auto' and is_postgresql)
+        self.method = method
+
+    def get_random(self, *parts: object) -> random.Random:
+        return random.Random(':'.join(map(str, (self.config.seed, *parts))))
+
+    def load_catalog(self) -> Catalog:
+        """Загружает существующие столы и блюда в порядке id."""
+        return self.get_catalog(
+            list(Table.objects.using(self.using).order_by('id')),
+            list(Dish.objects.using(self.using).order_by('id')),
+        )
+
+    def seed_catalog(self) -> Catalog:
+        """
+        Создает столы и блюда с номерами и названиями, продолжающими уже существующие.
+
+        Заказы генерируются по всему справочнику, включая ранее созданные столы и блюда.
+        """
+        rng = self.get_random('catalog')
+        first_number = (Table.objects.using(self.using).aggregate(number=Max('number'))['number'] or 0) + 1
+        Table.objects.using(self.using).bulk_create(
+            [
+                Table(number=number, seats=rng.choice((2, 2, 4, 4, 4, 6, 8)), description=f'Стол {number}')
+                for number in range(first_number, first_number + self.config.tables)
+            ],
+            batch_size=1000,
+        )
+        first_dish = Dish.objects.using(self.using).count() + 1
+        Dish.objects.using(self.using).bulk_create(
+            [
+                Dish(name=f'Блюдо {index}', price=Decimal(rng.randrange(10_000, 200_000)) / 100)
+                for index in range(first_dish, first_dish + self.config.dishes)
+            ],
+            batch_size=1000,
+        )
+        catalog = self.load_catalog()
+        if not catalog.table_ids or not catalog.dish_ids:
+            raise ValueError('Для генерации заказов нужен хотя бы один стол и одно блюдо.')
+        return catalog
+
+    @staticmethod
+    def get_catalog(tables: list[Table], dishes: list[Dish]) -> Catalog:
+        return Catalog(
+            table_ids=[table.pk for table in tables],
+            dish_ids=[dish.pk for dish in dishes],
+            dish_prices=[dish.price for dish in dishes],
+            dish_weights=[1 / (rank + 1) ** 0.8 for rank in range(len(dishes))],
+        )
+
+    def get_first_order_id(self) -> int:
+        return (Order.objects.using(self.using).aggregate(id=Max('id'))['id'] or 0) + 1
+
+    def get_created(self, rng: random.Random) -> datetime:
+        day = timezone.localdate(self.end) - timedelta(days=rng.randrange(self.config.days))
+        hour = rng.choices(list(HOUR_WEIGHTS), weights=list(HOUR_WEIGHTS.values()))[0]
+        created = get_day_start(day) + timedelta(hours=hour, seconds=rng.randrange(3600))
+        return created if created <= self.end else created - timedelta(days=1)
+
+    def generate_batch(self, batch_number: int, first_order_id: int, catalog: Catalog) -> tuple[list, list]:
+        """Генерирует строки заказов и позиций пакета `batch_number`."""
+        rng = self.get_random('orders', batch_number)
+        start = batch_number * self.config.batch_size
+        count = min(self.config.batch_size, self.config.orders - start)
+        price_change = self.end - timedelta(days=self.config.days / 2)
+        max_items = min(len(catalog.dish_ids), 2 * self.config.avg_items - 1)
+        orders, items = [], []
+        for order_id in range(first_order_id + start, first_order_id + start + count):
+            created = self.get_created(rng)
+            weights = OLD_STATUS_WEIGHTS if self.end - created > RECENT_ORDER_AGE else RECENT_STATUS_WEIGHTS
+            status = rng.choices(list(weights), weights=list(weights.values()))[0]
+            paid_at = None
+            if status == OrderStatus.PAID:
+                paid_at = min(created + timedelta(minutes=rng.randint(15, 120)), self.end)
+            updated = paid_at or created + timedelta(minutes=rng.randint(0, 15))
+
+            items_count = max(1, min(max_items, round(rng.triangular(1, max_items, self.config.avg_items))))
+            dish_indexes = set(rng.choices(range(len(catalog.dish_ids)), weights=catalog.dish_weights, k=items_count))
+            total_price = Decimal(0)
+            for dish_index in dish_indexes:
+                unit_price = catalog.dish_prices[dish_index]
+                if created < price_change:
+                    unit_price = (unit_price * Decimal('0.9')).quantize(Decimal('0.01'))
+                quantity = rng.choices(list(QUANTITY_WEIGHTS), weights=list(QUANTITY_WEIGHTS.values()))[0]
+                total_price += unit_price * quantity
+                items.append((created, created, order_id, catalog.dish_ids[dish_index], quantity, unit_price))
+            orders.append((order_id, created, updated, rng.choice(catalog.table_ids), total_price, status, paid_at))
+        return orders, items
+
+    def insert_batch(self, batch_number: int, first_order_id: int, catalog: Catalog) -> int:
+        """Генерирует и вставляет пакет заказов с позициями, возвращает количество заказов."""
+        orders, items = self.generate_batch(batch_number, first_order_id, catalog)
+        write_rows = copy_rows if self.use_copy else insert_rows
+        with transaction.atomic(using=self.using):
+            write_rows(Order, ORDER_FIELDS, orders, self.using)
+            write_rows(OrderItem, ORDER_ITEM_FIELDS, items, self.using)
+        return len(orders)
+
+    @property
+    def batches_count(self) -> int:
+        return -(-self.config.orders // self.config.batch_size)
+
+    def reset_sequences(self) -> None:
+        """Сдвигает последовательности идентификаторов после вставки заказов с явными id."""
+        connection = connections[self.using]
+        statements = connection.ops.sequence_reset_sql(no_style(), [Order])
+        with connection.cursor() as cursor:
+            for statement in statements:
+                cursor.execute(statement)
+
+    def get_days(self) -> tuple[date, date]:
+        """Возвращает первый и последний день, в которые могли быть оплачены сгенерированные заказы."""
+        last_day = timezone.localdate(self.end)
+        return last_day - timedelta(days=self.config.days), last_day
+
+    def analyze(self) -> None:
+        """Обновляет статистику планировщика PostgreSQL после загрузки большого объема данных."""
+        connection = connections[self.using]
+        if connection.vendor != 'postgresql':
+            return
+        with connection.cursor() as cursor:
+            for model in (Table, Dish, Order, OrderItem):
+                cursor.execute(f'ANALYZE {connection.ops.quote_name(model._meta.db_table)}')
+
+    def seed(self, workers: int = 1) -> int:
+        """
+        Создает справочники и все заказы.
+
+        При `workers > 1` пакеты заказов распределяются между процессами; так как каждый пакет генерируется
+        своим генератором случайных чисел, данные не зависят от количества процессов.
+        SQLite не поддерживает параллельную запись, поэтому для нее пакеты всегда вставляются в текущем процессе.
+        """
+        catalog = self.seed_catalog()
+        first_order_id = self.get_first_order_id()
+        if connections[self.using].vendor == 'sqlite':
+            workers = 1
+        workers = max(1, min(workers, self.batches_count))
+        if workers == 1:
+            created = sum(self.insert_batch(number, first_order_id, catalog) for number in range(self.batches_count))
+        else:
+            # Соединения закрываются до создания процессов, чтобы дочерние процессы не унаследовали открытые сокеты.
+            connections.close_all()
+            with ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context('fork')) as pool:
+                futures = [
+                    pool.submit(
+                        insert_batches,
+                        self.config,
+                        self.using,
+                        self.method,
+                        first_order_id,
+                        range(worker, self.batches_count, workers),
+                    )
+                    for worker in range(workers)
+                ]
+                created = sum(future.result() for future in futures)
+        self.reset_sequences()
+        self.analyze()
+        return created
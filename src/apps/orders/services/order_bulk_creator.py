@@ -0,0 +1,127 @@
+import logging
+from dataclasses import dataclass
+from itertools import chain
+
+from django.db import DatabaseError
+from django.db.transaction import atomic
+
+from apps.dishes.caches import dish_cache
+from apps.orders.api.serializers import OrderBulkCreateSerializer, OrderPostSerializer
+from apps.orders.data_types import BulkCreateMode, BulkCreateResult, OrderValidatedData
+from apps.orders.models import Order, OrderItem
+from apps.orders.services.order_creator import OrderCreator
+from apps.tables.caches import table_cache
+from core.services import BaseService
+
+logger = logging.getLogger(__name__)
+
+
+def to_int(value: object) -> int | None:
+    try:
+        return int(value)  # type: ignore[call-overload]
+    except (TypeError, ValueError):
+        return None
+
+
+@dataclass
+class OrderBulkCreator(BaseService):
+    """
+    Сервис для пакетного создания заказов.
+
+    Все заказы валидируются вместе: блюда и столы, на которые ссылаются заказы, загружаются
+    одним запросом на справочник до валидации. Корректные заказы вставляются пакетами
+    по `batch_size`: один `bulk_create` для заказов и один для всех их позиций. Общая стоимость
+    заказов вычисляется по ценам из валидированных данных.
+
+    Режимы:
+        - 'atomic': если хотя бы один заказ некорректен, не создается ни один.
+        - 'best_effort': создаются все корректные заказы; если пакет не удалось сохранить,
+          его заказы сохраняются по одному, чтобы ошибка затронула только проблемный заказ.
+
+    Атрибуты:
+        serializer (OrderBulkCreateSerializer): Валидированный сериализатор пакета заказов.
+    """
+
+    serializer: OrderBulkCreateSerializer
+
+    def get_context(self, orders_data: list[dict]) -> dict:
+        """Загружает все блюда и столы, на которые ссылаются заказы, для валидации без дополнительных запросов."""
+        items = chain.from_iterable(
+            order_data['items'] for order_data in orders_data if isinstance(order_data.get('items'), list)
+        )
+        dish_ids = {to_int(item.get('dish')) for item in items if isinstance(item, dict)}
+        table_numbers = {to_int(order_data.get('table')) for order_data in orders_data}
+        return {
+            'dishes': dish_cache.get_many(dish_ids - {None}),
+            'tables': table_cache.get_many(table_numbers - {None}),
+        }
+
+    def validate_orders(self, orders_data: list[dict]) -> tuple[list[BulkCreateResult], dict[int, OrderValidatedData]]:
+        """Валидирует заказы и возвращает ошибки и валидированные данные по индексам заказов."""
+        context = self.get_context(orders_data)
+        errors, valid = [], {}
+        for index, order_data in enumerate(orders_data):
+            serializer = OrderPostSerializer(data=order_data, context=context)
+            if serializer.is_valid():
+                valid[index] = serializer.validated_data
+            else:
+                errors.append(BulkCreateResult(index=index, status='error', errors=serializer.errors))
+        return errors, valid
+
+    def create_batch(self, batch: dict[int, OrderValidatedData]) -> list[BulkCreateResult]:
+        """Создает пакет заказов двумя запросами `bulk_create`."""
+        built = [OrderCreator.build(data) for data in batch.values()]
+        orders = Order.objects.bulk_create([order for order, _ in built])
+        for order, order_items in built:
+            for order_item in order_items:
+                order_item.order = order
+        OrderItem.objects.bulk_create(chain.from_iterable(order_items for _, order_items in built))
+        return [
+            BulkCreateResult(index=index, status='created', id=order.id, total_price=order.total_price)
+            for index, order in zip(batch, orders)
+        ]
+
+    def create_one_by_one(self, batch: dict[int, OrderValidatedData]) -> list[BulkCreateResult]:
+        """Создает заказы пакета по одному, изолируя ошибки сохранения отдельных заказов."""
+        results = []
+        for index, data in batch.items():
+            try:
+                with atomic():
+                    results.extend(self.create_batch({index: data}))
+            except DatabaseError:
+                logger.exception('Не удалось сохранить заказ %s из пакета', index)
+                errors = {'non_field_errors': ['Не удалось сохранить заказ.']}
+                results.append(BulkCreateResult(index=index, status='error', errors=errors))
+        return results
+
+    def create(self, valid: dict[int, OrderValidatedData], batch_size: int, mode: str) -> list[BulkCreateResult]:
+        """Создает валидные заказы пакетами по `batch_size` в выбранном режиме."""
+        indexes = list(valid)
+        batches = [
+            {index: valid[index] for index in indexes[start : start + batch_size]}
+            for start in range(0, len(indexes), batch_size)
+        ]
+        if mode == BulkCreateMode.ATOMIC:
+            with atomic():
+                return list(chain.from_iterable(self.create_batch(batch) for batch in batches))
+        results = []
+        for batch in batches:
+            try:
+                with atomic():
+                    results.extend(self.create_batch(batch))
+            except DatabaseError:
+                results.extend(self.create_one_by_one(batch))
+        return results
+
+    def act(self) -> list[BulkCreateResult]:
+        """
+        Валидирует и создает заказы.
+
+        :return: Результаты по каждому заказу в порядке их передачи: созданный заказ или ошибки.
+        """
+        data = self.serializer.validated_data
+        errors, valid = self.validate_orders(data['orders'])
+        if errors and data['mode'] == BulkCreateMode.ATOMIC:
+            return errors
+        results = errors + self.create(valid, data['batch_size'], data['mode'])
+        return sorted(results, key=lambda result: result['index'])
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from decimal import Decimal
 
 from django.db.transaction import atomic
 
@@ -23,18 +24,36 @@ class OrderCreator(BaseService):
 
     serializer: OrderPostSerializer
 
+    @staticmethod
+    def build(data: OrderValidatedData) -> tuple[Order, list[OrderItem]]:
+        """
+        Собирает несохраненные объекты заказа и его позиций.
+
+        Цена позиции фиксируется по текущей цене блюда, общая стоимость заказа вычисляется по позициям.
+
+        :param data: Валидированные данные о заказе.
+        :return: Заказ и список его позиций.
+        """
+        order_items = [OrderItem(unit_price=item_data['dish'].price, **item_data) for item_data in data['items']]
+        total_price = sum((item.total_price for item in order_items), Decimal(0))
+        return Order(table=data['table'], total_price=total_price), order_items
+
     def create(self, data: OrderValidatedData) -> Order:
         """
         Создает заказ в базе данных и сохраняет его позиции.
 
+        Общая стоимость сразу вычисляется по ценам из валидированных данных, а после коммита
+        транзакции сверяется с позициями в базе (см. `Order.schedule_total_price_update`).
+
         :param data: Валидированные данные о заказе, содержащие информацию о заказе и позициях.
         :return: Созданный объект заказа.
         """
+        order, order_items = self.build(data)
         with atomic():
-            order = Order.objects.create(table=data['table'])
-            order_items = [OrderItem(order=order, **item_data) for item_data in data['items']]
+            order.save()
+            for order_item in order_items:
+                order_item.order = order
             OrderItem.objects.bulk_create(order_items)
-            order.update_total_price()
         return order
 
     def act(self) -> Order:
@@ -0,0 +1,131 @@
+import csv
+import json
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import QuerySet
+from django.http import StreamingHttpResponse
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+
+from apps.orders.data_types import ExportFormat
+from apps.orders.models import Order, OrderItem
+from core.services import BaseService
+
+
+class Echo:
+    """Псевдо-буфер, который сразу возвращает записанную строку вместо её накопления."""
+
+    def write(self, value: str) -> str:
+        return value
+
+
+@dataclass
+class OrderExporter(BaseService):
+    """
+    Сервис для потоковой выгрузки заказов с позициями в CSV или NDJSON.
+
+    Заказы читаются из базы порциями по `chunk_size` через `iterator()`, позиции и блюда подгружаются
+    одним запросом на порцию. Каждая строка сразу отдается клиенту через `StreamingHttpResponse`,
+    поэтому потребление памяти не зависит от размера выгрузки.
+
+    Атрибуты:
+        queryset (QuerySet): Отфильтрованные заказы для выгрузки.
+        export_format (str): Формат выгрузки ('csv' или 'ndjson').
+        chunk_size (int): Количество заказов, читаемых из базы за один раз.
+    """
+
+    queryset: QuerySet[Order]
+    export_format: str = ExportFormat.CSV
+    chunk_size: int = 2000
+
+    csv_header = (
+        'order_id',
+        'created',
+        'updated',
+        'status',
+        'table_number',
+        'order_total_price',
+        'item_id',
+        'dish_id',
+        'dish_name',
+        'quantity',
+        'unit_price',
+        'item_total_price',
+    )
+    content_types = {
+        ExportFormat.CSV: 'text/csv; charset=utf-8',
+        ExportFormat.NDJSON: 'application/x-ndjson; charset=utf-8',
+    }
+
+    def get_validators(self) -> list[Callable]:
+        return [self.validate_export_format]
+
+    def validate_export_format(self) -> None:
+        if self.export_format not in tuple(ExportFormat):
+            choices = ', '.join(ExportFormat)
+            raise ValidationError({'export_format': f'Допустимые значения: {choices}.'})
+
+    def get_orders(self) -> Iterator[Order]:
+        """Возвращает итератор заказов, читаемых из базы порциями."""
+        queryset = self.queryset.select_related('table').prefetch_related('order_items__dish').order_by('id')
+        return queryset.iterator(chunk_size=self.chunk_size)
+
+    def get_item_row(self, order: Order, item: OrderItem | None) -> tuple:
+        order_row = (
+            order.id,
+            order.created.isoformat(),
+            order.updated.isoformat(),
+            order.status,
+            order.table.number,
+            order.total_price,
+        )
+        if item is None:
+            return order_row + ('',) * 6
+        return order_row + (item.id, item.dish_id, item.dish.name, item.quantity, item.unit_price, item.total_price)
+
+    def iter_csv(self) -> Iterator[str]:
+        """Построчно формирует CSV: одна строка на позицию заказа."""
+        writer = csv.writer(Echo())
+        yield writer.writerow(self.csv_header)
+        for order in self.get_orders():
+            items = order.order_items.all()
+            if not items:
+                yield writer.writerow(self.get_item_row(order, None))
+            for item in items:
+                yield writer.writerow(self.get_item_row(order, item))
+
+    def iter_ndjson(self) -> Iterator[str]:
+        """Построчно формирует NDJSON: один JSON-объект на заказ."""
+        for order in self.get_orders():
+            data = {
+                'id': order.id,
+                'created': order.created,
+                'updated': order.updated,
+                'status': order.status,
+                'table': order.table.number,
+                'total_price': order.total_price,
+                'items': [
+                    {
+                        'id': item.id,
+                        'dish': item.dish_id,
+                        'dish_name': item.dish.name,
+                        'quantity': item.quantity,
+                        'unit_price': item.unit_price,
+                        'total_price': item.total_price,
+                    }
+                    for item in order.order_items.all()
+                ],
+            }
+            yield json.dumps(data, cls=DjangoJSONEncoder, ensure_ascii=False) + '\n'
+
+    def get_filename(self) -> str:
+        return f'orders_{timezone.localtime():%Y%m%d_%H%M%S}.{self.export_format}'
+
+    def act(self) -> StreamingHttpResponse:
+        export_format = ExportFormat(self.export_format)
+        rows = self.iter_csv() if export_format == ExportFormat.CSV else self.iter_ndjson()
+        response = StreamingHttpResponse(rows, content_type=self.content_types[export_format])
+        response['Content-Disposition'] = f'attachment; filename="{self.get_filename()}"'
+        return response
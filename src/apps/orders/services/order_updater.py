@@ -1,9 +1,10 @@
 from dataclasses import dataclass
 
 from django.db.transaction import atomic
+from django.utils import timezone
 
 from apps.orders.api.serializers import OrderPatchSerializer
-from apps.orders.data_types import OrderValidatedData
+from apps.orders.data_types import OrderItemData, OrderValidatedData
 from apps.orders.models import Order, OrderItem
 from core.services import BaseService
 
@@ -19,9 +20,56 @@ class OrderUpdater(BaseService):
 
     Атрибуты:
         serializer (OrderPatchSerializer): Сериализатор для обновления заказа.
+        diff_items (bool): Обновлять только изменившиеся позиции (по умолчанию). Если False,
+            все позиции заказа удаляются и создаются заново.
     """
 
     serializer: OrderPatchSerializer
+    diff_items: bool = True
+
+    def replace_items(self, order: Order, items_data: list[OrderItemData]) -> None:
+        """Удаляет все позиции заказа и создает их заново."""
+        order.order_items.all().delete()
+        order_items = [
+            OrderItem(order=order, unit_price=item_data['dish'].price, **item_data) for item_data in items_data
+        ]
+        OrderItem.objects.bulk_create(order_items)
+
+    def diff_items_update(self, order: Order, items_data: list[OrderItemData]) -> None:
+        """
+        Обновляет позиции заказа по разнице между текущими и переданными позициями.
+
+        Позиции сопоставляются по блюду: у совпавших обновляется количество одним `bulk_update`,
+        новые создаются одним `bulk_create`, отсутствующие удаляются одним `DELETE ... IN`.
+        Цена за единицу у существующих позиций сохраняется. Количество запросов зависит
+        только от того, что изменилось, а не от размера заказа.
+        """
+        quantities: dict[int, int] = {}
+        dishes = {}
+        for item_data in items_data:
+            dish = item_data['dish']
+            dishes[dish.id] = dish
+            quantities[dish.id] = quantities.get(dish.id, 0) + item_data.get('quantity', 1)
+
+        to_update, to_delete, existing = [], [], set()
+        for item in order.order_items.only('id', 'order', 'dish', 'quantity'):
+            if item.dish_id not in quantities or item.dish_id in existing:
+                to_delete.append(item)
+                continue
+            existing.add(item.dish_id)
+            if item.quantity != quantities[item.dish_id]:
+                item.quantity = quantities[item.dish_id]
+                item.updated = timezone.now()
+                to_update.append(item)
+        to_create = [
+            OrderItem(order=order, dish=dishes[dish_id], quantity=quantity, unit_price=dishes[dish_id].price)
+            for dish_id, quantity in quantities.items()
+            if dish_id not in existing
+        ]
+
+        OrderItem.objects.bulk_update(to_update, ['quantity', 'updated'])
+        OrderItem.objects.bulk_create(to_create)
+        OrderItem.objects.bulk_delete(to_delete)
 
     def update(self, data: OrderValidatedData, order: Order) -> Order:
         """
@@ -32,14 +80,19 @@ class OrderUpdater(BaseService):
         """
         with atomic():
             if items_data := data.pop('items', None):
-                order.order_items.all().delete()
-                order_items = [OrderItem(order=order, **item_data) for item_data in items_data]
-                OrderItem.objects.bulk_create(order_items)
-                order.update_total_price()
+                if self.diff_items:
+                    self.diff_items_update(order, items_data)
+                else:
+                    self.replace_items(order, items_data)
+            update_fields = []
             for field, value in data.items():
                 if hasattr(order, field):
                     setattr(order, field, value)
-            order.save()
+                    update_fields.append(field)
+            if update_fields:
+                order.save(update_fields=[*update_fields, 'updated'])
+        if items_data:
+            order.refresh_from_db(fields=['total_price', 'updated'])
         return order
 
     def act(self) -> Order:
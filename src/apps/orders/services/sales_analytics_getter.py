@@ -0,0 +1,60 @@
+from dataclasses import dataclass
+from datetime import date
+
+from django.db.models import F, QuerySet, Sum
+from rest_framework import status
+from rest_framework.response import Response
+
+from apps.orders.api.serializers import DishSalesSerializer, TableSalesSerializer
+from apps.orders.data_types import SalesGrouping
+from apps.orders.models import DishDailySales, TableDailySales
+from core.services import BaseService
+
+
+@dataclass
+class SalesAnalyticsGetter(BaseService):
+    """
+    Сервис для получения продаж по блюдам или по столам за диапазон дней.
+
+    Данные читаются только из дневной статистики (DishDailySales, TableDailySales), которая ведется
+    при оплате заказов, поэтому запрос не затрагивает таблицы заказов и их позиций.
+    Без разбивки по дням строки суммируются за весь период и сортируются по убыванию выручки,
+    с разбивкой — сортируются по дню, а внутри дня по убыванию выручки.
+
+    Атрибуты:
+        grouping (str): Группировка продаж ('dish' или 'table').
+        date_from (date): Первый день периода.
+        date_to (date): Последний день периода (включительно).
+        by_day (bool): Возвращать ли строки отдельно по каждому дню.
+        limit (int): Максимальное количество строк в ответе.
+    """
+
+    grouping: str
+    date_from: date
+    date_to: date
+    by_day: bool = False
+    limit: int = 100
+
+    def get_queryset(self) -> QuerySet:
+        """Суммирует дневную статистику за период по блюдам или столам (и дням при `by_day`)."""
+        day_fields = ('day',) if self.by_day else ()
+        if self.grouping == SalesGrouping.DISH:
+            queryset = DishDailySales.objects.values(*day_fields, 'dish_id', dish_name=F('dish__name'))
+            totals = {'quantity': Sum('quantity')}
+        else:
+            queryset = TableDailySales.objects.values(*day_fields, table_number=F('table__number'))
+            totals = {}
+        return (
+            queryset.filter(day__gte=self.date_from, day__lte=self.date_to)
+            .annotate(**totals, revenue=Sum('revenue'), orders_count=Sum('orders_count'))
+            .order_by(*day_fields, '-revenue')
+        )
+
+    def act(self) -> Response:
+        serializer_class = DishSalesSerializer if self.grouping == SalesGrouping.DISH else TableSalesSerializer
+        data = {
+            'date_from': self.date_from,
+            'date_to': self.date_to,
+            'results': serializer_class(self.get_queryset()[: self.limit], many=True).data,
+        }
+        return Response(data, status=status.HTTP_200_OK)
@@ -1,28 +1,40 @@
-from datetime import datetime, timedelta
+from dataclasses import dataclass
+from datetime import date, datetime
 from decimal import Decimal
 
-from django.conf import settings
-from django.db.models import Sum
+from django.db.models import QuerySet, Sum
 from django.utils import timezone
 from rest_framework import status
 from rest_framework.response import Response
 
 from apps.orders.api.serializers import ShiftRevenueSerializer
 from apps.orders.data_types import WorkingTime
-from apps.orders.models import Order, OrderStatus
+from apps.orders.models import RevenueBucket, RevenuePeriod
+from apps.orders.shifts import get_hour_start, get_shift, get_shift_start
 from core.services import BaseService
 
 
+@dataclass
 class ShiftRevenueGetter(BaseService):
     """
-    Сервис для получения общей выручки за смену.
+    Сервис для получения общей выручки за смену или за период.
 
-    Этот класс позволяет:
-    1. Рассчитать период рабочей смены (начало и конец),
-       основываясь на конфигурации рабочего времени (WORKING_HOURS_START и WORKING_HOURS) в настройках.
-    2. Получить общую выручку за период смены, фильтруя заказы со статусом 'paid' в заданном временном интервале.
+    Выручка читается из журнала выручки (RevenueBucket), а не вычисляется по таблице заказов:
+    1. Без параметров возвращается выручка за текущую смену (или 0, если сейчас нерабочее время).
+       Период смены рассчитывается по конфигурации рабочего времени (WORKING_HOURS_START и WORKING_HOURS).
+    2. С параметром `day` возвращается выручка за смену, начавшуюся в этот день.
+    3. С параметрами `start` и `end` возвращается сумма почасовой выручки за часы, начавшиеся в этом интервале.
+
+    Атрибуты:
+        day (date | None): День начала прошедшей смены.
+        start (datetime | None): Начало произвольного периода.
+        end (datetime | None): Конец произвольного периода (не включительно).
     """
 
+    day: date | None = None
+    start: datetime | None = None
+    end: datetime | None = None
+
     def get_working_time_period(self) -> WorkingTime | None:
         """
         Определяет текущий рабочий интервал времени (начало и конец смены).
@@ -35,44 +47,75 @@ class ShiftRevenueGetter(BaseService):
             - None: Если текущее время не попадает в рабочий интервал.
         """
         current_time = timezone.now()
-        working_hours_start = datetime.strptime(settings.WORKING_HOURS_START, '%H:%M').time()
-        shift_start = current_time.replace(hour=working_hours_start.hour, minute=0, second=0, microsecond=0)
-        shift_end = shift_start + timedelta(hours=settings.WORKING_HOURS)
-        if shift_start <= current_time <= shift_end:
-            return WorkingTime(start=shift_start, end=current_time)
+        shift = get_shift(timezone.localtime(get_shift_start(current_time)).date())
+        if shift.start <= current_time <= shift.end:
+            return WorkingTime(start=shift.start, end=current_time)
         return None
 
-    def get_data(self, total_revenue: Decimal) -> dict:
+    def get_data(self, total_revenue: Decimal, orders_count: int, period: WorkingTime | None) -> dict:
         """
         Форматирует данные общей выручки для ответа.
 
         Аргументы:
-            total_revenue: Общая выручка за смену.
+            total_revenue: Общая выручка за период.
+            orders_count: Количество оплаченных заказов за период.
+            period: Период, за который посчитана выручка.
 
         Возвращает:
             dict: Отформатированные данные с общей выручкой.
         """
-        return ShiftRevenueSerializer({'total_revenue': total_revenue}).data
+        return ShiftRevenueSerializer(
+            {
+                'total_revenue': total_revenue,
+                'orders_count': orders_count,
+                'start': period.start if period else None,
+                'end': period.end if period else None,
+            }
+        ).data
 
-    def get_total_revenue(self) -> Decimal:
-        """
-        Получает общую выручку за текущую смену.
+    def get_shift_queryset(self, shift_start: datetime) -> QuerySet[RevenueBucket]:
+        """Строка журнала со сменой, начавшейся в `shift_start`; читается по уникальному индексу (period, start)."""
+        return RevenueBucket.objects.filter(period=RevenuePeriod.SHIFT, start=shift_start)
+
+    def get_range_queryset(self, start: datetime, end: datetime) -> QuerySet[RevenueBucket]:
+        """Строки журнала за часы, начавшиеся в интервале [start, end)."""
+        return RevenueBucket.objects.filter(
+            period=RevenuePeriod.HOUR,
+            start__gte=get_hour_start(start),
+            start__lt=end,
+        )
 
-        Фильтрует заказы по статусу "PAID" и суммирует выручку в пределах рабочего интервала времени.
+    def get_shift_revenue(self, shift_start: datetime) -> tuple[Decimal, int]:
+        """Читает выручку смены одной строкой журнала."""
+        bucket = self.get_shift_queryset(shift_start).values_list('revenue', 'orders_count').first()
+        return bucket or (Decimal(0), 0)
+
+    def get_range_revenue(self, start: datetime, end: datetime) -> tuple[Decimal, int]:
+        """Суммирует почасовую выручку за часы, начавшиеся в интервале [start, end)."""
+        totals = self.get_range_queryset(start, end).aggregate(
+            revenue=Sum('revenue'),
+            orders_count=Sum('orders_count'),
+        )
+        return totals['revenue'] or Decimal(0), totals['orders_count'] or 0
+
+    def get_total_revenue(self) -> tuple[Decimal, int, WorkingTime | None]:
+        """
+        Получает общую выручку и количество оплаченных заказов за запрошенный период.
 
         Возвращает:
-            Decimal: Общая выручка за смену (или 0, если выручка не найдена).
+            tuple: Выручка (или 0, если выручка не найдена), количество заказов и период.
         """
+        if self.start and self.end:
+            period = WorkingTime(start=self.start, end=self.end)
+            return *self.get_range_revenue(period.start, period.end), period
+        if self.day:
+            period = get_shift(self.day)
+            return *self.get_shift_revenue(period.start), period
         working_time_period = self.get_working_time_period()
         if not working_time_period:
-            return Decimal(0)
-        total_revenue = (
-            Order.objects.filter(status=OrderStatus.PAID)
-            .filter(updated__gte=working_time_period.start, updated__lte=working_time_period.end)
-            .aggregate(total_revenue=Sum('total_price'))['total_revenue']
-        )
-        return total_revenue or Decimal(0)
+            return Decimal(0), 0, None
+        return *self.get_shift_revenue(working_time_period.start), working_time_period
 
     def act(self) -> Response:
-        total_revenue = self.get_total_revenue()
-        return Response(self.get_data(total_revenue), status=status.HTTP_200_OK)
+        total_revenue, orders_count, period = self.get_total_revenue()
+        return Response(self.get_data(total_revenue, orders_count, period), status=status.HTTP_200_OK)
@@ -0,0 +1,41 @@
+from datetime import date, datetime, time, timedelta
+
+from django.conf import settings
+from django.utils import timezone
+
+from apps.orders.data_types import WorkingTime
+
+
+def get_working_hours_start() -> time:
+    """Возвращает время начала смены из настроек (WORKING_HOURS_START)."""
+    return datetime.strptime(settings.WORKING_HOURS_START, '%H:%M').time()
+
+
+def get_day_start(day: date) -> datetime:
+    """Возвращает начало дня (полночь по локальному времени)."""
+    return timezone.make_aware(datetime.combine(day, time.min))
+
+
+def get_shift(day: date) -> WorkingTime:
+    """Возвращает начало и конец смены, которая начинается в указанный день."""
+    start = timezone.make_aware(datetime.combine(day, get_working_hours_start()))
+    return WorkingTime(start=start, end=start + timedelta(hours=settings.WORKING_HOURS))
+
+
+def get_shift_start(moment: datetime) -> datetime:
+    """
+    Возвращает начало смены, к которой относится момент времени.
+
+    Это последнее начало смены, не превышающее момент. Время после окончания смены
+    и до начала следующей относится к предыдущей смене.
+    """
+    local_moment = timezone.localtime(moment)
+    shift = get_shift(local_moment.date())
+    if local_moment < shift.start:
+        shift = get_shift(local_moment.date() - timedelta(days=1))
+    return shift.start
+
+
+def get_hour_start(moment: datetime) -> datetime:
+    """Возвращает начало часа (по локальному времени), к которому относится момент времени."""
+    return timezone.localtime(moment).replace(minute=0, second=0, microsecond=0)
@@ -1,10 +1,36 @@
-from django.db.models.signals import post_delete, post_save
+from django.db.models.signals import post_delete, post_save, pre_delete
 from django.dispatch import receiver
 
-from apps.orders.models import OrderItem
+from apps.orders.data_types import OrderEventType
+from apps.orders.models import Order, OrderItem, OrderStatus
 
 
 @receiver([post_save, post_delete], sender=OrderItem)
-def update_order_total_price(sender: OrderItem, instance: OrderItem, **kwargs):
-    """Обновляем цену ордера."""
-    instance.order.update_total_price()
+def update_order_total_price(sender: OrderItem, instance: OrderItem, using: str, **kwargs):
+    """Отмечаем заказ для пересчета цены после коммита транзакции."""
+    Order.schedule_total_price_update([instance.order_id], using=using)
+
+
+@receiver(pre_delete, sender=Order)
+def remove_order_revenue(sender: Order, instance: Order, using: str, **kwargs):
+    """Убираем удаляемый оплаченный заказ из журнала выручки и дневной статистики, пока его позиции еще в базе."""
+    if instance.status == OrderStatus.PAID and instance.paid_at:
+        Order.record_payment(instance.pk, instance.table_id, instance.paid_at, instance.total_price, -1, using=using)
+
+
+@receiver(post_save, sender=Order)
+def schedule_order_saved_event(sender: Order, instance: Order, created: bool, using: str, update_fields, **kwargs):
+    """Отмечаем событие создания, смены статуса или изменения заказа для публикации после коммита."""
+    if created:
+        event_type = OrderEventType.CREATED
+    elif update_fields is not None and update_fields <= {'status', 'paid_at', 'updated'}:
+        event_type = OrderEventType.STATUS
+    else:
+        event_type = OrderEventType.UPDATED
+    Order.schedule_event([instance.pk], event_type, using=using)
+
+
+@receiver(post_delete, sender=Order)
+def schedule_order_deleted_event(sender: Order, instance: Order, using: str, **kwargs):
+    """Отмечаем событие удаления заказа для публикации после коммита."""
+    Order.schedule_event([instance.pk], OrderEventType.DELETED, using=using)
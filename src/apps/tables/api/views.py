@@ -1,14 +1,16 @@
 from rest_framework.permissions import IsAuthenticated
-from rest_framework.viewsets import ReadOnlyModelViewSet
 from rest_framework_api_key.permissions import HasAPIKey
 
 from apps.tables.api.serializers import TableSerializer
+from apps.tables.caches import table_response_cache
 from apps.tables.models import Table
+from core.views import RenderedCacheViewSet
 
 
-class TableViewSet(ReadOnlyModelViewSet):
+class TableViewSet(RenderedCacheViewSet):
     """ViewSet для чтения столов."""
 
     queryset = Table.objects.all()
     serializer_class = TableSerializer
     permission_classes = [IsAuthenticated | HasAPIKey]
+    rendered_cache = table_response_cache
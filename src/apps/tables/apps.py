@@ -5,3 +5,9 @@ class TablesConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.tables'
     verbose_name = 'Столы'
+
+    def ready(self) -> None:
+        from apps.tables import signals
+
+        signals
+        return super().ready()
@@ -0,0 +1,5 @@
+from apps.tables.models import Table
+from core.caches import ModelCache, RenderedCache
+
+table_cache = ModelCache(Table, key_field='number')
+table_response_cache = RenderedCache('tables')
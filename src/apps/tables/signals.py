@@ -0,0 +1,13 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.tables.caches import table_cache, table_response_cache
+from apps.tables.models import Table
+
+
+@receiver([post_save, post_delete], sender=Table)
+def invalidate_table_cache(sender: Table, instance: Table, **kwargs):
+    """Сбрасываем кеш столов и после фиксации транзакции меняем версию кеша ответов."""
+    table_cache.invalidate()
+    transaction.on_commit(table_response_cache.bump_version)
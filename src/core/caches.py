@@ -0,0 +1,118 @@
+import hashlib
+import time
+from collections.abc import Callable, Hashable, Iterable
+from dataclasses import dataclass
+from typing import Any
+from uuid import uuid4
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Model
+
+
+class ModelCache:
+    """
+    Кеш экземпляров небольшой модели-справочника (блюда, столы) в памяти процесса.
+
+    При включенном кеше (`CATALOG_CACHE_TIMEOUT` > 0) вся таблица загружается одним запросом и хранится
+    не дольше `CATALOG_CACHE_TIMEOUT` секунд. Сохранение или удаление объекта в текущем процессе сбрасывает кеш
+    сразу (см. signals.py приложений), в остальных процессах изменения становятся видны по истечении таймаута.
+    Если запрошен ключ, которого нет в кеше, таблица перечитывается один раз: объект мог быть создан
+    в другом процессе.
+
+    При выключенном кеше каждый вызов `get_many` выполняет один запрос `WHERE key IN (...)`.
+    """
+
+    def __init__(self, model: type[Model], key_field: str = 'pk') -> None:
+        self.model = model
+        self.key_field = key_field
+        self._objects: dict[Hashable, Any] | None = None
+        self._expires_at = 0.0
+
+    @property
+    def timeout(self) -> int:
+        return settings.CATALOG_CACHE_TIMEOUT
+
+    def invalidate(self) -> None:
+        self._objects = None
+
+    def load(self) -> dict[Hashable, Any]:
+        objects = {getattr(obj, self.key_field): obj for obj in self.model._default_manager.all()}
+        self._objects, self._expires_at = objects, time.monotonic() + self.timeout
+        return objects
+
+    def get_all(self) -> dict[Hashable, Any]:
+        if self._objects is None or time.monotonic() >= self._expires_at:
+            return self.load()
+        return self._objects
+
+    def get_many(self, keys: Iterable[Hashable]) -> dict[Hashable, Any]:
+        """Возвращает словарь найденных объектов по ключам. Отсутствующие ключи в результат не попадают."""
+        keys = set(keys)
+        if not self.timeout:
+            queryset = self.model._default_manager.filter(**{f'{self.key_field}__in': keys})
+            return {getattr(obj, self.key_field): obj for obj in queryset}
+        objects = self.get_all()
+        if not keys <= objects.keys():
+            objects = self.load()
+        return {key: objects[key] for key in keys if key in objects}
+
+
+@dataclass(frozen=True)
+class RenderedEntry:
+    """Отрендеренное тело ответа и его сильный ETag."""
+
+    content: bytes
+    etag: str
+    version: str = ''
+    expires_at: float = 0.0
+
+
+class RenderedCache:
+    """
+    Кеш отрендеренных ответов справочника (списка и отдельных объектов) в памяти процесса.
+
+    Записи привязаны к версии справочника, которая хранится в кеше Django (`CACHES`) и меняется при каждом
+    сохранении или удалении объекта (см. signals.py приложений). Если кеш Django общий для всех процессов
+    (Redis, Memcached), смена версии сразу делает устаревшими записи всех процессов; с локальным кешем
+    остальные процессы видят изменения по истечении `CATALOG_CACHE_TIMEOUT`.
+
+    ETag вычисляется по содержимому ответа, поэтому он совпадает у всех процессов при одинаковых данных.
+    При `CATALOG_CACHE_TIMEOUT` = 0 ответы не кешируются, но ETag по-прежнему вычисляется.
+    """
+
+    def __init__(self, name: str) -> None:
+        self.version_key = f'catalog_version:{name}'
+        self._entries: dict[Hashable, RenderedEntry] = {}
+
+    @property
+    def timeout(self) -> int:
+        return settings.CATALOG_CACHE_TIMEOUT
+
+    def get_version(self) -> str:
+        version = cache.get(self.version_key)
+        if version is None:
+            cache.add(self.version_key, uuid4().hex, timeout=None)
+            version = cache.get(self.version_key, '')
+        return version
+
+    def bump_version(self) -> None:
+        cache.set(self.version_key, uuid4().hex, timeout=None)
+        self._entries.clear()
+
+    def get(self, key: Hashable, render: Callable[[], bytes]) -> RenderedEntry:
+        """Возвращает запись по ключу, рендеря ответ функцией `render`, если записи нет или она устарела."""
+        version = self.get_version() if self.timeout else ''
+        entry = self._entries.get(key)
+        if entry is not None and entry.version == version and time.monotonic() < entry.expires_at:
+            return entry
+        content = render()
+        entry = RenderedEntry(
+            content=content,
+            etag=f'"{hashlib.sha256(content).hexdigest()[:32]}"',
+            version=version,
+            expires_at=time.monotonic() + self.timeout,
+        )
+        if self.timeout:
+            self._entries[key] = entry
+        return entry
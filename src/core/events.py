@@ -0,0 +1,157 @@
+import asyncio
+import atexit
+import json
+import logging
+import os
+import socket
+from collections.abc import AsyncIterator
+from pathlib import Path
+from uuid import uuid4
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+
+class Subscription:
+    """Очередь сообщений подписчика. Переполненная очередь закрывается: подписчик отстал и должен переподключиться."""
+
+    def __init__(self, channel: str, max_size: int) -> None:
+        self.channel = channel
+        self.queue: asyncio.Queue[bytes | None] = asyncio.Queue(max_size)
+
+    def put(self, data: bytes) -> bool:
+        try:
+            self.queue.put_nowait(data)
+        except asyncio.QueueFull:
+            return False
+        return True
+
+    def close(self) -> None:
+        while not self.queue.empty():
+            self.queue.get_nowait()
+        self.queue.put_nowait(None)
+
+
+class EventBroker:
+    """
+    Рассылка событий подписчикам всех процессов приложения — локальная замена брокера сообщений (Redis pub/sub).
+
+    Каждый ASGI-процесс, у которого есть подписчики, создает в каталоге `directory` собственный
+    Unix datagram-сокет и читает его в цикле событий. Публикация из любого процесса (в том числе WSGI)
+    отправляет одну датаграмму в каждый сокет каталога, а процесс раздает ее своим подписчикам из памяти,
+    поэтому количество подписчиков не влияет на количество запросов к базе. Сокеты завершившихся процессов
+    удаляются при первой неудачной отправке.
+
+    Без каталога события доставляются только подписчикам текущего процесса.
+    Доставка не гарантируется: при переполнении буфера сокета или очереди подписчика события теряются,
+    а подписчик отключается, чтобы при переподключении перечитать данные.
+    """
+
+    socket_prefix = 'events_'
+
+    def __init__(self, directory: str | None = None, queue_size: int = 1000) -> None:
+        self.directory = Path(directory) if directory else None
+        self.queue_size = queue_size
+        self.subscriptions: set[Subscription] = set()
+        self.loop: asyncio.AbstractEventLoop | None = None
+        self.socket: socket.socket | None = None
+        self.socket_path: Path | None = None
+        os.register_at_fork(after_in_child=self.after_fork)
+
+    def after_fork(self) -> None:
+        """Дочерний процесс не наследует подписчиков и сокет родителя."""
+        self.subscriptions = set()
+        self.loop = self.socket = self.socket_path = None
+
+    def has_subscribers(self) -> bool:
+        """Проверяет, может ли опубликованное сообщение быть кем-то получено, чтобы не готовить его зря."""
+        if self.directory is None:
+            return bool(self.subscriptions)
+        return any(self.directory.glob(f'{self.socket_prefix}*.sock'))
+
+    def publish(self, channel: str, message: dict) -> None:
+        """Публикует сообщение в канал. Вызывается из синхронного кода любого процесса."""
+        payload = f'{channel}\n{json.dumps(message, ensure_ascii=False, separators=(",", ":"))}'.encode()
+        if self.directory is None:
+            if self.loop is not None:
+                self.loop.call_soon_threadsafe(self.dispatch, payload)
+            return
+        with socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM) as sender:
+            sender.setblocking(False)
+            for path in self.directory.glob(f'{self.socket_prefix}*.sock'):
+                try:
+                    sender.sendto(payload, str(path))
+                except (ConnectionRefusedError, FileNotFoundError):
+                    path.unlink(missing_ok=True)
+                except OSError:
+                    logger.warning('Не удалось отправить событие канала %s в %s', channel, path, exc_info=True)
+
+    def dispatch(self, payload: bytes) -> None:
+        """Раздает сообщение подписчикам канала в текущем процессе."""
+        channel, _, data = payload.partition(b'\n')
+        for subscription in list(self.subscriptions):
+            if subscription.channel == channel.decode() and not subscription.put(data):
+                self.subscriptions.discard(subscription)
+                subscription.close()
+
+    def on_readable(self) -> None:
+        assert self.socket is not None
+        while True:
+            try:
+                payload = self.socket.recv(65536)
+            except BlockingIOError:
+                return
+            self.dispatch(payload)
+
+    def start(self) -> None:
+        """Создает сокет процесса и начинает читать его в текущем цикле событий."""
+        loop = asyncio.get_running_loop()
+        if self.loop is loop:
+            return
+        self.stop()
+        self.loop = loop
+        if self.directory is None:
+            return
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.socket_path = self.directory / f'{self.socket_prefix}{os.getpid()}_{uuid4().hex[:8]}.sock'
+        self.socket = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        self.socket.setblocking(False)
+        self.socket.bind(str(self.socket_path))
+        loop.add_reader(self.socket.fileno(), self.on_readable)
+
+    def stop(self) -> None:
+        if self.loop is not None and self.socket is not None and not self.loop.is_closed():
+            self.loop.remove_reader(self.socket.fileno())
+        if self.socket is not None:
+            self.socket.close()
+        if self.socket_path is not None:
+            self.socket_path.unlink(missing_ok=True)
+        self.loop = self.socket = self.socket_path = None
+
+    async def subscribe(self, channel: str, heartbeat: float | None = None) -> AsyncIterator[bytes | None]:
+        """
+        Возвращает сообщения канала (JSON в байтах) по мере публикации.
+
+        Если за `heartbeat` секунд сообщений не было, возвращается None, чтобы потребитель мог отправить
+        клиенту сигнал активности. Итерация завершается, если подписчик не успевает обрабатывать сообщения.
+        """
+        self.start()
+        subscription = Subscription(channel, self.queue_size)
+        self.subscriptions.add(subscription)
+        try:
+            while True:
+                try:
+                    data = await asyncio.wait_for(subscription.queue.get(), heartbeat)
+                except TimeoutError:
+                    yield None
+                    continue
+                if data is None:
+                    return
+                yield data
+        finally:
+            self.subscriptions.discard(subscription)
+
+
+broker = EventBroker(settings.EVENTS_DIR, settings.EVENTS_QUEUE_SIZE)
+atexit.register(broker.stop)
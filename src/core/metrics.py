@@ -0,0 +1,250 @@
+import atexit
+import json
+import os
+import threading
+from bisect import bisect_left
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from time import monotonic
+from uuid import uuid4
+
+from django.conf import settings
+
+LabelValues = tuple[str, ...]
+
+
+def escape_label_value(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def format_labels(names: Iterable[str], values: Iterable[str]) -> str:
+    labels = ','.join(f'{name}="{escape_label_value(value)}"' for name, value in zip(names, values))
+    return f'{{{labels}}}' if labels else ''
+
+
+def format_value(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(value)
+
+
+class Metric:
+    """
+    Базовая метрика: имя, описание, имена меток и значения по наборам меток.
+
+    Значения хранятся в памяти процесса, запись — это изменение элемента словаря под блокировкой.
+    """
+
+    type = ''
+
+    def __init__(self, name: str, documentation: str, label_names: tuple[str, ...] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.label_names = label_names
+        self.values: dict[LabelValues, list[float]] = {}
+        self.lock = threading.Lock()
+
+    def snapshot(self) -> dict[str, list[float]]:
+        """Возвращает значения в виде, пригодном для JSON: ключ — значения меток через табуляцию."""
+        with self.lock:
+            return {'\t'.join(labels): list(values) for labels, values in self.values.items()}
+
+    def render(self, values: dict[str, list[float]]) -> Iterator[str]:
+        raise NotImplementedError
+
+
+class Counter(Metric):
+    """Монотонно растущий счетчик."""
+
+    type = 'counter'
+
+    def inc(self, *label_values: str, amount: float = 1) -> None:
+        with self.lock:
+            values = self.values.get(label_values)
+            if values is None:
+                self.values[label_values] = [amount]
+            else:
+                values[0] += amount
+
+    def render(self, values: dict[str, list[float]]) -> Iterator[str]:
+        for key, (value,) in sorted(values.items()):
+            label_values = key.split('\t') if key else []
+            yield f'{self.name}{format_labels(self.label_names, label_values)} {format_value(value)}'
+
+
+class Histogram(Metric):
+    """
+    Гистограмма: количество наблюдений по корзинам, их сумма и количество.
+
+    Значения набора меток хранятся одним списком: счетчики корзин (без накопления, последняя — '+Inf'),
+    затем сумма и количество наблюдений.
+    """
+
+    type = 'histogram'
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        label_names: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+    ) -> None:
+        super().__init__(name, documentation, label_names)
+        self.buckets = buckets
+
+    def observe(self, value: float, *label_values: str) -> None:
+        index = bisect_left(self.buckets, value)
+        with self.lock:
+            values = self.values.get(label_values)
+            if values is None:
+                values = self.values[label_values] = [0.0] * (len(self.buckets) + 3)
+            values[index] += 1
+            values[-2] += value
+            values[-1] += 1
+
+    def render(self, values: dict[str, list[float]]) -> Iterator[str]:
+        bounds = [format_value(bound) for bound in self.buckets] + ['+Inf']
+        for key, observations in sorted(values.items()):
+            label_values = key.split('\t') if key else []
+            cumulative = 0.0
+            for bound, count in zip(bounds, observations):
+                cumulative += count
+                labels = format_labels((*self.label_names, 'le'), (*label_values, bound))
+                yield f'{self.name}_bucket{labels} {format_value(cumulative)}'
+            labels = format_labels(self.label_names, label_values)
+            yield f'{self.name}_sum{labels} {format_value(observations[-2])}'
+            yield f'{self.name}_count{labels} {format_value(observations[-1])}'
+
+
+class MetricsRegistry:
+    """
+    Реестр метрик с агрегацией между процессами через общий каталог.
+
+    Каждый процесс (воркер gunicorn) копит значения в памяти и не чаще раза в `flush_interval` секунд
+    сохраняет их снимок в собственный файл каталога `directory`. При выдаче метрик снимки всех
+    процессов суммируются, поэтому значения не зависят от того, какой воркер обработал запрос.
+    Файлы завершившихся воркеров остаются в каталоге, чтобы счетчики не уменьшались; каталог
+    следует очищать при перезапуске приложения.
+
+    Без каталога метрики отдаются только по текущему процессу.
+    """
+
+    def __init__(self, directory: str | None = None, flush_interval: float = 1.0) -> None:
+        self.directory = Path(directory) if directory else None
+        self.flush_interval = flush_interval
+        self.metrics: dict[str, Metric] = {}
+        self.next_flush = 0.0
+        self.filename = self.get_filename()
+        os.register_at_fork(after_in_child=self.after_fork)
+
+    @staticmethod
+    def get_filename() -> str:
+        return f'metrics_{os.getpid()}_{uuid4().hex[:8]}.json'
+
+    def after_fork(self) -> None:
+        """В дочернем процессе начинает новый файл снимка: значения родителя учтены в его собственном файле."""
+        self.filename = self.get_filename()
+        self.next_flush = 0.0
+        for metric in self.metrics.values():
+            metric.lock = threading.Lock()
+            metric.values = {}
+
+    def register(self, metric: Metric) -> Metric:
+        self.metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, label_names: tuple[str, ...] = ()) -> Counter:
+        return self.register(Counter(name, documentation, label_names))  # type: ignore[return-value]
+
+    def histogram(self, name: str, documentation: str, label_names: tuple[str, ...] = (), **kwargs: tuple) -> Histogram:
+        return self.register(Histogram(name, documentation, label_names, **kwargs))  # type: ignore[return-value]
+
+    def snapshot(self) -> dict[str, dict[str, list[float]]]:
+        return {name: metric.snapshot() for name, metric in self.metrics.items()}
+
+    def maybe_flush(self) -> None:
+        """Сохраняет снимок процесса, если с прошлого сохранения прошло не меньше `flush_interval` секунд."""
+        if self.directory is not None and monotonic() >= self.next_flush:
+            self.flush()
+
+    def flush(self) -> None:
+        if self.directory is None:
+            return
+        self.next_flush = monotonic() + self.flush_interval
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.directory / self.filename
+        temporary_path = path.with_suffix('.tmp')
+        temporary_path.write_text(json.dumps(self.snapshot()))
+        os.replace(temporary_path, path)
+
+    def collect(self) -> dict[str, dict[str, list[float]]]:
+        """Возвращает значения метрик, просуммированные по снимкам всех процессов."""
+        if self.directory is None:
+            return self.snapshot()
+        self.flush()
+        totals: dict[str, dict[str, list[float]]] = {name: {} for name in self.metrics}
+        for path in self.directory.glob('metrics_*.json'):
+            try:
+                snapshot = json.loads(path.read_text())
+            except (OSError, ValueError):
+                continue
+            for name, values in snapshot.items():
+                if name not in totals:
+                    continue
+                for key, observations in values.items():
+                    current = totals[name].setdefault(key, [0.0] * len(observations))
+                    if len(current) != len(observations):
+                        continue
+                    for index, value in enumerate(observations):
+                        current[index] += value
+        return totals
+
+    def render(self) -> str:
+        """Формирует метрики в текстовом формате Prometheus."""
+        values = self.collect()
+        lines = []
+        for name, metric in self.metrics.items():
+            lines.append(f'# HELP {name} {metric.documentation}')
+            lines.append(f'# TYPE {name} {metric.type}')
+            lines.extend(metric.render(values.get(name, {})))
+        return '\n'.join(lines) + '\n'
+
+
+registry = MetricsRegistry(settings.METRICS_DIR, settings.METRICS_FLUSH_INTERVAL)
+atexit.register(registry.flush)
+
+REQUEST_DURATION = registry.histogram(
+    'http_request_duration_seconds',
+    'Время обработки HTTP-запроса по маршрутам.',
+    ('route', 'method'),
+)
+REQUEST_DB_DURATION = registry.histogram(
+    'http_request_db_duration_seconds',
+    'Время выполнения SQL-запросов за HTTP-запрос по маршрутам.',
+    ('route', 'method'),
+)
+REQUEST_QUERIES = registry.histogram(
+    'http_request_db_queries',
+    'Количество SQL-запросов за HTTP-запрос по маршрутам.',
+    ('route', 'method'),
+    buckets=(1, 2, 5, 10, 20, 50, 100),
+)
+RESPONSE_SIZE = registry.histogram(
+    'http_response_size_bytes',
+    'Размер тела ответа по маршрутам (без потоковых ответов).',
+    ('route', 'method'),
+    buckets=(256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304),
+)
+REQUESTS = registry.counter(
+    'http_requests_total',
+    'Количество HTTP-запросов по маршрутам и кодам ответа.',
+    ('route', 'method', 'status'),
+)
+ERRORS = registry.counter(
+    'http_request_errors_total',
+    'Количество HTTP-запросов, завершившихся ошибкой сервера (5xx).',
+    ('route', 'method', 'status'),
+)
+SERVICE_DURATION = registry.histogram(
+    'service_duration_seconds',
+    'Время выполнения сервисов (BaseService).',
+    ('service',),
+)
@@ -0,0 +1,98 @@
+import logging
+from collections.abc import Callable
+from time import perf_counter
+
+from django.conf import settings
+from django.http import HttpRequest, HttpResponse
+
+from core.metrics import (
+    ERRORS,
+    REQUEST_DB_DURATION,
+    REQUEST_DURATION,
+    REQUEST_QUERIES,
+    REQUESTS,
+    RESPONSE_SIZE,
+    registry,
+)
+from core.queries import QueryInspector
+
+logger = logging.getLogger(__name__)
+
+
+class QueryInspectorMiddleware:
+    """
+    Middleware, которое считает SQL-запросы и время их выполнения для каждого запроса.
+
+    - Добавляет в ответ заголовок `Server-Timing` с временем работы базы (`db`) и всего запроса (`app`),
+      который виден во вкладке Network инструментов разработчика браузера.
+    - Пишет предупреждение в лог, если количество запросов превышает QUERY_BUDGET_PER_REQUEST.
+    - При включенной настройке N_PLUS_ONE_DETECTION пишет предупреждение о повторяющихся ленивых загрузках
+      связанных объектов с местом вызова в коде.
+
+    Запросы, выполняемые при отдаче потоковых ответов (StreamingHttpResponse), не учитываются.
+    """
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]) -> None:
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        inspector = QueryInspector(
+            detect_n_plus_one=settings.N_PLUS_ONE_DETECTION,
+            n_plus_one_threshold=settings.N_PLUS_ONE_THRESHOLD,
+        )
+        started = perf_counter()
+        request.query_inspector = inspector  # type: ignore[attr-defined]
+        with inspector.capture():
+            response = self.get_response(request)
+        duration = perf_counter() - started
+
+        response['Server-Timing'] = (
+            f'db;desc="{inspector.queries_count} queries";dur={inspector.duration * 1000:.1f}, '
+            f'app;dur={duration * 1000:.1f}'
+        )
+        source = f'{request.method} {request.path}'
+        if inspector.queries_count > settings.QUERY_BUDGET_PER_REQUEST:
+            logger.warning(
+                'Запрос %s выполнил %s SQL-запросов при бюджете %s',
+                source,
+                inspector.queries_count,
+                settings.QUERY_BUDGET_PER_REQUEST,
+            )
+        inspector.log_n_plus_one(source)
+        return response
+
+
+class MetricsMiddleware:
+    """
+    Middleware, которое записывает метрики HTTP-запроса: время обработки, время и количество SQL-запросов,
+    размер ответа, количество запросов и ошибок сервера по маршрутам.
+
+    Маршрут определяется по имени URL (например, 'order-list'); запросы к неизвестным URL попадают
+    в маршрут 'unmatched', чтобы количество наборов меток оставалось ограниченным. Время и количество
+    SQL-запросов берутся из QueryInspectorMiddleware, которое должно следовать за этим middleware.
+    """
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]) -> None:
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        started = perf_counter()
+        response = self.get_response(request)
+        duration = perf_counter() - started
+
+        resolver_match = request.resolver_match
+        route = (resolver_match.url_name or 'unnamed') if resolver_match else 'unmatched'
+        method = request.method or ''
+        status = str(response.status_code)
+        REQUEST_DURATION.observe(duration, route, method)
+        REQUESTS.inc(route, method, status)
+        if response.status_code >= 500:
+            ERRORS.inc(route, method, status)
+        if not response.streaming:
+            RESPONSE_SIZE.observe(len(response.content), route, method)
+        inspector = getattr(request, 'query_inspector', None)
+        if inspector is not None:
+            REQUEST_DB_DURATION.observe(inspector.duration, route, method)
+            REQUEST_QUERIES.observe(inspector.queries_count, route, method)
+        registry.maybe_flush()
+        return response
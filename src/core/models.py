@@ -1,4 +1,7 @@
-from django.db import models
+from typing import Any
+
+from django.db import IntegrityError, models, transaction
+from django.db.models import F
 
 
 class TimestampedModel(models.Model):
@@ -15,3 +18,29 @@ class TimestampedModel(models.Model):
 
     class Meta:
         abstract = True
+
+
+class RollupModel(models.Model):
+    """Абстрактная модель накопительной статистики, значения которой атомарно увеличиваются."""
+
+    class Meta:
+        abstract = True
+
+    @classmethod
+    def increment(cls, keys: dict[str, Any], deltas: dict[str, Any], using: str | None = None) -> None:
+        """
+        Атомарно увеличивает значения строки с ключом `keys`, создавая строку при необходимости.
+
+        :param keys: Значения полей, однозначно определяющих строку (уникальный ключ).
+        :param deltas: Приращения числовых полей.
+        """
+        manager = cls._default_manager.db_manager(using)
+        rows = manager.filter(**keys)
+        values = {field: F(field) + delta for field, delta in deltas.items()}
+        if rows.update(**values):
+            return
+        try:
+            with transaction.atomic(using=using):
+                manager.create(**keys, **deltas)
+        except IntegrityError:
+            rows.update(**values)
@@ -0,0 +1,40 @@
+from django.contrib.postgres.indexes import PostgresIndex
+from django.contrib.postgres.operations import AddIndexConcurrently as PostgresAddIndexConcurrently
+from django.db.backends.base.schema import BaseDatabaseSchemaEditor
+from django.db.migrations import AddIndex
+from django.db.migrations.state import ProjectState
+
+
+class AddIndexConcurrently(PostgresAddIndexConcurrently):
+    """
+    Создание индекса без блокировки записи в таблицу (`CREATE INDEX CONCURRENTLY`).
+
+    На PostgreSQL работает как `django.contrib.postgres.operations.AddIndexConcurrently`, поэтому миграция
+    с этой операцией должна быть неатомарной (`atomic = False`). На остальных СУБД (например, SQLite
+    в локальном окружении) индекс создается обычным `CREATE INDEX`, а специфичные для PostgreSQL индексы
+    (BRIN, GIN и т.п.) пропускаются.
+    """
+
+    def database_forwards(
+        self,
+        app_label: str,
+        schema_editor: BaseDatabaseSchemaEditor,
+        from_state: ProjectState,
+        to_state: ProjectState,
+    ) -> None:
+        if schema_editor.connection.vendor == 'postgresql':
+            super().database_forwards(app_label, schema_editor, from_state, to_state)
+        elif not isinstance(self.index, PostgresIndex):
+            AddIndex.database_forwards(self, app_label, schema_editor, from_state, to_state)
+
+    def database_backwards(
+        self,
+        app_label: str,
+        schema_editor: BaseDatabaseSchemaEditor,
+        from_state: ProjectState,
+        to_state: ProjectState,
+    ) -> None:
+        if schema_editor.connection.vendor == 'postgresql':
+            super().database_backwards(app_label, schema_editor, from_state, to_state)
+        elif not isinstance(self.index, PostgresIndex):
+            AddIndex.database_backwards(self, app_label, schema_editor, from_state, to_state)
@@ -0,0 +1,138 @@
+import json
+from typing import Any
+
+from django.core.exceptions import ValidationError
+from django.db import connections
+from django.db.models import Model, Q, QuerySet
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import Cursor, CursorPagination
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+
+def get_estimated_count(queryset: QuerySet) -> int:
+    """
+    Возвращает приблизительное количество строк в выборке.
+
+    Для PostgreSQL используется оценка планировщика из `EXPLAIN`, что не требует полного `COUNT(*)`.
+    Для остальных СУБД выполняется обычный `count()`.
+    """
+    connection = connections[queryset.db]
+    if connection.vendor != 'postgresql':
+        return queryset.count()
+    sql, params = queryset.order_by().values('pk').query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(f'EXPLAIN (FORMAT JSON) {sql}', params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]['Plan']['Plan Rows'])
+
+
+class KeysetPagination(CursorPagination):
+    """
+    Keyset (cursor) пагинация по составному ключу сортировки.
+
+    В отличие от стандартной `CursorPagination`, позиция курсора хранит значения всех полей из `ordering`,
+    а следующая страница выбирается условием вида `(created, id) < (:created, :id)`. Поэтому стоимость
+    любой страницы одинакова и не зависит от её номера.
+
+    Общее количество записей возвращается только по запросу (`?with_count=true`) и вычисляется
+    по оценке планировщика.
+    """
+
+    ordering: tuple[str, ...] = ('-created', 'id')
+    page_size_query_param = 'page_size'
+    count_query_param = 'with_count'
+    position_separator = '|'
+
+    def paginate_queryset(self, queryset: QuerySet, request: Request, view: Any = None) -> list[Model] | None:
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+
+        self.base_url = request.build_absolute_uri()
+        self.cursor = self.decode_cursor(request)
+        self.count = get_estimated_count(queryset) if self.is_count_requested(request) else None
+
+        reverse = bool(self.cursor and self.cursor.reverse)
+        position = self.cursor.position if self.cursor else None
+        queryset = queryset.order_by(*self.get_ordering_fields(reverse))
+        if position is not None:
+            queryset = queryset.filter(self.get_position_filter(queryset, position, reverse))
+
+        results = list(queryset[: self.page_size + 1])
+        has_more = len(results) > self.page_size
+        self.page = results[: self.page_size]
+        if reverse:
+            self.page.reverse()
+            self.has_next, self.has_previous = position is not None, has_more
+        else:
+            self.has_next, self.has_previous = has_more, position is not None
+        return self.page
+
+    def is_count_requested(self, request: Request) -> bool:
+        return request.query_params.get(self.count_query_param, '').lower() in ('1', 'true')
+
+    def get_ordering_fields(self, reverse: bool) -> list[str]:
+        """Возвращает поля сортировки с учетом направления обхода."""
+        if not reverse:
+            return list(self.ordering)
+        return [field[1:] if field.startswith('-') else f'-{field}' for field in self.ordering]
+
+    def get_position_filter(self, queryset: QuerySet, position: str, reverse: bool) -> Q:
+        """
+        Строит условие для выборки записей, следующих за позицией курсора.
+
+        Для сортировки `('-created', 'id')` условие раскрывается в
+        `created < :created OR (created = :created AND id > :id)`.
+        """
+        raw_values = position.split(self.position_separator)
+        if len(raw_values) != len(self.ordering):
+            raise NotFound(self.invalid_cursor_message)
+        condition, equals = Q(), dict[str, Any]()
+        for field, raw_value in zip(self.ordering, raw_values):
+            name = field.lstrip('-')
+            try:
+                value = queryset.model._meta.get_field(name).to_python(raw_value)
+            except ValidationError:
+                raise NotFound(self.invalid_cursor_message)
+            lookup = 'lt' if field.startswith('-') != reverse else 'gt'
+            condition |= Q(**equals, **{f'{name}__{lookup}': value})
+            equals[name] = value
+        return condition
+
+    def _get_position_from_instance(self, instance: Model, ordering: Any = None) -> str:
+        values = []
+        for field in self.ordering:
+            value = getattr(instance, field.lstrip('-'))
+            values.append(value.isoformat() if hasattr(value, 'isoformat') else str(value))
+        return self.position_separator.join(values)
+
+    def get_next_link(self) -> str | None:
+        if not self.has_next or not self.page:
+            return None
+        position = self._get_position_from_instance(self.page[-1])
+        return self.encode_cursor(Cursor(offset=0, reverse=False, position=position))
+
+    def get_previous_link(self) -> str | None:
+        if not self.has_previous or not self.page:
+            return None
+        position = self._get_position_from_instance(self.page[0])
+        return self.encode_cursor(Cursor(offset=0, reverse=True, position=position))
+
+    def get_paginated_response(self, data: list) -> Response:
+        response_data: dict[str, Any] = {
+            'next': self.get_next_link(),
+            'previous': self.get_previous_link(),
+        }
+        if self.count is not None:
+            response_data['count'] = self.count
+        response_data['results'] = data
+        return Response(response_data)
+
+    def get_paginated_response_schema(self, schema: dict) -> dict:
+        response_schema = super().get_paginated_response_schema(schema)
+        response_schema['properties']['count'] = {'type': 'integer', 'example': 123}
+        return response_schema
@@ -0,0 +1,118 @@
+import logging
+import re
+import sys
+from collections.abc import Callable, Iterator
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from time import perf_counter
+from typing import Any
+
+from django.conf import settings
+from django.db import connections
+
+logger = logging.getLogger(__name__)
+
+IN_PLACEHOLDERS = re.compile(r'IN \((?:%s, )*%s\)')
+LAZY_LOAD_MODULE = str(Path('django', 'db', 'models', 'fields', 'related_descriptors.py'))
+
+
+def get_query_shape(sql: str) -> str:
+    """Возвращает форму запроса: SQL без параметров, где списки `IN (%s, ...)` любой длины совпадают."""
+    return IN_PLACEHOLDERS.sub('IN (...)', sql)
+
+
+def get_call_site(frame: Any) -> tuple[str | None, bool]:
+    """
+    Ищет в стеке вызовов место в коде проекта, из которого выполнен запрос.
+
+    :return: Место вызова в виде 'путь:строка в функции' (или None) и признак того,
+        что запрос выполнен ленивой загрузкой связанного объекта.
+    """
+    project_dir, this_file = str(settings.BASE_DIR), __file__
+    is_lazy_load, call_site = False, None
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if filename.endswith(LAZY_LOAD_MODULE):
+            is_lazy_load = True
+        elif is_lazy_load and filename.startswith(project_dir) and filename != this_file:
+            call_site = f'{Path(filename).relative_to(project_dir)}:{frame.f_lineno} in {frame.f_code.co_name}'
+            break
+        frame = frame.f_back
+    return call_site, is_lazy_load
+
+
+@dataclass
+class LazyLoad:
+    count: int
+    call_site: str | None
+
+
+@dataclass
+class QueryInspector:
+    """
+    Счетчик SQL-запросов, подключаемый через `connection.execute_wrapper`.
+
+    Считает количество запросов и время их выполнения. Если включено обнаружение N+1, запоминает
+    повторяющиеся формы запросов, выполненных ленивой загрузкой связанных объектов (например,
+    обращение к `order.table` без `select_related`), вместе с местом вызова в коде проекта.
+
+    Атрибуты:
+        detect_n_plus_one (bool): Отслеживать ли ленивые загрузки (требует обхода стека на каждый запрос).
+        n_plus_one_threshold (int): Количество одинаковых ленивых загрузок, начиная с которого они считаются N+1.
+    """
+
+    detect_n_plus_one: bool = True
+    n_plus_one_threshold: int = 3
+    queries: list[str] = field(default_factory=list)
+    duration: float = 0.0
+    lazy_loads: dict[str, LazyLoad] = field(default_factory=dict)
+
+    def __call__(self, execute: Callable, sql: str, params: Any, many: bool, context: dict) -> Any:
+        started = perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.duration += perf_counter() - started
+            self.queries.append(sql)
+            if self.detect_n_plus_one:
+                self.record_lazy_load(sql)
+
+    def record_lazy_load(self, sql: str) -> None:
+        call_site, is_lazy_load = get_call_site(sys._getframe(2))
+        if not is_lazy_load:
+            return
+        shape = get_query_shape(sql)
+        lazy_load = self.lazy_loads.setdefault(shape, LazyLoad(count=0, call_site=call_site))
+        lazy_load.count += 1
+
+    @property
+    def queries_count(self) -> int:
+        return len(self.queries)
+
+    @property
+    def n_plus_one(self) -> dict[str, LazyLoad]:
+        """Формы ленивых загрузок, повторившиеся не менее `n_plus_one_threshold` раз."""
+        return {
+            shape: lazy_load
+            for shape, lazy_load in self.lazy_loads.items()
+            if lazy_load.count >= self.n_plus_one_threshold
+        }
+
+    @contextmanager
+    def capture(self) -> Iterator['QueryInspector']:
+        """Подключает счетчик ко всем соединениям с базой на время блока."""
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(self))
+            yield self
+
+    def log_n_plus_one(self, source: str) -> None:
+        for shape, lazy_load in self.n_plus_one.items():
+            logger.warning(
+                'Возможный N+1 в %s: ленивая загрузка выполнена %s раз, место вызова: %s\n%s',
+                source,
+                lazy_load.count,
+                lazy_load.call_site or 'не найдено',
+                shape,
+            )
@@ -1,7 +1,10 @@
 from abc import ABCMeta, abstractmethod
 from collections.abc import Callable
+from time import perf_counter
 from typing import Any
 
+from core.metrics import SERVICE_DURATION
+
 
 class BaseService(metaclass=ABCMeta):
     """This is a template of a base service.
@@ -27,8 +30,12 @@ class BaseService(metaclass=ABCMeta):
     """
 
     def __call__(self) -> Any:
-        self.validate()
-        return self.act()
+        started = perf_counter()
+        try:
+            self.validate()
+            return self.act()
+        finally:
+            SERVICE_DURATION.observe(perf_counter() - started, type(self).__name__)
 
     def get_validators(self) -> list[Callable]:
         return []
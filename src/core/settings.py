@@ -44,6 +44,8 @@ local_apps = [
 INSTALLED_APPS = django_apps + third_party_apps + local_apps
 
 MIDDLEWARE = [
+    'core.middleware.MetricsMiddleware',
+    'core.middleware.QueryInspectorMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -96,6 +98,33 @@ REST_FRAMEWORK = {
 WORKING_HOURS_START = '10:00'
 WORKING_HOURS = 12
 
+# Максимальное количество заказов в одном запросе пакетного создания и размер пакета вставки по умолчанию.
+ORDERS_BULK_MAX_ORDERS = 1000
+ORDERS_BULK_BATCH_SIZE = 200
+
+# Время жизни кеша справочников (блюда, столы) и их отрендеренных ответов в памяти процесса, в секундах.
+# 0 - кеш выключен.
+CATALOG_CACHE_TIMEOUT = int(getenv('CATALOG_CACHE_TIMEOUT', 0))
+
+# Количество SQL-запросов на один HTTP-запрос, при превышении которого в лог пишется предупреждение.
+QUERY_BUDGET_PER_REQUEST = int(getenv('QUERY_BUDGET_PER_REQUEST', 50))
+
+# Обнаружение N+1: повторяющиеся ленивые загрузки связанных объектов пишутся в лог с местом вызова.
+N_PLUS_ONE_DETECTION = getenv('N_PLUS_ONE_DETECTION', str(DEBUG)) == 'True'
+N_PLUS_ONE_THRESHOLD = 3
+
+# Общий для всех воркеров каталог, через который суммируются метрики. Без каталога метрики отдаются
+# только по процессу, обработавшему запрос. Каталог следует очищать при перезапуске приложения.
+METRICS_DIR = getenv('METRICS_DIR') or None
+METRICS_FLUSH_INTERVAL = 1.0
+
+# Общий для всех воркеров (WSGI и ASGI) каталог сокетов, через который рассылаются события заказов.
+# Без каталога события получают только подписчики процесса, в котором изменен заказ.
+EVENTS_DIR = getenv('EVENTS_DIR') or None
+# Интервал сигнала активности в потоке событий, в секундах, и размер очереди событий одного подписчика.
+EVENTS_HEARTBEAT_INTERVAL = 15.0
+EVENTS_QUEUE_SIZE = 1000
+
 # Internationalization
 LANGUAGE_CODE = 'ru-Ru'
 
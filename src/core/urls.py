@@ -6,6 +6,8 @@ from rest_framework import permissions
 from drf_yasg import openapi
 from drf_yasg.views import get_schema_view
 
+from core.views import MetricsAPIView
+
 schema_view = get_schema_view(
     openapi.Info(
         title='Make This Order',
@@ -21,6 +23,7 @@ api_v1 = [
     path('', include('apps.dishes.api.urls')),
     path('', include('apps.orders.api.urls')),
     path('', include('apps.tables.api.urls')),
+    path('metrics/', MetricsAPIView.as_view(), name='metrics'),
     path('swagger<format>/', schema_view.without_ui(cache_timeout=0), name='schema-json'),
     path('swagger/', schema_view.with_ui('swagger', cache_timeout=0), name='schema-swagger-ui'),
 ]
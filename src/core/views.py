@@ -0,0 +1,100 @@
+from collections.abc import AsyncIterator, Callable, Hashable
+from typing import Any
+
+from django.conf import settings
+from django.http import HttpRequest, HttpResponse, JsonResponse, StreamingHttpResponse
+from django.http.response import HttpResponseBase
+from django.utils.cache import get_conditional_response
+from django.views import View
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.views import APIView
+from rest_framework.viewsets import ReadOnlyModelViewSet
+from rest_framework_api_key.permissions import HasAPIKey
+
+from asgiref.sync import sync_to_async
+
+from core.caches import RenderedCache
+from core.events import broker
+from core.metrics import registry
+
+
+class MetricsAPIView(APIView):
+    """Представление для выдачи метрик приложения в текстовом формате Prometheus."""
+
+    permission_classes = [IsAuthenticated | HasAPIKey]
+
+    def get(self, request: Request, *args: Any, **kwargs: Any) -> HttpResponse:
+        return HttpResponse(registry.render(), content_type='text/plain; version=0.0.4; charset=utf-8')
+
+
+class RenderedCacheViewSet(ReadOnlyModelViewSet):
+    """
+    ViewSet для чтения справочника с кешем отрендеренных JSON-ответов.
+
+    Список и отдельные объекты отдаются готовыми байтами из `rendered_cache` с сильным `ETag`;
+    запрос с совпадающим `If-None-Match` получает `304 Not Modified`. Запросы других форматов
+    (например, Browsable API) обрабатываются без кеша.
+    """
+
+    rendered_cache: RenderedCache
+
+    def is_cacheable(self, request: Request) -> bool:
+        return request.accepted_renderer.format == 'json' and request.accepted_media_type == JSONRenderer.media_type
+
+    def get_cached_response(self, request: Request, key: Hashable, get_data: Callable[[], Any]) -> HttpResponseBase:
+        entry = self.rendered_cache.get(key, lambda: JSONRenderer().render(get_data()))
+        response = HttpResponse(entry.content, content_type=JSONRenderer.media_type)
+        response['ETag'] = entry.etag
+        return get_conditional_response(request, etag=entry.etag, response=response) or response
+
+    def list(self, request: Request, *args: Any, **kwargs: Any) -> HttpResponseBase:
+        if not self.is_cacheable(request):
+            return super().list(request, *args, **kwargs)
+        return self.get_cached_response(
+            request,
+            'list',
+            lambda: self.get_serializer(self.filter_queryset(self.get_queryset()), many=True).data,
+        )
+
+    def retrieve(self, request: Request, *args: Any, **kwargs: Any) -> HttpResponseBase:
+        if not self.is_cacheable(request):
+            return super().retrieve(request, *args, **kwargs)
+        lookup = kwargs[self.lookup_url_kwarg or self.lookup_field]
+        return self.get_cached_response(
+            request, ('detail', lookup), lambda: self.get_serializer(self.get_object()).data
+        )
+
+
+class EventStreamView(View):
+    """
+    Поток событий канала `channel` в формате Server-Sent Events.
+
+    Доступ такой же, как у API: аутентифицированный пользователь или API-ключ. Соединение остается открытым,
+    пока клиент не отключится, поэтому представление должно обслуживаться ASGI-приложением (core.asgi).
+    Если событий нет дольше `EVENTS_HEARTBEAT_INTERVAL` секунд, отправляется комментарий, по которому
+    обнаруживаются оборванные соединения.
+    """
+
+    channel: str
+    http_method_names = ['get']
+
+    async def has_permission(self, request: HttpRequest) -> bool:
+        user = await request.auser()
+        if user.is_authenticated:
+            return True
+        return await sync_to_async(HasAPIKey().has_permission)(request, self)
+
+    async def get(self, request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponseBase:
+        if not await self.has_permission(request):
+            return JsonResponse({'detail': 'Учетные данные не были предоставлены.'}, status=403)
+        response = StreamingHttpResponse(self.stream(), content_type='text/event-stream')
+        response['Cache-Control'] = 'no-cache'
+        response['X-Accel-Buffering'] = 'no'
+        return response
+
+    async def stream(self) -> AsyncIterator[bytes]:
+        yield b'retry: 3000\n\n'
+        async for data in broker.subscribe(self.channel, settings.EVENTS_HEARTBEAT_INTERVAL):
+            yield b': ping\n\n' if data is None else b'data: ' + data + b'\n\n'
@@ -12,7 +12,8 @@
  * 4. Удаление заказов.
  * 5. Обновление статуса заказа.
  * 6. Загрузка информации о выручке за смену.
- * 7. Поиск и фильтрация заказов.
+ * 7. Поиск и фильтрация заказов с постраничной подгрузкой списка.
+ * 8. Обновление списка заказов на месте по событиям сервера (`subscribeToOrderEvents`).
  *
  * @module main
  */
@@ -124,7 +125,7 @@ document.getElementById('create-order-form').addEventListener('submit', async fu
 
     if (response.ok) {
         alert('Заказ создан успешно')
-        location.reload()
+        if (!liveUpdates) getOrders()
     } else if (response.status === 400) {
         const errorData = await response.json()
         alert(JSON.stringify(errorData, null, 2))
@@ -133,8 +134,15 @@ document.getElementById('create-order-form').addEventListener('submit', async fu
     }
 })
 
+const ordersApiUrl = '/api/v1/orders/' // URL для получения списка заказов
+const orderEventsUrl = '/api/v1/orders/events/' // URL потока событий заказов
+let nextOrdersUrl = null // Ссылка на следующую страницу заказов
+let orderFilters = {} // Фильтры текущего списка заказов
+let liveUpdates = false // Подключен ли поток событий заказов
+
 /**
- * Загружает список заказов с сервера с учетом фильтрации по параметрам.
+ * Загружает первую страницу заказов с сервера с учетом фильтрации по параметрам.
+ * Следующие страницы подгружаются по запросу через `loadMoreOrders`.
  */
 async function getOrders() {
     const tableNumber = document.getElementById('table').value
@@ -145,32 +153,150 @@ async function getOrders() {
     if (tableNumber) queryParams.append('table', tableNumber)
     if (status) queryParams.append('status', status)
     if (orderId) queryParams.append('id', orderId)
+    orderFilters = { table: tableNumber, status: status, id: orderId }
+
+    document.getElementById('order-table-body').innerHTML = ''
+    await fetchOrdersPage(`${ordersApiUrl}?${queryParams.toString()}`)
+}
+
+/**
+ * Загружает следующую страницу заказов, если она есть.
+ */
+async function loadMoreOrders() {
+    if (nextOrdersUrl) {
+        await fetchOrdersPage(nextOrdersUrl)
+    }
+}
 
-    const url = `/api/v1/orders/?${queryParams.toString()}`
+/**
+ * Загружает одну страницу заказов и добавляет её строки в таблицу.
+ *
+ * @param {string} url Адрес страницы заказов.
+ */
+async function fetchOrdersPage(url) {
     const response = await fetch(url)
-    const orders = await response.json()
+    const page = await response.json()
+
+    nextOrdersUrl = page.next
+    document.getElementById('load-more-orders').hidden = !nextOrdersUrl
 
     const tbody = document.getElementById('order-table-body')
-    tbody.innerHTML = ''
-
-    orders.forEach(order => {
-        const row = document.createElement('tr')
-        row.innerHTML = `
-            <td>${order.id}</td>
-            <td>${order.table.number}</td>
-            <td>${order.items.map(item => `${item.dish.name} (${item.quantity})`).join(', ')}</td>
-            <td>${order.total_price}</td>
-            <td><button onclick="deleteOrder(${order.id})">Удалить</button></td>
-            <td>
-                <select onchange="updateOrderStatus(${order.id}, this)">
-                    <option value="pending" ${order.status === 'pending' ? 'selected' : ''}>В ожидании</option>
-                    <option value="ready" ${order.status === 'ready' ? 'selected' : ''}>Готово</option>
-                    <option value="paid" ${order.status === 'paid' ? 'selected' : ''}>Оплачено</option>
-                </select>
-            </td>
-        `
-        tbody.appendChild(row)
-    })
+    page.results.forEach(order => tbody.appendChild(renderOrderRow(fromApiOrder(order))))
+}
+
+/**
+ * Приводит заказ из API к компактному виду, в котором заказы приходят в событиях.
+ *
+ * @param {Object} order Заказ из ответа API.
+ * @returns {Object} Заказ: id, номер стола, статус, общая стоимость и позиции [блюдо, количество].
+ */
+function fromApiOrder(order) {
+    return {
+        id: order.id,
+        table: order.table.number,
+        status: order.status,
+        total_price: order.total_price,
+        items: order.items.map(item => [item.dish.name, item.quantity]),
+    }
+}
+
+/**
+ * Создает строку таблицы заказов.
+ *
+ * @param {Object} order Заказ в компактном виде (см. `fromApiOrder`).
+ * @returns {HTMLTableRowElement} Строка таблицы.
+ */
+function renderOrderRow(order) {
+    const row = document.createElement('tr')
+    row.dataset.orderId = order.id
+    row.innerHTML = `
+        <td>${order.id}</td>
+        <td>${order.table}</td>
+        <td>${order.items.map(([name, quantity]) => `${name} (${quantity})`).join(', ')}</td>
+        <td>${order.total_price}</td>
+        <td><button onclick="deleteOrder(${order.id})">Удалить</button></td>
+        <td>
+            <select onchange="updateOrderStatus(${order.id}, this)">
+                <option value="pending" ${order.status === 'pending' ? 'selected' : ''}>В ожидании</option>
+                <option value="ready" ${order.status === 'ready' ? 'selected' : ''}>Готово</option>
+                <option value="paid" ${order.status === 'paid' ? 'selected' : ''}>Оплачено</option>
+            </select>
+        </td>
+    `
+    return row
+}
+
+/**
+ * Проверяет, подходит ли заказ под фильтры текущего списка.
+ *
+ * @param {Object} order Заказ в компактном виде.
+ * @returns {boolean}
+ */
+function matchesOrderFilters(order) {
+    return (!orderFilters.table || String(order.table) === orderFilters.table)
+        && (!orderFilters.status || order.status === orderFilters.status)
+        && (!orderFilters.id || String(order.id) === orderFilters.id)
+}
+
+/**
+ * Находит строку заказа в таблице.
+ *
+ * @param {number} orderId Идентификатор заказа.
+ * @returns {HTMLTableRowElement|null}
+ */
+function findOrderRow(orderId) {
+    return document.querySelector(`#order-table-body tr[data-order-id="${orderId}"]`)
+}
+
+/**
+ * Применяет событие заказа к таблице: добавляет, заменяет или удаляет строку, меняет статус.
+ * Новые заказы добавляются в начало списка, так как список отсортирован от новых к старым.
+ *
+ * @param {Object} event Событие: `type` и `order` (created, updated) или `id` (status, deleted).
+ */
+function applyOrderEvent(event) {
+    const tbody = document.getElementById('order-table-body')
+    if (event.type === 'created' || event.type === 'updated') {
+        const row = findOrderRow(event.order.id)
+        if (!matchesOrderFilters(event.order)) {
+            if (row) row.remove()
+        } else if (row) {
+            row.replaceWith(renderOrderRow(event.order))
+        } else if (event.type === 'created') {
+            tbody.prepend(renderOrderRow(event.order))
+        }
+    } else if (event.type === 'status') {
+        const row = findOrderRow(event.id)
+        if (row && orderFilters.status && orderFilters.status !== event.status) {
+            row.remove()
+        } else if (row) {
+            row.querySelector('select').value = event.status
+        }
+        loadShiftRevenue()
+    } else if (event.type === 'deleted') {
+        const row = findOrderRow(event.id)
+        if (row) row.remove()
+        loadShiftRevenue()
+    }
+}
+
+/**
+ * Подписывается на поток событий заказов. При переподключении список перечитывается,
+ * так как события, произошедшие без соединения, не доставляются повторно.
+ */
+function subscribeToOrderEvents() {
+    const source = new EventSource(orderEventsUrl)
+    let connected = false
+    source.onopen = function () {
+        if (connected) getOrders()
+        connected = liveUpdates = true
+    }
+    source.onerror = function () {
+        liveUpdates = false
+    }
+    source.onmessage = function (message) {
+        applyOrderEvent(JSON.parse(message.data))
+    }
 }
 
 /**
@@ -191,7 +317,7 @@ async function deleteOrder(orderId) {
 
         if (response.status === 204) {
             alert('Заказ удален')
-            getOrders()
+            if (!liveUpdates) getOrders()
         } else {
             alert('Ошибка при удалении заказа')
         }
@@ -218,8 +344,10 @@ async function updateOrderStatus(orderId, selectElement) {
 
     if (response.ok) {
         alert('Статус обновлен')
-        getOrders()
-        loadShiftRevenue()
+        if (!liveUpdates) {
+            getOrders()
+            loadShiftRevenue()
+        }
     } else {
         alert('Ошибка при обновлении статуса')
     }
@@ -245,9 +373,12 @@ async function loadShiftRevenue() {
 }
 
 /**
- * Загружает заказы при загрузке страницы.
+ * Загружает заказы при загрузке страницы и подписывается на их изменения.
  */
-window.onload = getOrders
+window.onload = function () {
+    getOrders()
+    subscribeToOrderEvents()
+}
 
 /**
  * Обработчик события для отправки формы поиска заказов.
@@ -257,3 +388,8 @@ document.getElementById('search-form').addEventListener('submit', function (e) {
     e.preventDefault()
     getOrders()
 })
+
+/**
+ * Обработчик события для подгрузки следующей страницы заказов.
+ */
+document.getElementById('load-more-orders').addEventListener('click', loadMoreOrders)